@@ -2,6 +2,7 @@ import numpy as np
 import pandas as pd
 from utils import format_operator_display_plain, get_performance_category
 from collections import Counter
+from memory_report import recorded_frames
 
 def calculate_concentration_metrics(operator_validators):
     """Calculate concentration metrics including Gini coefficient"""
@@ -37,6 +38,7 @@ def calculate_concentration_metrics(operator_validators):
         'total_validators': total_validators
     }
 
+@recorded_frames
 def create_performance_analysis(operator_performance, operator_validators, ens_names):
     """Create performance analysis data and charts"""
     if not operator_performance:
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Standalone HTTP server for the dashboard's JSON API.
+
+Serves the same responses as the Streamlit ?api=1 mode (api_handler.get_api_response)
+as plain HTTP with real JSON bodies, so scrapers do not need a browser session and
+no Streamlit script run is paid per request. Data comes from the same shared
+data_store snapshots the dashboard uses.
+
+    python api_server.py [--host 0.0.0.0] [--port 8502]
+
+    GET /api/performance?period=7d        (or /api?endpoint=performance&period=7d)
+    GET /api/performance?period=31d&action=download
+    GET /health
+    GET /metrics                          (Prometheus text format)
+"""
+import argparse
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+from api_handler import API_ENDPOINTS, get_api_response
+from config import (API_SERVER_HOST, API_SERVER_PORT, API_RESPONSE_CACHE_SECONDS, API_RESPONSE_CACHE_SIZE,
+                    DATA_BACKGROUND_RELOAD)
+from data_reloader import start_background_reloader
+from data_store import data_store
+from memory_manager import TIER_DERIVED, memory_manager
+from memory_report import register_cache
+from metrics import API_REQUEST_SECONDS, CONTENT_TYPE as METRICS_CONTENT_TYPE, record_cache, registry
+from performance_engine import ATTESTATION_PERIODS
+
+
+class ResponseCache:
+    """Successful JSON bodies keyed by (endpoint, period), reused until the data changes or they age out.
+
+    Keys must already be validated; error responses are never stored.
+    """
+
+    def __init__(self, max_age=API_RESPONSE_CACHE_SECONDS, max_entries=API_RESPONSE_CACHE_SIZE):
+        self.max_age = max_age
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, build):
+        generation = data_store.generation()
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == generation and now - entry[1] < self.max_age:
+                self._entries.move_to_end(key)
+                record_cache('api_response', True)
+                return entry[2]
+
+        record_cache('api_response', False)
+
+        status, body = build()
+        etag = '"' + hashlib.blake2b(body, digest_size=8).hexdigest() + '"'
+        if status == HTTPStatus.OK:
+            with self._lock:
+                self._entries[key] = (generation, now, (status, body, etag))
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return status, body, etag
+
+    def entries(self):
+        with self._lock:
+            return list(self._entries.values())
+
+    def clear(self):
+        with self._lock:
+            self._entries = OrderedDict()
+
+
+def _error_status(endpoint, period):
+    if endpoint not in API_ENDPOINTS:
+        return HTTPStatus.NOT_FOUND
+    if period not in ATTESTATION_PERIODS:
+        return HTTPStatus.BAD_REQUEST
+    # Valid request but the data is not available
+    return HTTPStatus.SERVICE_UNAVAILABLE
+
+
+def build_api_body(endpoint, period, format_type):
+    """(HTTP status, encoded JSON body) for one API request"""
+    try:
+        response_data = get_api_response(endpoint, period, format_type)
+        status = _error_status(endpoint, period) if 'error' in response_data else HTTPStatus.OK
+    except Exception as e:
+        print(f"API request for {endpoint} failed: {e}")
+        response_data = {
+            "error": "API request failed",
+            "message": str(e),
+            "timestamp": datetime.now().isoformat()
+        }
+        status = HTTPStatus.INTERNAL_SERVER_ERROR
+    return status, json.dumps(response_data).encode('utf-8')
+
+
+class APIRequestHandler(BaseHTTPRequestHandler):
+    """Routes GET requests to get_api_response"""
+    server_version = "NodeSetAPI/1.0"
+    protocol_version = "HTTP/1.1"
+    response_cache = ResponseCache()
+
+    def do_GET(self):
+        started = time.perf_counter()
+        self._endpoint = 'unknown'
+        self._status = HTTPStatus.INTERNAL_SERVER_ERROR
+        try:
+            memory_manager.check()
+            self._handle_get()
+        finally:
+            API_REQUEST_SECONDS.observe(time.perf_counter() - started,
+                                        endpoint=self._endpoint, status=int(self._status))
+
+    def _handle_get(self):
+        url = urlsplit(self.path)
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        path = url.path.rstrip('/')
+
+        if path == '/metrics':
+            self._endpoint = 'metrics'
+            self._send(HTTPStatus.OK, registry.render().encode('utf-8'),
+                       {'Content-Type': METRICS_CONTENT_TYPE})
+            return
+
+        if path == '/health':
+            self._endpoint = 'health'
+            body = json.dumps({
+                "status": "ok",
+                "datasets": {name: snapshot.generation for name, snapshot in data_store.snapshots().items()}
+            }).encode('utf-8')
+            self._send(HTTPStatus.OK, body)
+            return
+
+        if path == '/api':
+            endpoint = params.get('endpoint', 'performance')
+        elif path.startswith('/api/'):
+            endpoint = path[len('/api/'):]
+        else:
+            self._send(HTTPStatus.NOT_FOUND, json.dumps({"error": "Not found. Use /api/<endpoint>"}).encode('utf-8'))
+            return
+
+        # Only known endpoints get their own label, so the metric stays bounded
+        if endpoint in API_ENDPOINTS:
+            self._endpoint = endpoint
+        period = params.get('period', '7d')
+        format_type = params.get('format', 'json')
+        if endpoint in API_ENDPOINTS and period in ATTESTATION_PERIODS:
+            # format does not change the body, so it is not part of the key
+            status, body, etag = self.response_cache.get(
+                (endpoint, period), lambda: build_api_body(endpoint, period, format_type))
+        else:
+            # Invalid requests are answered without touching the cache
+            status, body = build_api_body(endpoint, period, format_type)
+            etag = None
+
+        headers = {}
+        if etag is not None:
+            headers = {'ETag': etag, 'Cache-Control': f'public, max-age={API_RESPONSE_CACHE_SECONDS}'}
+        if params.get('action') == 'download':
+            filename = f"nodeset_{endpoint}_{period}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+            headers['Content-Disposition'] = f'attachment; filename="{filename}"'
+
+        if status == HTTPStatus.OK and self.headers.get('If-None-Match') == etag:
+            self._send(HTTPStatus.NOT_MODIFIED, b'', headers)
+            return
+        self._send(status, body, headers)
+
+    def do_HEAD(self):
+        self.do_GET()
+
+    def _send(self, status, body, headers=None):
+        self._status = status
+        headers = dict(headers or {})
+        self.send_response(status)
+        self.send_header('Content-Type', headers.pop('Content-Type', 'application/json; charset=utf-8'))
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        if self.command != 'HEAD' and status != HTTPStatus.NOT_MODIFIED:
+            self.wfile.write(body)
+
+    def log_request(self, code='-', size='-'):
+        # Scrapers poll constantly; only log failed requests
+        if isinstance(code, int) and code >= 400:
+            super().log_request(code, size)
+
+
+def create_server(host=API_SERVER_HOST, port=API_SERVER_PORT):
+    """Load the data and return a ready-to-serve threaded HTTP server"""
+    # Parse everything up front so the first request does not pay for it
+    if DATA_BACKGROUND_RELOAD:
+        start_background_reloader(wait=True)
+    else:
+        data_store.prefetch()
+
+    register_cache('api_response', APIRequestHandler.response_cache.entries)
+    memory_manager.register('api_response', APIRequestHandler.response_cache.clear, TIER_DERIVED)
+    server = ThreadingHTTPServer((host, port), APIRequestHandler)
+    server.daemon_threads = True
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="NodeSet dashboard JSON API server")
+    parser.add_argument('--host', default=API_SERVER_HOST)
+    parser.add_argument('--port', type=int, default=API_SERVER_PORT)
+    args = parser.parse_args()
+
+    server = create_server(args.host, args.port)
+    print(f"🚀 API server listening on http://{args.host}:{args.port}/api/performance")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Scaling benchmark for the data loaders, analysis functions and table builders.
+
+Generates synthetic data (see synthetic_data.py) at each requested scale, runs
+every case against it from a cold cache and reports the best and median wall
+time. With two or more scales each case also gets a scaling exponent against
+the validator count: ~1 is linear, anything well above it flags code that
+will not keep up as the network grows.
+
+    python benchmark.py --scales 1k,10k
+    python benchmark.py --scales 1k,10k,100k --repeat 3 --json benchmark.json
+    python benchmark.py --data-dir /path/to/real/data
+"""
+import argparse
+import json
+import math
+import os
+import statistics
+import tempfile
+import time
+from collections import Counter
+import analysis
+import tables
+from api_handler import calculate_performance_data
+from data_loader import (load_exit_data, load_mev_analysis_data, load_missed_proposals_data, load_proposals_data,
+                         load_sync_committee_data, load_validator_data, load_validator_performance_data)
+from data_store import data_store
+from memory_manager import memory_manager
+from performance_engine import get_attestation_performance
+from synthetic_data import SCALES, generate
+
+# Exponent above which a case is reported as super-linear
+SUPERLINEAR_EXPONENT = 1.3
+
+LOADERS = {
+    'validator_data': load_validator_data,
+    'proposals': load_proposals_data,
+    'missed_proposals': load_missed_proposals_data,
+    'mev_analysis': load_mev_analysis_data,
+    'sync_committee': load_sync_committee_data,
+    'exit_data': load_exit_data,
+    'validator_performance': load_validator_performance_data,
+}
+
+
+def _load_inputs():
+    """Everything the dashboard passes to the analysis and table functions"""
+    cache, _ = load_validator_data()
+    proposals, _ = load_proposals_data()
+    missed, _ = load_missed_proposals_data()
+    mev, _ = load_mev_analysis_data()
+    sync, _ = load_sync_committee_data()
+    exit_data, _ = load_exit_data()
+    operator_validators = cache.get('operator_validators', {})
+    operator_exited = cache.get('exited_validators', {})
+    operator_transactions = cache.get('operator_transactions', {})
+    proposal_counts = Counter(proposal.get('operator') for proposal in (proposals or {}).get('proposals', []))
+    return {
+        'cache': cache,
+        'proposals': proposals,
+        'missed': missed,
+        'mev': mev,
+        'sync': sync,
+        'exit_data': exit_data or {},
+        'operator_validators': operator_validators,
+        'operator_exited': operator_exited,
+        'operator_performance': cache.get('operator_performance', {}),
+        'ens_names': cache.get('ens_names', {}),
+        'active_validators': {operator: count - operator_exited.get(operator, 0)
+                              for operator, count in operator_validators.items()},
+        # Per-operator views are timed for the busiest operator, their worst case
+        'top_proposer': proposal_counts.most_common(1)[0][0] if proposal_counts else None,
+        'top_transactions': max(operator_transactions.values(), key=len, default=[]),
+    }
+
+
+def _cases(inputs):
+    """(group, name, function) for every benchmarked call"""
+    i = inputs
+    ens = i['ens_names']
+    return [
+        ('analysis', 'calculate_concentration_metrics',
+         lambda: analysis.calculate_concentration_metrics(i['active_validators'])),
+        ('analysis', 'create_performance_analysis',
+         lambda: analysis.create_performance_analysis(i['operator_performance'], i['operator_validators'], ens)),
+        ('analysis', 'analyze_gas_limits_by_operator',
+         lambda: analysis.analyze_gas_limits_by_operator(i['mev'], ens)),
+        ('analysis', 'analyze_client_diversity',
+         lambda: analysis.analyze_client_diversity(i['proposals'], i['cache'], ens)),
+        ('analysis', 'analyze_missed_proposals_stats',
+         lambda: analysis.analyze_missed_proposals_stats(i['missed'], i['proposals'])),
+        ('tables', 'create_top_operators_table',
+         lambda: tables.create_top_operators_table(i['operator_validators'], i['operator_exited'], ens)),
+        ('tables', 'create_performance_table',
+         lambda: tables.create_performance_table(i['operator_performance'], i['operator_validators'],
+                                                 i['operator_exited'], ens)),
+        ('tables', 'create_attestation_performance_table',
+         lambda: tables.create_attestation_performance_table(get_attestation_performance('7d'), ens)),
+        ('tables', 'create_largest_proposals_table',
+         lambda: tables.create_largest_proposals_table(i['proposals'], ens)),
+        ('tables', 'create_latest_proposals_table',
+         lambda: tables.create_latest_proposals_table(i['proposals'], ens)),
+        ('tables', 'create_mev_relay_breakdown_table',
+         lambda: tables.create_mev_relay_breakdown_table(i['proposals'])),
+        ('tables', 'create_missed_proposals_table',
+         lambda: tables.create_missed_proposals_table(i['missed'], i['cache'], i['proposals'], ens)),
+        ('tables', 'get_operator_proposal_history',
+         lambda: tables.get_operator_proposal_history(i['proposals'], i['top_proposer'])),
+        ('tables', 'create_operator_proposals_export',
+         lambda: tables.create_operator_proposals_export(i['proposals'], i['top_proposer'])),
+        ('tables', 'create_exits_table',
+         lambda: tables.create_exits_table(i['exit_data'].get('operators_with_exits', []), ens)),
+        ('tables', 'create_basic_exits_table',
+         lambda: tables.create_basic_exits_table(i['operator_validators'], i['operator_exited'], ens)),
+        ('tables', 'create_operator_transactions_table',
+         lambda: tables.create_operator_transactions_table(i['top_transactions'])),
+        ('tables', 'create_proposals_operators_table',
+         lambda: tables.create_proposals_operators_table(i['proposals'], ens)),
+        ('tables', 'create_sync_committee_operators_table',
+         lambda: tables.create_sync_committee_operators_table(i['sync'], ens)),
+        ('tables', 'create_sync_committee_periods_table',
+         lambda: tables.create_sync_committee_periods_table(i['sync'])),
+        ('tables', 'create_sync_committee_detailed_table',
+         lambda: tables.create_sync_committee_detailed_table(i['sync'], ens)),
+        ('api', 'calculate_performance_data(7d)', lambda: calculate_performance_data('7d')),
+        ('api', 'calculate_performance_data(31d)', lambda: calculate_performance_data('31d')),
+    ]
+
+
+def _time(function, repeat, before=None):
+    timings = []
+    for _ in range(repeat):
+        if before is not None:
+            before()
+        started = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started)
+    return {'min': min(timings), 'median': statistics.median(timings), 'runs': repeat}
+
+
+def run_scale(data_dir, repeat):
+    """Time every case against the data files in data_dir; returns {case: timings}"""
+    previous_dir = os.getcwd()
+    os.chdir(data_dir)
+    try:
+        data_store.clear()
+        memory_manager.clear()
+        results = {}
+        for name, loader in LOADERS.items():
+            results[f"loader/{name}"] = _time(loader, repeat, before=lambda dataset=name: data_store.clear(dataset))
+
+        inputs = _load_inputs()
+        for group, name, function in _cases(inputs):
+            # Derived caches (attestation performance, duty index, columnar views) start cold every run
+            results[f"{group}/{name}"] = _time(function, repeat, before=memory_manager.clear)
+        return results
+    finally:
+        data_store.clear()
+        memory_manager.clear()
+        os.chdir(previous_dir)
+
+
+def scaling_exponents(results, sizes):
+    """Fitted exponent of median time against validator count for each case (least squares on log-log)"""
+    exponents = {}
+    scales = [scale for scale in results if sizes[scale] > 0]
+    if len(scales) < 2:
+        return exponents
+    for case in results[scales[0]]:
+        points = [(math.log(sizes[scale]), math.log(max(results[scale][case]['median'], 1e-6))) for scale in scales]
+        mean_x = statistics.fmean(x for x, _ in points)
+        mean_y = statistics.fmean(y for _, y in points)
+        variance = sum((x - mean_x) ** 2 for x, _ in points)
+        if variance:
+            exponents[case] = sum((x - mean_x) * (y - mean_y) for x, y in points) / variance
+    return exponents
+
+
+def print_report(results, exponents):
+    scales = list(results)
+    header = f"{'case':58}" + ''.join(f"{scale + ' ms':>12}" for scale in scales)
+    if exponents:
+        header += f"{'exponent':>10}"
+    print(header)
+    print('-' * len(header))
+    for case in results[scales[0]]:
+        line = f"{case:58}" + ''.join(f"{results[scale][case]['median'] * 1000:12.1f}" for scale in scales)
+        if case in exponents:
+            exponent = exponents[case]
+            line += f"{exponent:10.2f}" + ('  super-linear' if exponent > SUPERLINEAR_EXPONENT else '')
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark loaders, analysis and tables at several data scales")
+    parser.add_argument('--scales', default='1k,10k', help=f"comma-separated, from {', '.join(SCALES)} (default: 1k,10k)")
+    parser.add_argument('--data-dir', help="benchmark existing data files instead of generating")
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--json', help="also write the results to this file")
+    args = parser.parse_args()
+
+    results = {}
+    sizes = {}
+    if args.data_dir:
+        label = os.path.basename(os.path.abspath(args.data_dir))
+        results[label] = run_scale(os.path.abspath(args.data_dir), args.repeat)
+        sizes[label] = 0
+    else:
+        with tempfile.TemporaryDirectory(prefix='nodeset-benchmark-') as root:
+            for scale in args.scales.split(','):
+                data_dir = os.path.join(root, scale)
+                generate(data_dir, seed=args.seed, **SCALES[scale])
+                print(f"Benchmarking {scale} ({SCALES[scale]['validators']} validators)...")
+                results[scale] = run_scale(data_dir, args.repeat)
+                sizes[scale] = SCALES[scale]['validators']
+
+    exponents = scaling_exponents(results, sizes)
+    print_report(results, exponents)
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({'results': results, 'validators': sizes, 'exponents': exponents}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
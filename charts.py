@@ -2,6 +2,7 @@ import plotly.express as px
 import plotly.graph_objects as go
 import numpy as np
 from utils import format_operator_display_plain, get_performance_category
+from figure_cache import cached_figures
 
 def make_chart_responsive(fig):
     """Apply responsive settings to any plotly figure for better 125% zoom support"""
@@ -21,6 +22,7 @@ def get_chart_config():
     }
 
 
+@cached_figures
 def create_performance_charts(operator_performance, operator_validators, ens_names):
     """Create performance scatter and histogram charts"""
     if not operator_performance:
@@ -95,6 +97,7 @@ def create_performance_charts(operator_performance, operator_validators, ens_nam
 
     return fig_scatter, fig_hist
 
+@cached_figures
 def create_concentration_pie(operator_validators, ens_names, title="Validator Distribution"):
     """Create pie chart showing validator distribution"""
     if not operator_validators:
@@ -147,6 +150,7 @@ def create_concentration_pie(operator_validators, ens_names, title="Validator Di
 
     return fig
 
+@cached_figures
 def create_distribution_histogram(operator_validators):
     """Create histogram of validator distribution"""
     if not operator_validators:
@@ -186,6 +190,7 @@ def create_distribution_histogram(operator_validators):
 
     return fig
 
+@cached_figures
 def create_concentration_curve(operator_validators):
     """Create Lorenz curve for concentration analysis"""
     if not operator_validators:
@@ -240,6 +245,7 @@ def create_concentration_curve(operator_validators):
 
     return fig
 
+@cached_figures
 def create_gas_limit_distribution_chart(mev_data):
     """Create gas limit distribution chart"""
     if not mev_data:
@@ -301,6 +307,7 @@ def create_gas_limit_distribution_chart(mev_data):
     
     return fig
 
+@cached_figures
 def create_operator_gas_strategy_chart(gas_data):
     """Create operator gas strategy comparison"""
     if not gas_data:
@@ -353,6 +360,7 @@ def create_operator_gas_strategy_chart(gas_data):
     
     return fig
 
+@cached_figures
 def create_client_diversity_pie_charts(client_data):
     """Create 3 pie charts for execution, consensus, and setup type"""
     if not client_data:
@@ -510,6 +518,7 @@ def create_client_diversity_pie_charts(client_data):
     
     return fig_execution, fig_consensus, fig_setup
 
+@cached_figures
 def create_client_combination_bar_chart(client_data):
     """Create bar chart of execution+consensus combinations"""
     if not client_data:
@@ -1,8 +1,10 @@
 import streamlit as st
 import numpy as np
+import math
 import os
 from datetime import datetime
 from utils import get_performance_category
+from data_store import data_store
 
 def responsive_columns(column_spec):
     """Create responsive columns that work better at 125% zoom
@@ -455,6 +457,32 @@ def display_network_overview(cache, operator_validators, operator_exited):
 
     return total_activated, total_queued, active_validators
 
+def paginate(items, key, page_size):
+    """Page selector for a long list; returns (items on the selected page, offset of the first one)"""
+    pages = max(1, math.ceil(len(items) / page_size))
+    if pages == 1:
+        return items, 0
+    
+    # Keep the stored page valid when a search shrinks the list
+    if st.session_state.get(key, 1) > pages:
+        st.session_state[key] = pages
+    
+    page_col1, page_col2 = st.columns([1, 3])
+    with page_col1:
+        page = st.number_input("Page", min_value=1, max_value=pages, step=1, key=key)
+    offset = (page - 1) * page_size
+    with page_col2:
+        st.caption(f"Page {page} of {pages} • showing {offset + 1}–{min(offset + page_size, len(items))} of {len(items)}")
+    return items[offset:offset + page_size], offset
+
+def lazy_expander(label, key):
+    """Expander that reruns when toggled, so its content can be skipped while `.open` is False"""
+    try:
+        return st.expander(label, expanded=False, key=key, on_change="rerun")
+    except TypeError:
+        # Older Streamlit releases without stateful expanders - content is always built
+        return st.expander(label, expanded=False)
+
 def display_cache_info(cache_file, last_block, ens_last_updated):
     """Display cache information"""
     last_update = datetime.fromtimestamp(os.path.getmtime(cache_file))
@@ -478,7 +506,8 @@ def show_refresh_button():
             except Exception:
                 pass  # Continue if tracking fails
             
-            st.cache_data.clear()
+            # Re-parse only the data files that changed on disk
+            data_store.refresh()
             st.rerun()
 
 def display_health_summary(cache, operator_validators, operator_exited, operator_performance, 
@@ -622,3 +651,39 @@ def display_health_summary(cache, operator_validators, operator_exited, operator
                 st.write(f"• Activation Rate: {activation_rate:.1f}%")
                 st.write(f"• Activated Count: {total_activated:,}")
                 st.write(f"• Queue Count: {total_queued:,}")
+
+def display_profile_report(profiler):
+    """Show the ?profile=1 results: top functions by cumulative time and profile downloads"""
+    import pandas as pd
+
+    st.markdown("---")
+    st.markdown("## 🔬 Rerun Profile")
+    st.caption(f"Rerun took {profiler.wall_seconds:.2f}s under the profiler • "
+               f"{profiler.sample_count} stack samples • times include profiling overhead")
+    if not profiler.cprofile_active:
+        st.info("Another profiled rerun was using cProfile, so this one has stack samples only")
+
+    top_functions = pd.DataFrame(profiler.top_functions())
+    if not top_functions.empty:
+        top_functions = top_functions.rename(columns={
+            'function': 'Function', 'location': 'Location', 'calls': 'Calls',
+            'own_seconds': 'Own (s)', 'cumulative_seconds': 'Cumulative (s)'
+        })
+        top_functions['Calls'] = top_functions['Calls'].astype(str)
+        st.dataframe(top_functions, use_container_width=True, hide_index=True)
+
+    stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.download_button("🔥 Folded stacks (flamegraph)", data=profiler.folded_stacks(),
+                           file_name=f"nodeset_rerun_{stamp}.folded", mime="text/plain",
+                           help="For flamegraph.pl, inferno or speedscope", use_container_width=True)
+    if not profiler.cprofile_active:
+        return
+    with col2:
+        st.download_button("📄 pstats report", data=profiler.pstats_text(),
+                           file_name=f"nodeset_rerun_{stamp}.txt", mime="text/plain", use_container_width=True)
+    with col3:
+        st.download_button("📦 Raw profile (.prof)", data=profiler.pstats_dump(),
+                           file_name=f"nodeset_rerun_{stamp}.prof", mime="application/octet-stream",
+                           help="Open with snakeviz or pstats.Stats(path)", use_container_width=True)
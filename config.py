@@ -1,3 +1,5 @@
+import os
+import tempfile
 import streamlit as st
 
 # Dashboard configuration
@@ -1634,6 +1636,116 @@ MEV_FILES = [
     '../mev_analysis_results.json'
 ]
 
+MISSED_PROPOSALS_FILES = [
+    './missed_proposals_cache.json',
+    './data/missed_proposals_cache.json'
+]
+
+SYNC_COMMITTEE_FILES = [
+    './sync_committee_participation.json',
+    './data/sync_committee_participation.json'
+]
+
+EXIT_DATA_FILES = [
+    './dashboard_exit_data.json',
+    './data/dashboard_exit_data.json'
+]
+
+ENS_NAMES_FILES = [
+    './manual_ens_names.json',
+    './data/manual_ens_names.json'
+]
+
+# Datasets served by data_store - candidate file paths, first existing file wins.
+# A dataset is re-parsed only when its file's mtime/size (and content hash) change.
+# Non-resident datasets only track their file; readers parse it themselves
+# (the validator performance cache is read through performance_store's columns).
+DATASETS = {
+    'validator_data': {'files': CACHE_FILES},
+    'proposals': {'files': PROPOSALS_FILES},
+    'missed_proposals': {'files': MISSED_PROPOSALS_FILES},
+    'mev_analysis': {'files': MEV_FILES},
+    'sync_committee': {'files': SYNC_COMMITTEE_FILES},
+    'exit_data': {'files': EXIT_DATA_FILES},
+    'validator_performance': {'files': PERFORMANCE_CACHE_FILES, 'resident': False},
+    'ens_names': {'files': ENS_NAMES_FILES},
+}
+
+# Minimum seconds between file stat checks for the same dataset
+DATA_FRESHNESS_CHECK_INTERVAL = 5
+
+# Hash file contents when mtime/size change, so rewrites with identical content skip re-parsing
+DATA_CONTENT_HASH = True
+
+# Background reloader - re-parses changed data files off the request path
+DATA_BACKGROUND_RELOAD = True
+DATA_RELOAD_POLL_INTERVAL = 30  # seconds between polls when file-system events are unavailable
+DATA_RELOAD_SETTLE_DELAY = 1.0  # seconds to wait after a file event so the writer can finish
+
+# Startup prefetch - every dataset is parsed in parallel threads when the reloader starts
+DATA_PREFETCH_WORKERS = None  # defaults to one worker per dataset
+
+# Columnar copy of the validator performance cache (one memory-mapped .npy file per column)
+PERFORMANCE_COLUMNAR_DIR = os.environ.get(
+    'PERFORMANCE_COLUMNAR_DIR', os.path.join(tempfile.gettempdir(), 'nodeset-dashboard', 'validator_performance'))
+PERFORMANCE_STORE_RETENTION = 24 * 3600  # superseded stores are deleted after this long unopened (seconds)
+
+# Attestation-only rankings are memoized per data generation and re-derived at least this often (seconds)
+PERFORMANCE_ENGINE_TIME_BUCKET = 300
+
+# Standalone JSON API server (api_server.py)
+API_SERVER_HOST = os.environ.get('API_SERVER_HOST', '0.0.0.0')
+API_SERVER_PORT = int(os.environ.get('API_SERVER_PORT', 8502))
+API_RESPONSE_CACHE_SECONDS = 5  # encoded responses are reused this long unless the data changes
+API_RESPONSE_CACHE_SIZE = 16  # (endpoint, period) responses kept
+
+# Usage tracking - events are appended to a JSONL log and folded into usage_stats.json
+USAGE_STATS_FILE = os.environ.get('USAGE_STATS_FILE', 'usage_stats.json')
+USAGE_COMPACT_INTERVAL = 300  # seconds between compactions
+USAGE_COMPACT_MAX_EVENTS = 1000  # compact early once this many events are in the log
+USAGE_ACTIVE_WINDOW = 1800  # seconds since last activity for a session to count as active
+USAGE_SESSION_RETENTION_DAYS = 30  # sessions inactive this long are dropped
+USAGE_MAX_SESSIONS = 100000  # oldest sessions are dropped beyond this many
+USAGE_HLL_PRECISION = 12  # 4096 registers per unique-session sketch, ~1.6% error
+USAGE_SKETCH_DAILY_DAYS = 90  # daily unique-session sketches kept this many days
+USAGE_TOP_USER_AGENTS = 50  # user agents tracked by the top-k summary
+
+# Prometheus metrics - served at /metrics by api_server.py; the dashboard process
+# writes them to this file for node_exporter's textfile collector when it is set
+METRICS_TEXTFILE_PATH = os.environ.get('METRICS_TEXTFILE_PATH')
+METRICS_TEXTFILE_INTERVAL = 15  # seconds between textfile writes
+
+# Memory pressure - RSS is sampled at most this often; above the should_clear_cache()
+# mark derived caches, then indexes, then idle datasets are evicted until
+# is_memory_high() clears (counting the estimated size of what was evicted) or
+# nothing is left. Datasets are only evicted once no rerun has read them for
+# MEMORY_DATASET_IDLE_SECONDS, and a relief pass is followed by a cooldown
+MEMORY_CHECK_INTERVAL = 10  # seconds
+MEMORY_RELIEF_COOLDOWN = 300  # seconds after a relief pass before the next one
+MEMORY_DATASET_IDLE_SECONDS = 600  # datasets read more recently are never evicted
+MEMORY_EVICTION_LOG_SIZE = 100  # recent evictions kept for the Raw Data tab
+
+# Rerun profiling (?profile=1) - allowed when PROFILING_ENABLED is set, or with
+# &token=<PROFILING_TOKEN> when a token is configured; off by default
+PROFILING_ENABLED = os.environ.get('PROFILING_ENABLED', '').lower() in ('1', 'true', 'yes')
+PROFILING_TOKEN = os.environ.get('PROFILING_TOKEN')
+PROFILING_SAMPLE_INTERVAL = 0.005  # seconds between stack samples for the flamegraph
+PROFILING_TOP_FUNCTIONS = 50  # rows in the cumulative-time table
+
+# Downloads - files are serialized when a download button is clicked and the
+# most recent ones are kept per data generation
+EXPORT_CACHE_SIZE = 32  # serialized files kept
+EXPORT_FORMAT_KEY = "export_format"
+
+# Charts - Plotly figures are kept as JSON per data generation and builder
+# arguments, shared by every session
+FIGURE_CACHE_SIZE = 64  # builder results kept
+
+# Tab rendering - when enabled only the selected dashboard tab is built on each rerun
+LAZY_TABS = True
+ACTIVE_TAB_KEY = "active_tab"
+OPERATOR_PAGE_SIZE = 20  # operator expanders per page in the Proposals tab
+
 # Logo file paths
 DARK_LOGO_PATH = "Nodeset_dark_mode.png"
 LIGHT_LOGO_PATH = "Nodeset_light_mode.png"
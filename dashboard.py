@@ -7,7 +7,7 @@ from datetime import datetime
 from collections import Counter
 
 # Import our modules
-from config import apply_page_config, apply_custom_css
+from config import apply_page_config, apply_custom_css, LAZY_TABS, ACTIVE_TAB_KEY, OPERATOR_PAGE_SIZE, DATA_BACKGROUND_RELOAD
 from data_loader import load_validator_data, load_proposals_data, load_mev_analysis_data, load_sync_committee_data, load_missed_proposals_data, load_exit_data, load_validator_performance_data, display_logo
 from analysis import calculate_concentration_metrics, create_performance_analysis, analyze_gas_limits_by_operator, analyze_client_diversity
 from charts import (create_performance_charts, create_concentration_pie, create_distribution_histogram, 
@@ -16,20 +16,65 @@ from charts import (create_performance_charts, create_concentration_pie, create_
 from tables import (create_top_operators_table, create_performance_table, create_largest_proposals_table,
                    create_latest_proposals_table, create_proposals_operators_table, create_mev_relay_breakdown_table,
                    create_missed_proposals_table, create_sync_committee_operators_table, 
-                   create_sync_committee_periods_table, create_sync_committee_detailed_table)
+                   create_sync_committee_periods_table, create_sync_committee_detailed_table,
+                   create_attestation_performance_table, get_operator_proposal_history,
+                   create_operator_proposals_export, create_exits_table, create_basic_exits_table,
+                   create_operator_transactions_table, number_column, with_placeholder, PROPOSAL_COLUMNS,
+                   EXIT_COLUMNS, THOUSANDS, ETH, ETH_PRECISE, PERCENT_1, PERCENT_2)
 from components import (display_health_status, display_performance_health, display_ens_status,
                        display_network_overview, display_cache_info, show_refresh_button,
-                       responsive_columns, display_health_summary)
+                       responsive_columns, display_health_summary, display_profile_report,
+                       paginate, lazy_expander)
 from utils import format_operator_display_plain, get_performance_category, get_memory_usage
 from api_handler import get_api_response
+from performance_engine import get_attestation_performance
+from data_reloader import data_reloader, start_background_reloader
+from memory_manager import memory_manager
+from memory_report import memory_report, tab_scope
+from operator_search import filter_operators
+from exports import export_button, export_format_selector
+from metrics import TAB_RENDER_SECONDS, start_textfile_writer
+from profiler import RerunProfiler, profiling_allowed
+from data_store import data_store, read_json_file
+from performance_store import PERFORMANCE_COLUMNS
 from usage_tracker import usage_tracker
 from stats_page import show_statistics_page, show_usage_api
 from usage_tracking_js import inject_usage_tracking_js, track_data_loading_operation
 
+# Start parsing the data files as soon as the app is loaded, off the rerun that imported it
+if DATA_BACKGROUND_RELOAD:
+    start_background_reloader()
 
 
 def run_dashboard():
     """Main dashboard function"""
+    # ?profile=1 wraps the whole rerun in the profiler and appends the report
+    try:
+        profile_param = st.query_params.get("profile")
+        profile = (profile_param and str(profile_param).lower() in ["1", "true", "yes"]
+                   and profiling_allowed(st.query_params.get("token")))
+    except Exception:
+        profile = False
+
+    if not profile:
+        render_dashboard()
+        return
+
+    with RerunProfiler() as profiler:
+        render_dashboard()
+    display_profile_report(profiler)
+
+
+def render_dashboard():
+    """Render one rerun: the API or stats response, or the dashboard page"""
+    # Restarts the reloader if it was stopped; a no-op while it is running
+    if DATA_BACKGROUND_RELOAD:
+        start_background_reloader()
+    # Export metrics for the textfile collector when METRICS_TEXTFILE_PATH is set
+    start_textfile_writer()
+    # Evict caches instead of growing until the platform restarts the app
+    memory_manager.check()
+    
     # Check for API requests first - only if explicitly set
     try:
         api_param = st.query_params.get("api")
@@ -169,6 +214,7 @@ def run_dashboard():
 
     # Show refresh button
     show_refresh_button()
+    export_format_selector()
 
     # Load data with tracking
     try:
@@ -243,55 +289,42 @@ def create_dashboard_tabs(cache, operator_validators, operator_exited, operator_
     
     st.markdown("---")
 
-    # Create tabs without server-side tracking
-    tab1, tab2, tab3, tab4, tab5, tab6, tab7, tab8, tab9, tab10, tab11 = st.tabs([
-        "📈 Distribution",
-        "🎯 Concentration", 
-        "🏆 Top Operators",
-        "⚡ Performance",
-        "🤲 Proposals",
-        "📡 Sync Committee",
-        "🚪 Exit Analysis",
-        "💰 Costs",
-        "🔧 Client Diversity",
-        "🔥 Pump the Gas!",
-        "📋 Raw Data"
-    ])
-    
-    # No tab tracking needed - simplified approach
-    
-    with tab1:
-        create_distribution_tab(active_validators)
-    
-    with tab2:
-        create_concentration_tab(active_validators, concentration_metrics)
-    
-    with tab3:
-        create_top_operators_tab(operator_validators, operator_exited, ens_names)
-    
-    with tab4:
-        create_performance_tab(operator_performance, operator_validators, operator_exited, ens_names)
-    
-    with tab5:
-        create_proposals_tab(ens_names)
-    
-    with tab6:
-        create_sync_committee_tab(ens_names)
-    
-    with tab7:
-        create_exit_analysis_tab(operator_validators, operator_exited, ens_names)
-    
-    with tab8:
-        create_costs_tab(cache, operator_validators, operator_exited, ens_names)
-    
-    with tab9:
-        create_client_diversity_tab(ens_names)
-    
-    with tab10:
-        create_gas_analysis_tab(ens_names)
+    # Tab labels paired with the builder that renders their content
+    tab_builders = [
+        ("📈 Distribution", lambda: create_distribution_tab(active_validators)),
+        ("🎯 Concentration", lambda: create_concentration_tab(active_validators, concentration_metrics)),
+        ("🏆 Top Operators", lambda: create_top_operators_tab(operator_validators, operator_exited, ens_names)),
+        ("⚡ Performance", lambda: create_performance_tab(operator_performance, operator_validators, operator_exited, ens_names)),
+        ("🤲 Proposals", lambda: create_proposals_tab(ens_names)),
+        ("📡 Sync Committee", lambda: create_sync_committee_tab(ens_names)),
+        ("🚪 Exit Analysis", lambda: create_exit_analysis_tab(operator_validators, operator_exited, ens_names)),
+        ("💰 Costs", lambda: create_costs_tab(cache, operator_validators, operator_exited, ens_names)),
+        ("🔧 Client Diversity", lambda: create_client_diversity_tab(ens_names)),
+        ("🔥 Pump the Gas!", lambda: create_gas_analysis_tab(ens_names)),
+        ("📋 Raw Data", lambda: create_raw_data_tab(cache, operator_validators, operator_exited, ens_names)),
+    ]
+    tab_labels = [label for label, _ in tab_builders]
+    
+    if LAZY_TABS:
+        try:
+            # Stateful tabs keep the selected label in st.session_state[ACTIVE_TAB_KEY]
+            # and rerun on change, so only the open tab needs to be built
+            tabs = st.tabs(tab_labels, key=ACTIVE_TAB_KEY, on_change="rerun")
+        except TypeError:
+            # Older Streamlit releases without stateful tabs - render every tab
+            tabs = st.tabs(tab_labels)
+    else:
+        tabs = st.tabs(tab_labels)
     
-    with tab11:
-        create_raw_data_tab(cache, operator_validators, operator_exited, ens_names)
+    for (label, build_tab), tab in zip(tab_builders, tabs):
+        with tab:
+            # `open` is False only for inactive tabs in lazy mode
+            if getattr(tab, 'open', None) is False:
+                st.caption("⏳ Select this tab to load its content")
+            else:
+                tab_name = label.split(' ', 1)[-1]
+                with TAB_RENDER_SECONDS.time(tab=tab_name), tab_scope(tab_name):
+                    build_tab()
 
 def create_client_diversity_tab(ens_names):
     """Create the client diversity analysis tab"""
@@ -399,37 +432,36 @@ def create_client_diversity_tab(ens_names):
     st.markdown("---")
     col1, col2 = st.columns([3, 1])
     with col2:
-        # Prepare export data
-        export_data = []
         operator_details = client_diversity_data.get('operator_details', {})
         
-        for operator_addr, data in operator_details.items():
-            ens_name = ens_names.get(operator_addr, "")
-            
-            # Get client names
-            exec_names = {'G': 'Geth', 'N': 'Nethermind', 'B': 'Besu', 'R': 'Reth'}
-            cons_names = {'L': 'Lighthouse', 'S': 'Lodestar', 'N': 'Nimbus', 'P': 'Prysm', 'T': 'Teku'}
-            setup_names = {'L': 'Local', 'X': 'External'}
-            
-            export_data.append({
-                'operator_address': operator_addr,
-                'ens_name': ens_name,
-                'execution_client': exec_names.get(data['execution_client'], data['execution_client']),
-                'consensus_client': cons_names.get(data['consensus_client'], data['consensus_client']),
-                'setup_type': setup_names.get(data['setup_type'], data['setup_type']),
-                'graffiti_text': data['graffiti_text'],
-                'timestamp': data['timestamp']
-            })
+        def build_export():
+            export_data = []
+            for operator_addr, data in operator_details.items():
+                ens_name = ens_names.get(operator_addr, "")
+                
+                # Get client names
+                exec_names = {'G': 'Geth', 'N': 'Nethermind', 'B': 'Besu', 'R': 'Reth'}
+                cons_names = {'L': 'Lighthouse', 'S': 'Lodestar', 'N': 'Nimbus', 'P': 'Prysm', 'T': 'Teku'}
+                setup_names = {'L': 'Local', 'X': 'External'}
+                
+                export_data.append({
+                    'operator_address': operator_addr,
+                    'ens_name': ens_name,
+                    'execution_client': exec_names.get(data['execution_client'], data['execution_client']),
+                    'consensus_client': cons_names.get(data['consensus_client'], data['consensus_client']),
+                    'setup_type': setup_names.get(data['setup_type'], data['setup_type']),
+                    'graffiti_text': data['graffiti_text'],
+                    'timestamp': data['timestamp']
+                })
+            return pd.DataFrame(export_data)
         
-        if export_data:
-            export_df = pd.DataFrame(export_data)
-            export_csv = export_df.to_csv(index=False)
-            
-            st.download_button(
+        # The export is only built when the button is clicked
+        if operator_details:
+            export_button(
                 label="📥 Download Client Diversity Data",
-                data=export_csv,
-                file_name=f"client_diversity_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                mime="text/csv",
+                build=build_export,
+                name="client_diversity",
+                file_name=f"client_diversity_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
                 use_container_width=True
             )
 
@@ -580,26 +612,32 @@ def create_top_operators_tab(operator_validators, operator_exited, ens_names):
     df_operators = create_top_operators_table(operator_validators, operator_exited, ens_names)
     
     if not df_operators.empty:
-        display_df = df_operators.copy()
-        display_df['Active'] = display_df['Active'].astype(str)
-        display_df['Total'] = display_df['Total'].astype(str)
-        display_df['Exited'] = display_df['Exited'].astype(str)
-
-        st.dataframe(display_df, use_container_width=True, hide_index=True)
-        
-        csv = df_operators.to_csv(index=False)
-        st.download_button(
-            label="📥 Download CSV",
-            data=csv,
-            file_name=f"nodeset_operators_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-            mime="text/csv"
+        st.dataframe(
+            df_operators,
+            use_container_width=True,
+            hide_index=True,
+            column_config={
+                "Rank": number_column("Rank"),
+                "Active": number_column("Active"),
+                "Total": number_column("Total"),
+                "Exited": number_column("Exited"),
+                "Exit Rate": number_column("Exit Rate", PERCENT_1),
+                "Market Share": number_column("Market Share", PERCENT_2)
+            }
+        )
+        
+        export_button(
+            label="📥 Download Operators",
+            build=df_operators,
+            name="nodeset_operators",
+            file_name=f"nodeset_operators_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         )
     else:
         st.info("No operator data available.")
 
 def create_performance_tab(operator_performance, operator_validators, operator_exited, ens_names):
     """Create the performance analysis tab"""
-    from datetime import datetime, timedelta, timezone
+    from datetime import datetime
     st.subheader("⚡ Operator Performance Analysis 24 hours / 7 days / 31 days")
     st.info("ℹ️ 24 hour data refreshes every hour. Scroll down for 7 / 31 day data")
 
@@ -631,34 +669,27 @@ def create_performance_tab(operator_performance, operator_validators, operator_e
             )
 
             if not perf_table_df.empty:
-                display_perf_df = perf_table_df.drop(['Performance_Raw'], axis=1).copy()
-                display_perf_df['Active'] = display_perf_df['Active'].astype(str)
-                display_perf_df['Total'] = display_perf_df['Total'].astype(str)
-                display_perf_df['Exited'] = display_perf_df['Exited'].astype(str)
-
                 st.dataframe(
-                    display_perf_df,
+                    perf_table_df,
                     use_container_width=True,
                     hide_index=True,
                     column_config={
                         "Rank": st.column_config.NumberColumn("Rank", width="small"),
                         "Address": st.column_config.TextColumn("Address", width="large"),
                         "ENS / Discord Name": st.column_config.TextColumn("ENS / Discord Name", width="small"),
-                        "Performance": st.column_config.TextColumn("Performance", width="small"),
+                        "Performance": number_column("Performance", PERCENT_2),
                         "Category": st.column_config.TextColumn("Category", width="small"),
-                        "Active": st.column_config.TextColumn("Active", width="small"),
-                        "Total": st.column_config.TextColumn("Total", width="small"),
-                        "Exited": st.column_config.TextColumn("Exited", width="small")
+                        "Active": number_column("Active"),
+                        "Total": number_column("Total"),
+                        "Exited": number_column("Exited")
                     }
                 )
 
-                export_perf_df = perf_table_df.drop(['Performance_Raw'], axis=1)
-                perf_csv = export_perf_df.to_csv(index=False)
-                st.download_button(
+                export_button(
                     label="📥 Download Performance Data",
-                    data=perf_csv,
-                    file_name=f"nodeset_performance_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                    mime="text/csv"
+                    build=perf_table_df,
+                    name="nodeset_performance",
+                    file_name=f"nodeset_performance_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
                 )
         else:
             st.info("Insufficient performance data for analysis.")
@@ -670,167 +701,23 @@ def create_performance_tab(operator_performance, operator_validators, operator_e
     st.subheader("📊 Attestation-Only Performance Analysis")
     st.info("Performance analysis of validators doing ONLY attestations (excluding proposals and sync committee duties)")
     
-    # Load validator performance data from the performance cache file
+    # Rankings come from the shared engine, so the tab and the API always agree
     try:
-        import json
-        import os
-        performance_cache_file = 'validator_performance_cache.json'
-        if os.path.exists(performance_cache_file):
-            with open(performance_cache_file, 'r') as f:
-                performance_cache = json.load(f)
-                
-            performance_data = performance_cache.get('validators', {})
-            if performance_data and len(performance_data) > 0:
-                # Load proposals and sync committee data
-                proposals_data, _ = load_proposals_data()
-                sync_committee_data, _ = load_sync_committee_data()
-                
-                # Calculate current time for filtering
-                current_time = datetime.now(timezone.utc)
-                seven_days_ago = current_time - timedelta(days=7)
-                seven_days_ago_timestamp = seven_days_ago.timestamp()
-                
-                # Use a longer lookback period for proposals (10 days) to ensure we catch 
-                # all proposals that could affect the 7-day performance window
-                ten_days_ago = current_time - timedelta(days=10)
-                ten_days_ago_timestamp = ten_days_ago.timestamp()
-                
-                # Get validators with proposals in the last 10 days (to be conservative)
-                validators_with_proposals = set()
-                if proposals_data and 'proposals' in proposals_data:
-                    for proposal in proposals_data['proposals']:
-                        try:
-                            proposal_timestamp = proposal.get('timestamp', 0)
-                            if proposal_timestamp >= ten_days_ago_timestamp:
-                                validator_index = proposal.get('validator_index')
-                                if validator_index:
-                                    validators_with_proposals.add(validator_index)
-                        except:
-                            continue
-                
-                # Get validators with sync committee duties in the last 10 days (to be conservative)
-                validators_with_sync_duties = set()
-                if sync_committee_data and 'detailed_stats' in sync_committee_data:
-                    # Ethereum beacon chain genesis time: December 1, 2020, 12:00:23 UTC
-                    GENESIS_TIME = 1606824023
-                    
-                    for sync_entry in sync_committee_data['detailed_stats']:
-                        try:
-                            # Check if the sync committee period overlaps with last 10 days
-                            start_slot = sync_entry.get('start_slot', 0)
-                            end_slot = sync_entry.get('end_slot', 0)
-                            
-                            # Proper slot to timestamp conversion using beacon chain genesis
-                            end_timestamp = GENESIS_TIME + (end_slot * 12)
-                            
-                            # If the sync committee period overlaps with the last 10 days
-                            if end_timestamp >= ten_days_ago_timestamp:
-                                validator_index = sync_entry.get('validator_index')
-                                if validator_index:
-                                    validators_with_sync_duties.add(validator_index)
-                        except:
-                            continue
-                
-                # Combine all validators to exclude (proposals + sync committee)
-                validators_to_exclude = validators_with_proposals.union(validators_with_sync_duties)
-                
-                # Process data for operators with validators active > 7 days - 7-day analysis
-                operator_data = {}
-                processed_validators = 0
-                
-                for validator_pubkey, validator_info in performance_data.items():
-                    processed_validators += 1
-                    try:
-                        operator = validator_info.get('operator')
-                        if not operator:
-                            continue
-                            
-                        # Check if validator has been active for more than 7 days
-                        activation_data = validator_info.get('activation_data', {})
-                        activation_timestamp = activation_data.get('activation_timestamp', 0)
-                        if activation_timestamp == 0 or activation_timestamp > seven_days_ago_timestamp:
-                            continue
-                        
-                        # Skip exited validators
-                        if activation_data.get('status') == 'exited':
-                            continue
-                        
-                        # Get performance data
-                        performance_metrics = validator_info.get('performance_metrics', {})
-                        performance_7d = performance_metrics.get('performance_7d', 0)
-                        validator_index = validator_info.get('validator_index')
-                        
-                        # Skip if validator index is missing
-                        if validator_index is None:
-                            continue
-                        
-                        # Initialize operator data if not exists
-                        if operator not in operator_data:
-                            operator_data[operator] = {
-                                'validator_count': 0,
-                                'total_performance': 0,
-                                'regular_validators': []  # Validators without proposals/sync duties
-                            }
-                        
-                        # Add to operator data
-                        operator_data[operator]['validator_count'] += 1
-                        operator_data[operator]['total_performance'] += performance_7d
-                        
-                        # Check if this validator should be excluded from regular performance
-                        if validator_index not in validators_to_exclude:
-                            operator_data[operator]['regular_validators'].append({
-                                'validator_index': validator_index,
-                                'performance_7d': performance_7d
-                            })
-                            
-                    except Exception as e:
-                        continue
-                
-                # Create 7-day attestation table
-                st.markdown("#### 📅 7-Day Attestation Performance")
-                regular_performance_data = []
-                for operator, data in operator_data.items():
-                    regular_validators = data['regular_validators']
-                    
-                    if len(regular_validators) == 0:  # Skip operators with no regular validators
-                        continue
-                        
-                    # Calculate average performance of regular validators (exclude zero rewards)
-                    regular_performances = [v['performance_7d'] for v in regular_validators if v['performance_7d'] > 0]
-                    if len(regular_performances) == 0:
-                        continue  # Skip operators with no validators having positive rewards
-                    regular_performance = sum(regular_performances) / len(regular_performances)
-                    
-                    # Get ENS/Discord name
-                    ens_name = ens_names.get(operator, "")
-                    
-                    # Count excluded validators
-                    excluded_count = data['validator_count'] - len(regular_validators)
-                    
-                    regular_performance_data.append({
-                        'Rank': 0,  # Will be set after sorting
-                        'Address': operator,
-                        'ENS/Discord Name': ens_name,
-                        'Regular Performance (gwei)': f"{regular_performance:,.0f}",
-                        'Attestation Validators': len(regular_validators),
-                        'Excluded (Proposals/Sync)': excluded_count,
-                        'Total Validators': data['validator_count']
-                    })
-                
-                # Sort by regular performance and assign ranks
-                regular_performance_data.sort(key=lambda x: float(x['Regular Performance (gwei)'].replace(',', '')), reverse=True)
-                
-                # Calculate relative scores (top performer = 100%)
-                if regular_performance_data:
-                    top_performance = float(regular_performance_data[0]['Regular Performance (gwei)'].replace(',', ''))
-                    
-                    for i, item in enumerate(regular_performance_data, 1):
-                        item['Rank'] = i
-                        current_performance = float(item['Regular Performance (gwei)'].replace(',', ''))
-                        relative_score = (current_performance / top_performance) * 100
-                        item['Relative Score'] = f"{relative_score:.1f}%"
-                
-                regular_df = pd.DataFrame(regular_performance_data)
+        attestation_periods = [
+            ('7d', "#### 📅 7-Day Attestation Performance",
+             "No 7-day regular performance data available (all validators have proposals or sync committee duties)"),
+            ('31d', "#### 📅 31-Day Attestation Performance",
+             "No 31-day regular performance data available")
+        ]
+        performance_7d = get_attestation_performance('7d')
+        if performance_7d is None:
+            st.info("Validator performance cache file not found. Attestation analysis unavailable.")
+        elif performance_7d.validators == 0:
+            st.info("No validator performance data found in cache file.")
+        else:
+            for period, heading, empty_message in attestation_periods:
+                st.markdown(heading)
+                regular_df = create_attestation_performance_table(get_attestation_performance(period), ens_names)
                 
                 if not regular_df.empty:
                     st.dataframe(
@@ -841,170 +728,15 @@ def create_performance_tab(operator_performance, operator_validators, operator_e
                             "Rank": st.column_config.NumberColumn("Rank", width="small"),
                             "Address": st.column_config.TextColumn("Address", width="large"),
                             "ENS/Discord Name": st.column_config.TextColumn("ENS/Discord Name", width="medium"),
-                            "Regular Performance (gwei)": st.column_config.TextColumn("Regular Performance", width="medium"),
+                            "Regular Performance (gwei)": number_column("Regular Performance", THOUSANDS, width="medium"),
                             "Attestation Validators": st.column_config.NumberColumn("Attestation Only", width="small"),
                             "Excluded (Proposals/Sync)": st.column_config.NumberColumn("Excluded", width="small"),
                             "Total Validators": st.column_config.NumberColumn("Total", width="small"),
-                            "Relative Score": st.column_config.TextColumn("Relative Score", width="small")
+                            "Relative Score": number_column("Relative Score", PERCENT_1)
                         }
                     )
                 else:
-                    st.warning("No 7-day regular performance data available (all validators have proposals or sync committee duties)")
-                
-                # Now create 31-day analysis
-                st.markdown("#### 📅 31-Day Attestation Performance")
-                # Calculate 31-day time windows
-                thirty_two_days_ago = current_time - timedelta(days=32)
-                thirty_four_days_ago = current_time - timedelta(days=34)
-                thirty_four_days_ago_timestamp = thirty_four_days_ago.timestamp()
-                
-                # Get validators with proposals in the last 34 days
-                validators_with_proposals_31d = set()
-                if proposals_data and 'proposals' in proposals_data:
-                    for proposal in proposals_data['proposals']:
-                        try:
-                            proposal_timestamp = proposal.get('timestamp', 0)
-                            if proposal_timestamp >= thirty_four_days_ago_timestamp:
-                                validator_index = proposal.get('validator_index')
-                                if validator_index:
-                                    validators_with_proposals_31d.add(validator_index)
-                        except:
-                            continue
-                
-                # Get validators with sync committee duties in the last 34 days
-                validators_with_sync_duties_31d = set()
-                if sync_committee_data and 'detailed_stats' in sync_committee_data:
-                    GENESIS_TIME = 1606824023
-                    
-                    for sync_entry in sync_committee_data['detailed_stats']:
-                        try:
-                            end_slot = sync_entry.get('end_slot', 0)
-                            end_timestamp = GENESIS_TIME + (end_slot * 12)
-                            
-                            if end_timestamp >= thirty_four_days_ago_timestamp:
-                                validator_index = sync_entry.get('validator_index')
-                                if validator_index:
-                                    validators_with_sync_duties_31d.add(validator_index)
-                        except:
-                            continue
-                
-                # Combine all validators to exclude for 31-day analysis
-                validators_to_exclude_31d = validators_with_proposals_31d.union(validators_with_sync_duties_31d)
-                
-                # Process data for 31-day analysis (validators active >32 days)
-                operator_data_31d = {}
-                
-                for validator_pubkey, validator_info in performance_data.items():
-                    try:
-                        operator = validator_info.get('operator')
-                        if not operator:
-                            continue
-                            
-                        # Check if validator has been active for more than 32 days
-                        activation_data = validator_info.get('activation_data', {})
-                        activation_timestamp = activation_data.get('activation_timestamp', 0)
-                        if activation_timestamp == 0 or activation_timestamp > thirty_two_days_ago.timestamp():
-                            continue
-                        
-                        # Skip exited validators
-                        if activation_data.get('status') == 'exited':
-                            continue
-                        
-                        # Get performance data
-                        performance_metrics = validator_info.get('performance_metrics', {})
-                        performance_31d = performance_metrics.get('performance_31d', 0)
-                        validator_index = validator_info.get('validator_index')
-                        
-                        # Skip if validator index is missing
-                        if validator_index is None:
-                            continue
-                        
-                        # Initialize operator data if not exists
-                        if operator not in operator_data_31d:
-                            operator_data_31d[operator] = {
-                                'validator_count': 0,
-                                'total_performance': 0,
-                                'regular_validators': []
-                            }
-                        
-                        # Add to operator data
-                        operator_data_31d[operator]['validator_count'] += 1
-                        operator_data_31d[operator]['total_performance'] += performance_31d
-                        
-                        # Check if this validator should be excluded from regular performance
-                        if validator_index not in validators_to_exclude_31d:
-                            operator_data_31d[operator]['regular_validators'].append({
-                                'validator_index': validator_index,
-                                'performance_31d': performance_31d
-                            })
-                            
-                    except Exception as e:
-                        continue
-                
-                # Create 31-day attestation table
-                regular_performance_data_31d = []
-                for operator, data in operator_data_31d.items():
-                    regular_validators = data['regular_validators']
-                    
-                    if len(regular_validators) == 0:
-                        continue
-                        
-                    # Calculate average performance of regular validators (exclude zero rewards)
-                    regular_performances = [v['performance_31d'] for v in regular_validators if v['performance_31d'] > 0]
-                    if len(regular_performances) == 0:
-                        continue  # Skip operators with no validators having positive rewards
-                    regular_performance = sum(regular_performances) / len(regular_performances)
-                    
-                    ens_name = ens_names.get(operator, "")
-                    excluded_count = data['validator_count'] - len(regular_validators)
-                    
-                    regular_performance_data_31d.append({
-                        'Rank': 0,
-                        'Address': operator,
-                        'ENS/Discord Name': ens_name,
-                        'Regular Performance (gwei)': f"{regular_performance:,.0f}",
-                        'Attestation Validators': len(regular_validators),
-                        'Excluded (Proposals/Sync)': excluded_count,
-                        'Total Validators': data['validator_count']
-                    })
-                
-                # Sort by regular performance and assign ranks with relative scores
-                regular_performance_data_31d.sort(key=lambda x: float(x['Regular Performance (gwei)'].replace(',', '')), reverse=True)
-                
-                if regular_performance_data_31d:
-                    top_performance_31d = float(regular_performance_data_31d[0]['Regular Performance (gwei)'].replace(',', ''))
-                    
-                    for i, item in enumerate(regular_performance_data_31d, 1):
-                        item['Rank'] = i
-                        current_performance = float(item['Regular Performance (gwei)'].replace(',', ''))
-                        relative_score = (current_performance / top_performance_31d) * 100
-                        item['Relative Score'] = f"{relative_score:.1f}%"
-                
-                regular_df_31d = pd.DataFrame(regular_performance_data_31d)
-                
-                if not regular_df_31d.empty:
-                    st.dataframe(
-                        regular_df_31d,
-                        use_container_width=True,
-                        hide_index=True,
-                        column_config={
-                            "Rank": st.column_config.NumberColumn("Rank", width="small"),
-                            "Address": st.column_config.TextColumn("Address", width="large"),
-                            "ENS/Discord Name": st.column_config.TextColumn("ENS/Discord Name", width="medium"),
-                            "Regular Performance (gwei)": st.column_config.TextColumn("Regular Performance", width="medium"),
-                            "Attestation Validators": st.column_config.NumberColumn("Attestation Only", width="small"),
-                            "Excluded (Proposals/Sync)": st.column_config.NumberColumn("Excluded", width="small"),
-                            "Total Validators": st.column_config.NumberColumn("Total", width="small"),
-                            "Relative Score": st.column_config.TextColumn("Relative Score", width="small")
-                        }
-                    )
-                else:
-                    st.warning("No 31-day regular performance data available")
-                    
-            else:
-                st.info("No validator performance data found in cache file.")
-        else:
-            st.info("Validator performance cache file not found. Attestation analysis unavailable.")
+                    st.warning(empty_message)
             
     except Exception as e:
         st.error(f"Error loading attestation performance data: {str(e)}")
@@ -1079,28 +811,14 @@ def create_proposals_tab(ens_names):
                 display_largest_df,
                 use_container_width=True,
                 hide_index=True,
-                column_config={
-                    "Date": st.column_config.TextColumn("Date", width="medium"),
-                    "Operator": st.column_config.TextColumn("Operator", width="medium"),
-                    "Validator Pubkey": st.column_config.TextColumn("Validator Pubkey", width="large"),
-                    "ETH Value": st.column_config.TextColumn("ETH Value", width="small"),
-                    "Execution Rewards": st.column_config.TextColumn("Execution", width="small"),
-                    "Consensus Rewards": st.column_config.TextColumn("Consensus", width="small"),
-                    "MEV Rewards": st.column_config.TextColumn("MEV", width="small"),
-                    "MEV Relay": st.column_config.TextColumn("MEV Relay", width="medium"),
-                    "Slot": st.column_config.TextColumn("Slot", width="small"),
-                    "Gas Used": st.column_config.TextColumn("Gas Used", width="small"),
-                    "Gas Utilization": st.column_config.TextColumn("Gas %", width="small"),
-                    "TX Count": st.column_config.TextColumn("TXs", width="small")
-                }
+                column_config=PROPOSAL_COLUMNS
             )
             
-            largest_csv = largest_proposals_df.to_csv(index=False)
-            st.download_button(
+            export_button(
                 label="📥 Download Largest Proposals",
-                data=largest_csv,
-                file_name=f"largest_proposals_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                mime="text/csv"
+                build=largest_proposals_df,
+                name="largest_proposals",
+                file_name=f"largest_proposals_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
             )
         else:
             st.info("No proposals available.")
@@ -1119,28 +837,14 @@ def create_proposals_tab(ens_names):
                 display_latest_df,
                 use_container_width=True,
                 hide_index=True,
-                column_config={
-                    "Date": st.column_config.TextColumn("Date", width="medium"),
-                    "Operator": st.column_config.TextColumn("Operator", width="medium"),
-                    "Validator Pubkey": st.column_config.TextColumn("Validator Pubkey", width="large"),
-                    "ETH Value": st.column_config.TextColumn("ETH Value", width="small"),
-                    "Execution Rewards": st.column_config.TextColumn("Execution", width="small"),
-                    "Consensus Rewards": st.column_config.TextColumn("Consensus", width="small"),
-                    "MEV Rewards": st.column_config.TextColumn("MEV", width="small"),
-                    "MEV Relay": st.column_config.TextColumn("MEV Relay", width="medium"),
-                    "Slot": st.column_config.TextColumn("Slot", width="small"),
-                    "Gas Used": st.column_config.TextColumn("Gas Used", width="small"),
-                    "Gas Utilization": st.column_config.TextColumn("Gas %", width="small"),
-                    "TX Count": st.column_config.TextColumn("TXs", width="small")
-                }
+                column_config=PROPOSAL_COLUMNS
             )
             
-            latest_csv = latest_proposals_df.to_csv(index=False)
-            st.download_button(
+            export_button(
                 label="📥 Download Latest Proposals",
-                data=latest_csv,
-                file_name=f"latest_proposals_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                mime="text/csv"
+                build=latest_proposals_df,
+                name="latest_proposals",
+                file_name=f"latest_proposals_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
             )
         else:
             st.info("No recent proposals available.")
@@ -1160,17 +864,16 @@ def create_proposals_tab(ens_names):
                 hide_index=True,
                 column_config={
                     "MEV Relay": st.column_config.TextColumn("MEV Relay", width="large"),
-                    "Proposals": st.column_config.TextColumn("Proposals", width="small"),
-                    "Percentage": st.column_config.TextColumn("Percentage", width="small")
+                    "Proposals": number_column("Proposals"),
+                    "Percentage": number_column("Percentage", PERCENT_1)
                 }
             )
             
-            relay_csv = mev_relay_df.to_csv(index=False)
-            st.download_button(
+            export_button(
                 label="📥 Download MEV Relay Data",
-                data=relay_csv,
-                file_name=f"mev_relay_breakdown_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                mime="text/csv"
+                build=mev_relay_df,
+                name="mev_relay_breakdown",
+                file_name=f"mev_relay_breakdown_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
             )
         else:
             st.info("No MEV relay data available.")
@@ -1219,25 +922,25 @@ def create_proposals_tab(ens_names):
                 # Display missed proposals table
                 display_missed_df = missed_df.drop(['Operator Address'], axis=1)
                 st.dataframe(
-                    display_missed_df,
+                    with_placeholder(display_missed_df, "Missed %", PERCENT_1),
                     use_container_width=True,
                     hide_index=True,
                     column_config={
                         "Date & Time": st.column_config.TextColumn("Date & Time", width="medium"),
-                        "Slot Number": st.column_config.TextColumn("Slot Number", width="small"),
+                        "Slot Number": number_column("Slot Number"),
                         "Operator Name": st.column_config.TextColumn("Operator Name", width="medium"),
-                        "Total Missed": st.column_config.TextColumn("Total Missed", width="small"),
-                        "Total Successful": st.column_config.TextColumn("Total Successful", width="small"),
-                        "Missed %": st.column_config.TextColumn("Missed %", width="small")
+                        "Total Missed": number_column("Total Missed"),
+                        "Total Successful": number_column("Total Successful"),
+                        # Formatted by with_placeholder, which shows N/A where there is no percentage
+                        "Missed %": st.column_config.NumberColumn("Missed %", width="small")
                     }
                 )
                 
-                missed_csv = missed_df.to_csv(index=False)
-                st.download_button(
+                export_button(
                     label="📥 Download Missed Proposals",
-                    data=missed_csv,
-                    file_name=f"missed_proposals_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                    mime="text/csv"
+                    build=missed_df,
+                    name="missed_proposals",
+                    file_name=f"missed_proposals_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
                 )
             else:
                 st.info("🎉 No missed proposals found!")
@@ -1258,12 +961,7 @@ def create_proposals_tab(ens_names):
             )
             
             if search_term:
-                filtered_ops = []
-                for op in proposals_operators:
-                    ens_name = op['ens_name']
-                    if (search_term.lower() in op['operator'].lower() or
-                        (ens_name and search_term.lower() in ens_name.lower())):
-                        filtered_ops.append(op)
+                filtered_ops = filter_operators(proposals_operators, search_term)
                 
                 if filtered_ops:
                     st.info(f"Found {len(filtered_ops)} operators matching '{search_term}'")
@@ -1274,8 +972,9 @@ def create_proposals_tab(ens_names):
             else:
                 display_ops = proposals_operators
             
-            # Display detailed operator information
-            for i, op_data in enumerate(display_ops):
+            # Display detailed operator information, one page at a time
+            page_ops, offset = paginate(display_ops, "proposals_operators_page", OPERATOR_PAGE_SIZE)
+            for i, op_data in enumerate(page_ops, start=offset):
                 ens_name = op_data['ens_name']
                 operator = op_data['operator']
                 
@@ -1286,7 +985,12 @@ def create_proposals_tab(ens_names):
                 
                 header += f" ({op_data['total_value_eth']:.4f} ETH)"
                 
-                with st.expander(header, expanded=False):
+                expander = lazy_expander(header, key=f"proposals_operator_{operator}")
+                with expander:
+                    # Detail frames and the CSV are only built while the operator is open
+                    if getattr(expander, 'open', None) is False:
+                        continue
+                    
                     if ens_name:
                         st.markdown(f"**ENS:** {ens_name}")
                     st.markdown(f"**Address:** `{operator}`")
@@ -1316,7 +1020,7 @@ def create_proposals_tab(ens_names):
                         st.write(f"• First: **{op_data['first_proposal']}**")
                         st.write(f"• Latest: **{op_data['last_proposal']}**")
                         
-                        if len(op_data['proposals']) > 1:
+                        if op_data['proposals_found'] > 1:
                             try:
                                 first = datetime.strptime(op_data['first_proposal'], '%Y-%m-%d %H:%M:%S')
                                 last = datetime.strptime(op_data['last_proposal'], '%Y-%m-%d %H:%M:%S')
@@ -1330,36 +1034,25 @@ def create_proposals_tab(ens_names):
                     
                     # Proposal history table
                     st.markdown("**📋 Proposal History**")
-                    proposals_list = op_data['proposals']
+                    history_df = get_operator_proposal_history(proposals_data, operator)
                     
-                    if proposals_list:
-                        df = pd.DataFrame(proposals_list)
-                        
+                    if not history_df.empty:
                         # Use the formatted MEV relay information
-                        display_df = df[['date', 'slot', 'total_value_eth', 'gas_used', 'gas_utilization', 'tx_count', 'base_fee', 'mev_relay', 'validator_pubkey']].copy()
+                        display_df = history_df[['date', 'slot', 'total_value_eth', 'gas_used', 'gas_utilization', 'tx_count', 'base_fee', 'mev_relay', 'validator_pubkey']].copy()
                         display_df.columns = ['Date', 'Slot', 'ETH Value', 'Gas Used', 'Gas %', 'TXs', 'Base Fee', 'MEV Relay', 'Validator Pubkey']
                         
-                        display_df['ETH Value'] = display_df['ETH Value'].apply(lambda x: f"{x:.4f}")
-                        display_df['Gas Used'] = display_df['Gas Used'].astype(str)
-                        display_df['Gas %'] = display_df['Gas %'].apply(lambda x: f"{x:.1f}%")
-                        display_df['TXs'] = display_df['TXs'].astype(str)
-                        display_df['Base Fee'] = display_df['Base Fee'].astype(str)
-                        display_df['Slot'] = display_df['Slot'].astype(str)
-                        
-                        display_df = display_df.sort_values('Date', ascending=False)
-                        
                         st.dataframe(
                             display_df,
                             use_container_width=True,
                             hide_index=True,
                             column_config={
                                 "Date": st.column_config.TextColumn("Date", width="medium"),
-                                "Slot": st.column_config.TextColumn("Slot", width="small"),
-                                "ETH Value": st.column_config.TextColumn("ETH Value", width="small"),
-                                "Gas Used": st.column_config.TextColumn("Gas Used", width="small"),
-                                "Gas %": st.column_config.TextColumn("Gas %", width="small"),
-                                "TXs": st.column_config.TextColumn("TXs", width="small"),
-                                "Base Fee": st.column_config.TextColumn("Base Fee", width="small"),
+                                "Slot": number_column("Slot"),
+                                "ETH Value": number_column("ETH Value", ETH),
+                                "Gas Used": number_column("Gas Used"),
+                                "Gas %": number_column("Gas %", PERCENT_1),
+                                "TXs": number_column("TXs"),
+                                "Base Fee": number_column("Base Fee"),
                                 "MEV Relay": st.column_config.TextColumn("MEV Relay", width="medium"),
                                 "Validator Pubkey": st.column_config.TextColumn("Validator Pubkey", width="large")
                             }
@@ -1370,12 +1063,11 @@ def create_proposals_tab(ens_names):
                         else:
                             filename = f"{operator[:8]}_{operator[-6:]}"
                         
-                        csv = df.to_csv(index=False)
-                        st.download_button(
+                        export_button(
                             label=f"📥 Download {ens_name if ens_name else operator[:10]+'...'} proposals",
-                            data=csv,
-                            file_name=f"proposals_{filename}_{datetime.now().strftime('%Y%m%d')}.csv",
-                            mime="text/csv",
+                            build=lambda operator=operator: create_operator_proposals_export(proposals_data, operator),
+                            name=f"proposals_{operator}",
+                            file_name=f"proposals_{filename}_{datetime.now().strftime('%Y%m%d')}",
                             key=f"proposals_download_{i}"
                         )
                     else:
@@ -1385,30 +1077,29 @@ def create_proposals_tab(ens_names):
             st.markdown("---")
             col1, col2 = st.columns([3, 1])
             with col2:
-                export_data = []
-                for op in proposals_operators:
-                    export_data.append({
-                        'address': op['operator'],
-                        'ens_name': op['ens_name'],
-                        'proposal_count': op['proposal_count'],
-                        'total_value_eth': op['total_value_eth'],
-                        'average_value_eth': op['average_value_eth'],
-                        'highest_value_eth': op['highest_value_eth'],
-                        'total_gas_used': op['total_gas_used'],
-                        'avg_gas_utilization': op['avg_gas_utilization'],
-                        'avg_tx_count': op['avg_tx_count'],
-                        'first_proposal': op['first_proposal'],
-                        'last_proposal': op['last_proposal']
-                    })
-                
-                export_df = pd.DataFrame(export_data)
-                export_csv = export_df.to_csv(index=False)
-                
-                st.download_button(
+                def build_export():
+                    export_data = []
+                    for op in proposals_operators:
+                        export_data.append({
+                            'address': op['operator'],
+                            'ens_name': op['ens_name'],
+                            'proposal_count': op['proposal_count'],
+                            'total_value_eth': op['total_value_eth'],
+                            'average_value_eth': op['average_value_eth'],
+                            'highest_value_eth': op['highest_value_eth'],
+                            'total_gas_used': op['total_gas_used'],
+                            'avg_gas_utilization': op['avg_gas_utilization'],
+                            'avg_tx_count': op['avg_tx_count'],
+                            'first_proposal': op['first_proposal'],
+                            'last_proposal': op['last_proposal']
+                        })
+                    return pd.DataFrame(export_data)
+
+                export_button(
                     label="📥 Download All Proposal Data",
-                    data=export_csv,
-                    file_name=f"proposals_summary_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                    mime="text/csv",
+                    build=build_export,
+                    name="proposals_summary",
+                    file_name=f"proposals_summary_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
                     use_container_width=True
                 )
         else:
@@ -1478,29 +1169,27 @@ def create_sync_committee_tab(ens_names):
         operators_df = create_sync_committee_operators_table(sync_data, ens_names)
         
         if not operators_df.empty:
-            display_operators_df = operators_df.drop(['Participation_Raw'], axis=1)
             st.dataframe(
-                display_operators_df,
+                operators_df,
                 use_container_width=True,
                 hide_index=True,
                 column_config={
                     "Rank": st.column_config.NumberColumn("Rank", width="small"),
                     "Address": st.column_config.TextColumn("Address", width="large"),
                     "ENS / Discord Name": st.column_config.TextColumn("ENS / Discord Name", width="medium"),
-                    "Participation Rate": st.column_config.TextColumn("Participation Rate", width="small"),
-                    "Total Periods": st.column_config.TextColumn("Periods", width="small"),
-                    "Total Slots": st.column_config.TextColumn("Total Slots", width="small"),
-                    "Successful": st.column_config.TextColumn("Successful", width="small"),
-                    "Missed": st.column_config.TextColumn("Missed", width="small")
+                    "Participation Rate": number_column("Participation Rate", PERCENT_2),
+                    "Total Periods": number_column("Periods"),
+                    "Total Slots": number_column("Total Slots", THOUSANDS),
+                    "Successful": number_column("Successful", THOUSANDS),
+                    "Missed": number_column("Missed", THOUSANDS)
                 }
             )
             
-            operators_csv = operators_df.to_csv(index=False)
-            st.download_button(
+            export_button(
                 label="📥 Download Operator Data",
-                data=operators_csv,
-                file_name=f"sync_committee_operators_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                mime="text/csv"
+                build=operators_df,
+                name="sync_committee_operators",
+                file_name=f"sync_committee_operators_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
             )
         else:
             st.info("No operator sync committee data available.")
@@ -1514,27 +1203,25 @@ def create_sync_committee_tab(ens_names):
         periods_df = create_sync_committee_periods_table(sync_data)
         
         if not periods_df.empty:
-            display_periods_df = periods_df.drop(['Participation_Raw'], axis=1)
             st.dataframe(
-                display_periods_df,
+                periods_df,
                 use_container_width=True,
                 hide_index=True,
                 column_config={
                     "Period": st.column_config.TextColumn("Period", width="small"),
-                    "Validators": st.column_config.TextColumn("Validators", width="small"),
-                    "Total Slots": st.column_config.TextColumn("Total Slots", width="small"),
-                    "Successful": st.column_config.TextColumn("Successful", width="small"),
-                    "Missed": st.column_config.TextColumn("Missed", width="small"),
-                    "Participation Rate": st.column_config.TextColumn("Participation Rate", width="small")
+                    "Validators": number_column("Validators"),
+                    "Total Slots": number_column("Total Slots", THOUSANDS),
+                    "Successful": number_column("Successful", THOUSANDS),
+                    "Missed": number_column("Missed", THOUSANDS),
+                    "Participation Rate": number_column("Participation Rate", PERCENT_2)
                 }
             )
             
-            periods_csv = periods_df.to_csv(index=False)
-            st.download_button(
+            export_button(
                 label="📥 Download Period Data",
-                data=periods_csv,
-                file_name=f"sync_committee_periods_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                mime="text/csv"
+                build=periods_df,
+                name="sync_committee_periods",
+                file_name=f"sync_committee_periods_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
             )
         else:
             st.info("No period data available.")
@@ -1556,10 +1243,9 @@ def create_sync_committee_tab(ens_names):
             )
             
             if search_term:
-                filtered_df = detailed_df[
-                    detailed_df['Operator'].str.contains(search_term, case=False, na=False) |
-                    detailed_df['Operator Address'].str.contains(search_term, case=False, na=False)
-                ]
+                matching_operators = filter_operators(detailed_df['Operator Address'].unique(), search_term,
+                                                      operator=lambda address: address)
+                filtered_df = detailed_df[detailed_df['Operator Address'].isin(matching_operators)]
                 
                 if not filtered_df.empty:
                     st.info(f"Found {len(filtered_df)} records matching '{search_term}'")
@@ -1578,24 +1264,25 @@ def create_sync_committee_tab(ens_names):
                     column_config={
                         "Period": st.column_config.TextColumn("Period", width="small"),
                         "Operator": st.column_config.TextColumn("Operator", width="medium"),
-                        "Validator Index": st.column_config.TextColumn("Val Index", width="small"),
+                        "Validator Index": number_column("Val Index"),
                         "Validator Pubkey": st.column_config.TextColumn("Validator Pubkey", width="large"),
-                        "Participation Rate": st.column_config.TextColumn("Participation Rate", width="small"),
-                        "Total Slots": st.column_config.TextColumn("Total Slots", width="small"),
-                        "Successful": st.column_config.TextColumn("Successful", width="small"),
-                        "Missed": st.column_config.TextColumn("Missed", width="small"),
-                        "Start Epoch": st.column_config.TextColumn("Start Epoch", width="small"),
-                        "End Epoch": st.column_config.TextColumn("End Epoch", width="small"),
+                        "Participation Rate": number_column("Participation Rate", PERCENT_2),
+                        "Total Slots": number_column("Total Slots", THOUSANDS),
+                        "Successful": number_column("Successful", THOUSANDS),
+                        "Missed": number_column("Missed", THOUSANDS),
+                        "Successful %": number_column("Successful %", PERCENT_2),
+                        "Missed %": number_column("Missed %", PERCENT_2),
+                        "Start Epoch": number_column("Start Epoch"),
+                        "End Epoch": number_column("End Epoch"),
                         "Partial Period": st.column_config.TextColumn("Partial", width="small")
                     }
                 )
                 
-                detailed_csv = detailed_df.to_csv(index=False)
-                st.download_button(
+                export_button(
                     label="📥 Download Detailed Data",
-                    data=detailed_csv,
-                    file_name=f"sync_committee_detailed_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                    mime="text/csv"
+                    build=detailed_df,
+                    name="sync_committee_detailed",
+                    file_name=f"sync_committee_detailed_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
                 )
         else:
             st.info("No detailed sync committee data available.")
@@ -1640,50 +1327,14 @@ def create_exit_analysis_tab(operator_validators, operator_exited, ens_names):
         
         operators_with_exits = exit_data.get('operators_with_exits', [])
         if operators_with_exits:
-            exited_operators_data = []
-            for operator_data in operators_with_exits:
-                addr = operator_data.get('operator', '')
-                display_name = format_operator_display_plain(addr, ens_names, show_full_address=True)
-                
-                # Calculate days since last exit
-                latest_timestamp = operator_data.get('latest_exit_timestamp', 0)
-                days_since_exit = ""
-                if latest_timestamp:
-                    days_diff = (datetime.now().timestamp() - latest_timestamp) / (24 * 3600)
-                    days_since_exit = f"{int(days_diff)} days ago"
-
-                exited_operators_data.append({
-                    'Operator': display_name,
-                    'Full Address': addr,
-                    'Exits': operator_data.get('exits', 0),
-                    'Still Active': operator_data.get('still_active', 0),
-                    'Total Ever': operator_data.get('total_ever', 0),
-                    'Exit Rate': f"{operator_data.get('exit_rate', 0):.1f}%",
-                    'Latest Exit Date': operator_data.get('latest_exit_date', 'N/A'),
-                    'Days Since Exit': days_since_exit
-                })
-
-            df_exited = pd.DataFrame(exited_operators_data)
-            df_exited = df_exited.sort_values('Exit Rate', key=lambda x: x.str.rstrip('%').astype(float), ascending=False)
-
-            df_exited['Exits'] = df_exited['Exits'].astype(str)
-            df_exited['Still Active'] = df_exited['Still Active'].astype(str)
-            df_exited['Total Ever'] = df_exited['Total Ever'].astype(str)
+            df_exited = create_exits_table(operators_with_exits, ens_names)
 
             display_exited_df = df_exited.drop(['Full Address'], axis=1)
             st.dataframe(
                 display_exited_df,
                 use_container_width=True,
                 hide_index=True,
-                column_config={
-                    "Operator": st.column_config.TextColumn("Operator", width="large"),
-                    "Exits": st.column_config.TextColumn("Exits", width="small"),
-                    "Still Active": st.column_config.TextColumn("Still Active", width="small"),
-                    "Total Ever": st.column_config.TextColumn("Total Ever", width="small"),
-                    "Exit Rate": st.column_config.TextColumn("Exit Rate", width="small"),
-                    "Latest Exit Date": st.column_config.TextColumn("Latest Exit Date", width="medium"),
-                    "Days Since Exit": st.column_config.TextColumn("Days Since Exit", width="medium")
-                }
+                column_config=EXIT_COLUMNS
             )
 
             # Recent exits detail table
@@ -1724,21 +1375,19 @@ def create_exit_analysis_tab(operator_validators, operator_exited, ens_names):
                 )
 
             # Download buttons
-            exits_csv = display_exited_df.to_csv(index=False)
-            st.download_button(
+            export_button(
                 label="📥 Download Exit Summary",
-                data=exits_csv,
-                file_name=f"nodeset_exits_summary_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                mime="text/csv"
+                build=display_exited_df,
+                name="nodeset_exits_summary",
+                file_name=f"nodeset_exits_summary_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
             )
             
             if recent_exits:
-                recent_exits_csv = df_recent_exits.to_csv(index=False)
-                st.download_button(
+                export_button(
                     label="📥 Download Recent Exits",
-                    data=recent_exits_csv,
-                    file_name=f"nodeset_recent_exits_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                    mime="text/csv"
+                    build=df_recent_exits,
+                    name="nodeset_recent_exits",
+                    file_name=f"nodeset_recent_exits_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
                 )
         else:
             st.info("No operators with exits found in the data.")
@@ -1749,26 +1398,9 @@ def create_exit_analysis_tab(operator_validators, operator_exited, ens_names):
             st.warning("⚠️ Detailed exit data not available. Showing basic exit information.")
             st.subheader("Operators with Exits")
             
-            exited_operators_data = []
-            for addr, exit_count in operator_exited.items():
-                if exit_count > 0:
-                    total_count = operator_validators.get(addr, 0)
-                    active_count = total_count - exit_count
-                    exit_rate = (exit_count / total_count * 100) if total_count > 0 else 0
-                    display_name = format_operator_display_plain(addr, ens_names, show_full_address=True)
-
-                    exited_operators_data.append({
-                        'Operator': display_name,
-                        'Exits': exit_count,
-                        'Still Active': active_count,
-                        'Total Ever': total_count,
-                        'Exit Rate': f"{exit_rate:.1f}%"
-                    })
-
-            if exited_operators_data:
-                df_exited = pd.DataFrame(exited_operators_data)
-                df_exited = df_exited.sort_values('Exit Rate', key=lambda x: x.str.rstrip('%').astype(float), ascending=False)
-                st.dataframe(df_exited, use_container_width=True, hide_index=True)
+            df_exited = create_basic_exits_table(operator_validators, operator_exited, ens_names)
+            if not df_exited.empty:
+                st.dataframe(df_exited, use_container_width=True, hide_index=True, column_config=EXIT_COLUMNS)
         else:
             st.info("😊 Great news! No validator exits detected yet.")
 
@@ -1895,12 +1527,7 @@ def create_costs_tab(cache, operator_validators, operator_exited, ens_names):
             )
 
             if search_term:
-                filtered_data = []
-                for row in cost_data:
-                    ens_name = ens_names.get(row['operator'], "")
-                    if (search_term.lower() in row['operator'].lower() or
-                        (ens_name and search_term.lower() in ens_name.lower())):
-                        filtered_data.append(row)
+                filtered_data = filter_operators(cost_data, search_term)
 
                 if filtered_data:
                     st.info(f"Found {len(filtered_data)} operators matching '{search_term}'")
@@ -1952,28 +1579,12 @@ def create_costs_tab(cache, operator_validators, operator_exited, ens_names):
                     if operator_txs:
                         st.markdown("**📋 Transaction History**")
 
-                        tx_df = pd.DataFrame(operator_txs)
-                        tx_df['datetime'] = pd.to_datetime(tx_df['date'] + ' ' + tx_df['time'])
-                        tx_df = tx_df.sort_values('datetime', ascending=False)
-
-                        tx_df['validator_count'] = tx_df.apply(
-                            lambda row_data: row_data.get('validator_count', 0) if row_data['status'] == 'Successful' else 0,
-                            axis=1
-                        )
-
-                        tx_df['validator_count'] = pd.to_numeric(tx_df['validator_count'], errors='coerce').fillna(0).astype(int)
-
-                        display_tx_df = tx_df[['date', 'time', 'total_cost_eth', 'status', 'validator_count', 'gas_used', 'gas_price']].copy()
-                        display_tx_df['validator_count_display'] = display_tx_df.apply(
-                            lambda row: str(row['validator_count']) if row['status'] == 'Successful' and row['validator_count'] > 0 else '',
-                            axis=1
-                        )
+                        tx_df = create_operator_transactions_table(operator_txs)
 
-                        final_display_df = display_tx_df[['date', 'time', 'total_cost_eth', 'status', 'validator_count_display', 'gas_used', 'gas_price']].copy()
+                        final_display_df = tx_df[['date', 'time', 'total_cost_eth', 'status', 'validator_count', 'gas_used', 'gas_price']].copy()
                         final_display_df.columns = ['Date', 'Time', 'Cost (ETH)', 'Status', 'Validators', 'Gas Used', 'Gas Price']
-
-                        final_display_df['Gas Used'] = final_display_df['Gas Used'].astype(str)
-                        final_display_df['Gas Price'] = final_display_df['Gas Price'].astype(str)
+                        # Validator counts are only shown for successful transactions that had some
+                        final_display_df['Validators'] = final_display_df['Validators'].where(final_display_df['Validators'] > 0).astype('Int64')
 
                         st.dataframe(
                             final_display_df,
@@ -1982,11 +1593,11 @@ def create_costs_tab(cache, operator_validators, operator_exited, ens_names):
                             column_config={
                                 "Date": st.column_config.TextColumn("Date", width="small"),
                                 "Time": st.column_config.TextColumn("Time", width="small"),
-                                "Cost (ETH)": st.column_config.TextColumn("Cost (ETH)", width="small"),
+                                "Cost (ETH)": number_column("Cost (ETH)", ETH_PRECISE),
                                 "Status": st.column_config.TextColumn("Status", width="small"),
-                                "Validators": st.column_config.TextColumn("Validators", width="small"),
-                                "Gas Used": st.column_config.TextColumn("Gas Used", width="small"),
-                                "Gas Price": st.column_config.TextColumn("Gas Price", width="small")
+                                "Validators": number_column("Validators"),
+                                "Gas Used": number_column("Gas Used"),
+                                "Gas Price": number_column("Gas Price")
                             }
                         )
 
@@ -1996,12 +1607,11 @@ def create_costs_tab(cache, operator_validators, operator_exited, ens_names):
                         else:
                             filename_part = f"{row['operator'][:8]}_{row['operator'][-6:]}"
 
-                        csv_data = tx_df.to_csv(index=False)
-                        st.download_button(
+                        export_button(
                             label=f"📥 Download {ens_name if ens_name else row['operator'][:10]+'...'} transactions",
-                            data=csv_data,
-                            file_name=f"nodeset_costs_{filename_part}_{datetime.now().strftime('%Y%m%d')}.csv",
-                            mime="text/csv",
+                            build=tx_df,
+                            name=f"nodeset_costs_{row['operator']}",
+                            file_name=f"nodeset_costs_{filename_part}_{datetime.now().strftime('%Y%m%d')}",
                             key=f"download_{i}"
                         )
                     else:
@@ -2010,29 +1620,28 @@ def create_costs_tab(cache, operator_validators, operator_exited, ens_names):
             st.markdown("---")
             col1, col2 = st.columns([3, 1])
             with col2:
-                export_cost_data = []
-                for row in cost_data:
-                    ens_name = ens_names.get(row['operator'], "")
-                    export_cost_data.append({
-                        'address': row['operator'],
-                        'ens_name': ens_name,
-                        'total_cost_eth': row['total_cost_eth'],
-                        'total_txs': row['total_txs'],
-                        'successful_txs': row['successful_txs'],
-                        'failed_txs': row['failed_txs'],
-                        'success_rate': row['success_rate'],
-                        'validators': row['validators'],
-                        'cost_per_validator': row['cost_per_validator']
-                    })
-
-                export_df = pd.DataFrame(export_cost_data)
-                summary_csv = export_df.to_csv(index=False)
+                def build_export():
+                    export_cost_data = []
+                    for row in cost_data:
+                        ens_name = ens_names.get(row['operator'], "")
+                        export_cost_data.append({
+                            'address': row['operator'],
+                            'ens_name': ens_name,
+                            'total_cost_eth': row['total_cost_eth'],
+                            'total_txs': row['total_txs'],
+                            'successful_txs': row['successful_txs'],
+                            'failed_txs': row['failed_txs'],
+                            'success_rate': row['success_rate'],
+                            'validators': row['validators'],
+                            'cost_per_validator': row['cost_per_validator']
+                        })
+                    return pd.DataFrame(export_cost_data)
 
-                st.download_button(
+                export_button(
                     label="📥 Download All Cost Data",
-                    data=summary_csv,
-                    file_name=f"nodeset_all_costs_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                    mime="text/csv",
+                    build=build_export,
+                    name="nodeset_all_costs",
+                    file_name=f"nodeset_all_costs_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
                     use_container_width=True
                 )
         else:
@@ -2137,11 +1746,7 @@ def create_gas_analysis_tab(ens_names):
                 )
                 
                 if search_term:
-                    filtered_data = []
-                    for op in gas_operator_data:
-                        if (search_term.lower() in op['operator'].lower() or
-                            (op['ens_name'] and search_term.lower() in op['ens_name'].lower())):
-                            filtered_data.append(op)
+                    filtered_data = filter_operators(gas_operator_data, search_term)
                     
                     if filtered_data:
                         st.info(f"Found {len(filtered_data)} operators matching '{search_term}'")
@@ -2207,30 +1812,28 @@ def create_gas_analysis_tab(ens_names):
                 st.markdown("---")
                 col1, col2 = st.columns([3, 1])
                 with col2:
-                    # Prepare export data
-                    export_data = []
-                    for op in gas_operator_data:
-                        export_data.append({
-                            'address': op['operator'],
-                            'ens_name': op['ens_name'],
-                            'total_validators': op['total_validators'],
-                            'max_gas_limit': op['max_gas_limit'],
-                            'average_gas_limit': op['average_gas_limit'],
-                            'min_gas_limit': op['min_gas_limit'],
-                            'gas_category': op['gas_category'],
-                            'strategy': op['strategy'],
-                            'consistency_score': op['consistency_score'],
-                            'unique_gas_limits': len(op['unique_limits'])
-                        })
-                    
-                    export_df = pd.DataFrame(export_data)
-                    export_csv = export_df.to_csv(index=False)
-                    
-                    st.download_button(
+                    def build_export():
+                        export_data = []
+                        for op in gas_operator_data:
+                            export_data.append({
+                                'address': op['operator'],
+                                'ens_name': op['ens_name'],
+                                'total_validators': op['total_validators'],
+                                'max_gas_limit': op['max_gas_limit'],
+                                'average_gas_limit': op['average_gas_limit'],
+                                'min_gas_limit': op['min_gas_limit'],
+                                'gas_category': op['gas_category'],
+                                'strategy': op['strategy'],
+                                'consistency_score': op['consistency_score'],
+                                'unique_gas_limits': len(op['unique_limits'])
+                            })
+                        return pd.DataFrame(export_data)
+
+                    export_button(
                         label="📥 Download Gas Analysis",
-                        data=export_csv,
-                        file_name=f"gas_limit_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                        mime="text/csv",
+                        build=build_export,
+                        name="gas_limit_analysis",
+                        file_name=f"gas_limit_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
                         use_container_width=True
                     )
             else:
@@ -2286,9 +1889,54 @@ def create_raw_data_tab(cache, operator_validators, operator_exited, ens_names):
         st.warning("⚠️ Install 'psutil' package to see memory usage: `pip install psutil`")
     except Exception as e:
         st.error(f"⚠️ Could not retrieve memory usage: {str(e)}")
-    
+
+    # Per-structure memory accounting
+    try:
+        report = memory_report()
+        if report:
+            st.markdown("#### 🧮 Memory by Structure")
+            dataset_mb = sum(row['bytes'] for row in report if row['kind'] == 'Dataset') / (1024 * 1024)
+            st.caption(f"Shared datasets hold {dataset_mb:.1f} MB. Main cache keys are part of the validator_data "
+                       f"dataset; tab DataFrames are sized at their last render.")
+
+            rss_bytes = get_memory_usage()[0] * 1024 * 1024
+            memory_data = []
+            for row in report:
+                memory_data.append({
+                    'Structure': row['structure'],
+                    'Kind': row['kind'],
+                    'Size (MB)': f"{row['bytes'] / (1024 * 1024):.3f}",
+                    '% of RSS': f"{row['bytes'] / rss_bytes * 100:.1f}%" if rss_bytes else 'N/A',
+                    'Detail': row['detail']
+                })
+
+            st.dataframe(pd.DataFrame(memory_data), use_container_width=True, hide_index=True)
+    except Exception as e:
+        st.error(f"⚠️ Could not measure data structures: {str(e)}")
+
+    # Caches dropped under memory pressure
+    evictions = list(memory_manager.evictions)
+    if evictions:
+        st.markdown("#### ♻️ Memory Evictions")
+        st.caption("Caches dropped above the 85% high-water mark, derived results first and raw datasets last; "
+                   "each is rebuilt on its next use")
+
+        eviction_data = []
+        for eviction in reversed(evictions):
+            eviction_data.append({
+                'Time': datetime.fromtimestamp(eviction['time']).strftime('%Y-%m-%d %H:%M:%S'),
+                'Cache': eviction['cache'],
+                'Tier': eviction['tier'],
+                'Idle (s)': f"{eviction['idle_seconds']:.0f}",
+                'Estimated Size (MB)': f"{eviction['estimated_mb']:.1f}",
+                'RSS Before (MB)': f"{eviction['rss_before_mb']:.1f}",
+                'RSS After (MB)': f"{eviction['rss_after_mb']:.1f}"
+            })
+
+        st.dataframe(pd.DataFrame(eviction_data), use_container_width=True, hide_index=True)
+
     st.markdown("---")
-    
+
     # Data Files Overview Section
     st.markdown("### 📁 Data Files Overview")
     
@@ -2490,22 +2138,20 @@ def create_raw_data_tab(cache, operator_validators, operator_exited, ens_names):
     # 6. Validator performance data
     performance_cache = load_validator_performance_data()
     if performance_cache[0] is not None:
-        performance_content, performance_file = performance_cache
+        performance_columns, performance_file = performance_cache
         try:
             import os
             file_size = os.path.getsize(performance_file)
             file_size_mb = file_size / (1024 * 1024)
             last_modified = datetime.fromtimestamp(os.path.getmtime(performance_file))
             
-            # Count validators in performance data
-            validators = performance_content.get('validators', {})
             data_files_info.append({
                 'File': 'validator_performance_cache.json',
                 'Description': 'Individual validator performance metrics',
                 'Size (MB)': f"{file_size_mb:.3f}",
                 'Last Modified': last_modified.strftime('%Y-%m-%d %H:%M:%S'),
                 'Status': '✅ Loaded',
-                'Records': f"{len(validators)} validators"
+                'Records': f"{performance_columns.rows} validators"
             })
         except Exception as e:
             data_files_info.append({
@@ -2514,7 +2160,7 @@ def create_raw_data_tab(cache, operator_validators, operator_exited, ens_names):
                 'Size (MB)': 'Unknown',
                 'Last Modified': 'Unknown',
                 'Status': '✅ Loaded',
-                'Records': f"{len(performance_content.get('validators', {}))} validators"
+                'Records': f"{performance_columns.rows} validators"
             })
     else:
         data_files_info.append({
@@ -2621,6 +2267,44 @@ def create_raw_data_tab(cache, operator_validators, operator_exited, ens_names):
         </div>
     """.format(total_size, loaded_files, status), unsafe_allow_html=True)
     
+    # Background reload metrics
+    reload_metrics = data_reloader.get_metrics()
+    if reload_metrics:
+        st.markdown("#### 🔄 Background Reloads")
+        st.caption(f"Changed data files are re-parsed in the background ({data_reloader.mode}) and swapped in atomically")
+        
+        reload_data = []
+        for name, metrics in sorted(reload_metrics.items()):
+            swap_latency = metrics.get('swap_latency_seconds')
+            reload_data.append({
+                'Dataset': name,
+                'Reloads': metrics['reloads'],
+                'Generation': metrics['generation'],
+                'Parse Time (s)': f"{metrics['parse_seconds']:.3f}",
+                'Swap Latency (s)': f"{swap_latency:.1f}" if swap_latency is not None else 'N/A',
+                'Last Swap': datetime.fromtimestamp(metrics['last_swap']).strftime('%Y-%m-%d %H:%M:%S')
+            })
+        
+        st.dataframe(pd.DataFrame(reload_data), use_container_width=True, hide_index=True)
+    
+    # Startup prefetch timings
+    prefetch_timings = data_store.prefetch_timings
+    if prefetch_timings:
+        st.markdown("#### 🚀 Startup Prefetch")
+        st.caption("All data files are parsed in parallel threads when the dashboard starts")
+        
+        prefetch_data = []
+        for name, timing in sorted(prefetch_timings.items(), key=lambda item: -item[1]['seconds']):
+            prefetch_data.append({
+                'Dataset': name,
+                'File': timing['path'] or 'Not found',
+                'Size (MB)': f"{timing['bytes'] / (1024 * 1024):.2f}",
+                'Parse Time (s)': f"{timing['seconds']:.3f}",
+                'Worker': timing['worker']
+            })
+        
+        st.dataframe(pd.DataFrame(prefetch_data), use_container_width=True, hide_index=True)
+    
     st.markdown("---")
     
     # Detailed Cache Data Section
@@ -2746,22 +2430,25 @@ def create_raw_data_tab(cache, operator_validators, operator_exited, ens_names):
 
     with tab6:
         if performance_cache[0] is not None:
-            performance_content, _ = performance_cache
+            performance_columns, performance_file = performance_cache
             st.markdown("**Validator Performance Data Summary**")
             
             col1, col2 = st.columns(2)
             with col1:
-                validators = performance_content.get('validators', {})
                 summary = {
-                    "total_validators": len(validators),
-                    "last_updated": performance_content.get('last_updated', 'Unknown'),
-                    "data_keys": list(performance_content.keys())
+                    "total_validators": performance_columns.rows,
+                    "last_updated": performance_columns.last_updated or 'Unknown',
+                    "columns": list(PERFORMANCE_COLUMNS)
                 }
                 st.json(summary)
             
             with col2:
                 if st.button("🔄 Show Full Validator Performance Data", key="show_performance_data"):
-                    st.json(performance_content)
+                    # Only the columns are kept in memory, so the file is read for this view alone
+                    try:
+                        st.json(read_json_file(performance_file))
+                    except (OSError, ValueError) as e:
+                        st.error(f"❌ Could not read {performance_file}: {e}")
         else:
             st.info("❌ Validator performance data not loaded")
 
@@ -2811,9 +2498,6 @@ def create_raw_data_tab(cache, operator_validators, operator_exited, ens_names):
             ens_df = pd.DataFrame(ens_data)
             ens_df = ens_df.sort_values('Active Validators', ascending=False)
 
-            ens_df['Active Validators'] = ens_df['Active Validators'].astype(str)
-            ens_df['Total Validators'] = ens_df['Total Validators'].astype(str)
-
             st.dataframe(
                 ens_df,
                 use_container_width=True,
@@ -2821,17 +2505,16 @@ def create_raw_data_tab(cache, operator_validators, operator_exited, ens_names):
                 column_config={
                     "ENS / Discord Name": st.column_config.TextColumn("ENS / Discord Name", width="small"),
                     "Address": st.column_config.TextColumn("Address", width="large"),
-                    "Active Validators": st.column_config.TextColumn("Active Validators", width="small"),
-                    "Total Validators": st.column_config.TextColumn("Total Validators", width="small")
+                    "Active Validators": number_column("Active Validators"),
+                    "Total Validators": number_column("Total Validators")
                 }
             )
 
-            ens_csv = ens_df.to_csv(index=False)
-            st.download_button(
+            export_button(
                 label="📥 Download ENS Data",
-                data=ens_csv,
-                file_name=f"nodeset_ens_names_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                mime="text/csv"
+                build=ens_df,
+                name="nodeset_ens_names",
+                file_name=f"nodeset_ens_names_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
             )
 
 
@@ -1,151 +1,61 @@
 import streamlit as st
-import json
 import os
 import base64
 from datetime import datetime
-from config import CACHE_FILES, PROPOSALS_FILES, MEV_FILES, DARK_LOGO_PATH, LIGHT_LOGO_PATH
+from config import DARK_LOGO_PATH, LIGHT_LOGO_PATH
+from data_store import data_store
+from performance_store import load_performance_columns
+
+# Parsed data is shared process-wide through data_store; every caller receives the
+# same read-only snapshot instead of a per-call copy.
+
+def _show_load_errors(snapshot):
+    """Surface file parse errors for datasets whose failures are shown in the UI"""
+    for path, error in snapshot.errors:
+        st.error(f"⚠ Error loading {path}: {error}")
 
-@st.cache_data(ttl=900)  # 15 minutes - matches backend update frequency
 def load_validator_data():
     """Load validator data from cache file"""
-    for cache_file in CACHE_FILES:
-        if os.path.exists(cache_file):
-            try:
-                with open(cache_file, 'r') as f:
-                    cache = json.load(f)
-                return cache, cache_file
-            except Exception as e:
-                st.error(f"⚠ Error loading {cache_file}: {str(e)}")
-    
-    return None, None
+    snapshot = data_store.get('validator_data')
+    _show_load_errors(snapshot)
+    return snapshot.data, snapshot.path
 
-@st.cache_data(ttl=900)  # 15 minutes - matches backend update frequency
 def load_proposals_data():
     """Load proposals data from JSON file"""
-    for proposals_file in PROPOSALS_FILES:
-        if os.path.exists(proposals_file):
-            try:
-                with open(proposals_file, 'r') as f:
-                    data = json.load(f)
-                return data, proposals_file
-            except Exception as e:
-                st.error(f"⚠ Error loading {proposals_file}: {str(e)}")
-    
-    return None, None
+    snapshot = data_store.get('proposals')
+    _show_load_errors(snapshot)
+    return snapshot.data, snapshot.path
 
-@st.cache_data(ttl=900)  # 15 minutes
 def load_missed_proposals_data():
     """Load missed proposals data from JSON file"""
-    possible_paths = [
-        './missed_proposals_cache.json',
-        './data/missed_proposals_cache.json'
-    ]
-    
-    for path in possible_paths:
-        try:
-            if os.path.exists(path):
-                with open(path, 'r') as f:
-                    data = json.load(f)
-                return data, path
-        except Exception as e:
-            print(f"Error loading missed proposals data from {path}: {e}")
-            continue
-    
-    return None, None
+    snapshot = data_store.get('missed_proposals')
+    return snapshot.data, snapshot.path
 
-@st.cache_data(ttl=900)  # 15 minutes
 def load_mev_analysis_data():
     """Load MEV relay analysis data for gas limit analysis"""
-    for mev_file in MEV_FILES:
-        if os.path.exists(mev_file):
-            try:
-                with open(mev_file, 'r') as f:
-                    data = json.load(f)
-                return data, mev_file
-            except Exception as e:
-                st.error(f"⚠ Error loading {mev_file}: {str(e)}")
-    
-    return None, None
+    snapshot = data_store.get('mev_analysis')
+    _show_load_errors(snapshot)
+    return snapshot.data, snapshot.path
 
-@st.cache_data(ttl=900)  # 15 minutes
 def load_sync_committee_data():
     """Load sync committee participation data from JSON file"""
-    possible_paths = [
-        './sync_committee_participation.json',
-        './data/sync_committee_participation.json'
-    ]
-    
-    for path in possible_paths:
-        try:
-            if os.path.exists(path):
-                with open(path, 'r') as f:
-                    data = json.load(f)
-                return data, path
-        except Exception as e:
-            print(f"Error loading sync committee data from {path}: {e}")
-            continue
-    
-    return None, None
+    snapshot = data_store.get('sync_committee')
+    return snapshot.data, snapshot.path
 
-@st.cache_data(ttl=1800)  # 30 minutes - exit data changes less frequently
 def load_exit_data():
     """Load exit analysis data from JSON file"""
-    possible_paths = [
-        './dashboard_exit_data.json',
-        './data/dashboard_exit_data.json'
-    ]
-    
-    for path in possible_paths:
-        try:
-            if os.path.exists(path):
-                with open(path, 'r') as f:
-                    data = json.load(f)
-                return data, path
-        except Exception as e:
-            print(f"Error loading exit data from {path}: {e}")
-            continue
-    
-    return None, None
+    snapshot = data_store.get('exit_data')
+    return snapshot.data, snapshot.path
 
-@st.cache_data(ttl=1800)  # 30 minutes - performance data changes slowly
 def load_validator_performance_data():
-    """Load validator performance cache data from JSON file"""
-    possible_paths = [
-        './validator_performance_cache.json',
-        './data/validator_performance_cache.json'
-    ]
-    
-    for path in possible_paths:
-        try:
-            if os.path.exists(path):
-                with open(path, 'r') as f:
-                    data = json.load(f)
-                return data, path
-        except Exception as e:
-            print(f"Error loading validator performance data from {path}: {e}")
-            continue
-    
-    return None, None
+    """Load the columnar validator performance data (see performance_store) and the JSON file it came from"""
+    columns = load_performance_columns()
+    return columns, columns.source if columns is not None else None
 
-@st.cache_data(ttl=3600)  # 1 hour - ENS names rarely change
 def load_ens_names():
     """Load ENS names mapping from JSON file"""
-    possible_paths = [
-        './manual_ens_names.json',
-        './data/manual_ens_names.json'
-    ]
-    
-    for path in possible_paths:
-        try:
-            if os.path.exists(path):
-                with open(path, 'r') as f:
-                    data = json.load(f)
-                return data
-        except Exception as e:
-            print(f"Error loading ENS names from {path}: {e}")
-            continue
-    
-    return {}
+    snapshot = data_store.get('ens_names')
+    return snapshot.data if snapshot.data is not None else {}
 
 def get_base64_image(image_path):
     """Convert image to base64 string for embedding in HTML"""
@@ -0,0 +1,186 @@
+"""
+Background reloader that keeps data_store snapshots warm.
+
+On start a daemon thread prefetches every dataset in parallel, without
+holding up the caller: readers only wait for the datasets they use. It then
+watches the data directories (inotify through watchdog when it
+is installed, plain polling otherwise), re-parses datasets whose files changed
+and swaps the new snapshot in atomically. Page reruns and API calls keep
+reading the previous snapshot until the new one is ready.
+"""
+import os
+import threading
+import time
+from config import DATA_RELOAD_POLL_INTERVAL, DATA_RELOAD_SETTLE_DELAY
+from data_store import data_store
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # optional - fall back to polling
+    FileSystemEventHandler = object
+    Observer = None
+
+
+class _DataFileHandler(FileSystemEventHandler):
+    """Forwards file-system events for data files to the reloader"""
+
+    def __init__(self, reloader):
+        self.reloader = reloader
+
+    def on_any_event(self, event):
+        self.reloader.notify([event.src_path, getattr(event, 'dest_path', None)])
+
+
+class DataReloader:
+    """Re-parses changed datasets in a background thread and records reload metrics"""
+
+    def __init__(self, store, poll_interval=DATA_RELOAD_POLL_INTERVAL, settle_delay=DATA_RELOAD_SETTLE_DELAY):
+        self.store = store
+        self.poll_interval = poll_interval
+        self.settle_delay = settle_delay
+        self.mode = None
+        self._thread = None
+        self._observer = None
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._ready = threading.Event()
+        self._pending = set()
+        self._metrics = {}
+
+        # Absolute path of every candidate file -> dataset name
+        self._watched = {}
+        for name, dataset in store.datasets.items():
+            for path in dataset['files']:
+                self._watched[os.path.abspath(path)] = name
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, wait=False):
+        """Start prefetching, watching and reloading; safe to call on every rerun.
+
+        With wait=True the call returns once the prefetch has finished.
+        """
+        with self._lock:
+            started = not self.running
+            if started:
+                self._stop.clear()
+                self._ready.clear()
+                self.mode = 'inotify' if self._start_observer() else 'polling'
+                self._thread = threading.Thread(target=self._run, name='data-reloader', daemon=True)
+                self._thread.start()
+                self.store.background_refresh = True
+        if wait:
+            self._ready.wait()
+        return started
+
+    def stop(self):
+        """Stop the reloader; data_store goes back to checking files on access"""
+        with self._lock:
+            self.store.background_refresh = False
+            self._stop.set()
+            self._wake.set()
+            if self._observer is not None:
+                self._observer.stop()
+                self._observer = None
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join(timeout=5)
+
+    def notify(self, paths):
+        """Mark datasets as changed for the given file paths and wake the reload thread"""
+        names = {self._watched.get(os.path.abspath(path)) for path in paths if path}
+        names.discard(None)
+        if names:
+            with self._lock:
+                self._pending.update(names)
+            self._wake.set()
+
+    def get_metrics(self):
+        """Per-dataset reload metrics: parse duration, swap latency and reload counts"""
+        with self._lock:
+            return {name: dict(metrics) for name, metrics in self._metrics.items()}
+
+    def _start_observer(self):
+        if Observer is None:
+            return False
+        try:
+            observer = Observer()
+            handler = _DataFileHandler(self)
+            for directory in sorted({os.path.dirname(path) for path in self._watched}):
+                if os.path.isdir(directory):
+                    observer.schedule(handler, directory, recursive=False)
+            observer.daemon = True
+            observer.start()
+        except Exception as e:
+            print(f"File watching unavailable, polling data files instead: {e}")
+            return False
+        self._observer = observer
+        return True
+
+    def _run(self):
+        try:
+            # Every dataset in parallel, so the first render only waits for the files it reads
+            self.store.prefetch()
+        except Exception as e:
+            print(f"Data prefetch failed: {e}")
+        finally:
+            self._ready.set()
+        for snapshot in self.store.snapshots().values():
+            self._record_swap(snapshot.name, snapshot, startup=True)
+
+        while not self._stop.is_set():
+            triggered = self._wake.wait(self.poll_interval)
+            if self._stop.is_set():
+                break
+            if triggered:
+                # Give the tracker time to finish writing before parsing
+                time.sleep(self.settle_delay)
+                self._wake.clear()
+                with self._lock:
+                    names, self._pending = self._pending, set()
+            else:
+                names = list(self.store.datasets)
+            self._revalidate(names)
+
+    def _revalidate(self, names):
+        for name in names:
+            # Evicted under memory pressure - leave it to be parsed on next use
+            if name not in self.store.snapshots():
+                continue
+            try:
+                before = self.store.snapshots().get(name)
+                self.store.refresh([name])
+                after = self.store.snapshots().get(name)
+            except Exception as e:
+                print(f"Background reload of {name} failed: {e}")
+                continue
+
+            if after is None or (before is not None and after.generation == before.generation):
+                continue
+            self._record_swap(name, after)
+
+    def _record_swap(self, name, snapshot, startup=False):
+        # Swap latency: time from the file being written to the new snapshot being served
+        signature = snapshot.signature
+        swap_latency = time.time() - signature.mtime_ns / 1e9 if signature and not startup else None
+
+        with self._lock:
+            metrics = self._metrics.setdefault(name, {'reloads': 0})
+            metrics['reloads'] += 1
+            metrics['generation'] = snapshot.generation
+            metrics['parse_seconds'] = snapshot.parse_seconds
+            metrics['swap_latency_seconds'] = swap_latency
+            metrics['last_swap'] = snapshot.loaded_at
+
+
+# Global instance
+data_reloader = DataReloader(data_store)
+
+
+def start_background_reloader(wait=False):
+    """Start the global background reloader if it is not already running"""
+    return data_reloader.start(wait)
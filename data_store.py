@@ -0,0 +1,269 @@
+"""
+Process-wide store of parsed dashboard data files.
+
+Each dataset is parsed once per data generation and the resulting snapshot is
+shared, read-only, by every Streamlit session and API caller in the process.
+A new generation starts only when the dataset's file actually changes, judged
+by (path, mtime, size) and, when those differ, a hash of the file contents.
+Datasets registered with 'resident': False are tracked the same way but never
+parsed: their snapshots carry the path, signature and generation with data None.
+"""
+import hashlib
+import itertools
+import json
+import os
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from config import DATASETS, DATA_FRESHNESS_CHECK_INTERVAL, DATA_CONTENT_HASH, DATA_PREFETCH_WORKERS
+from metrics import DATA_PARSE_SECONDS, DATA_READ_BYTES, record_cache
+
+try:
+    import xxhash
+except ImportError:  # optional - content hashing falls back to hashlib
+    xxhash = None
+
+
+# A parsed dataset: frozen data, the file it came from, and the generation it belongs to
+Snapshot = namedtuple('Snapshot', ['name', 'data', 'path', 'generation', 'loaded_at', 'errors', 'signature',
+                                   'parse_seconds'])
+
+# Identity of a data file on disk; digest is only filled in when content hashing is enabled
+FileSignature = namedtuple('FileSignature', ['path', 'mtime_ns', 'size', 'digest'])
+
+
+def _read_only(self, *args, **kwargs):
+    raise TypeError(f"'{type(self).__name__}' is a shared read-only snapshot; copy it before modifying")
+
+
+class FrozenDict(dict):
+    """dict that refuses mutation; copies (copy, deepcopy, pickle) are plain dicts"""
+    __slots__ = ()
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        return (dict, (dict(self),))
+
+
+class FrozenList(list):
+    """list that refuses mutation; copies (copy, deepcopy, pickle) are plain lists"""
+    __slots__ = ()
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = pop = remove = clear = sort = reverse = _read_only
+
+    def __reduce__(self):
+        return (list, (list(self),))
+
+
+def freeze(obj):
+    """Recursively convert parsed JSON into FrozenDict / FrozenList containers"""
+    if isinstance(obj, dict):
+        return FrozenDict((key, freeze(value)) for key, value in obj.items())
+    if isinstance(obj, list):
+        return FrozenList(freeze(value) for value in obj)
+    return obj
+
+
+def file_digest(path):
+    """Hash file contents with xxhash when installed, blake2b otherwise"""
+    hasher = xxhash.xxh3_64() if xxhash is not None else hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def file_signature(path):
+    """Stat-based signature of a file, or None when it does not exist"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return FileSignature(path, stat.st_mtime_ns, stat.st_size, None)
+
+
+def read_json_file(path):
+    """Parse a JSON data file into plain dicts and lists"""
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def parse_json_file(path):
+    """Parse a JSON data file into a frozen structure"""
+    return freeze(read_json_file(path))
+
+
+class DataStore:
+    """Holds one shared snapshot per registered dataset"""
+
+    def __init__(self, datasets=None, check_interval=DATA_FRESHNESS_CHECK_INTERVAL,
+                 content_hash=DATA_CONTENT_HASH):
+        self.datasets = datasets if datasets is not None else DATASETS
+        self.check_interval = check_interval
+        self.content_hash = content_hash
+        self._snapshots = {}
+        self._checked_at = {}
+        self._last_access = {}
+        self._locks = {name: threading.Lock() for name in self.datasets}
+        self._generations = itertools.count(1)
+        self.prefetch_timings = {}
+        # Set by data_reloader while it keeps snapshots fresh in the background
+        self.background_refresh = False
+
+    def get(self, name):
+        """Return the current snapshot for a dataset, re-parsing only when its file changed"""
+        self._last_access[name] = time.monotonic()
+        snapshot = self._snapshots.get(name)
+        # With a background reloader running, serve the current snapshot (stale-while-revalidate)
+        if snapshot is not None and (self.background_refresh or not self._check_due(name)):
+            record_cache('data_store', True)
+            return snapshot
+
+        # One check/parse per dataset at a time; other callers wait and reuse the result
+        with self._locks[name]:
+            before = self._snapshots.get(name)
+            snapshot = before
+            if snapshot is None or self._check_due(name):
+                snapshot = self._refresh_locked(name, snapshot)
+        record_cache('data_store', before is not None and snapshot.generation == before.generation)
+        return snapshot
+
+    def refresh(self, names=None):
+        """Check loaded datasets against their files now; returns the names that were re-parsed"""
+        changed = []
+        for name in (names if names is not None else list(self._snapshots)):
+            with self._locks[name]:
+                before = self._snapshots.get(name)
+                after = self._refresh_locked(name, before)
+            if before is None or after.generation != before.generation:
+                changed.append(name)
+        return changed
+
+    def prefetch(self, names=None, max_workers=DATA_PREFETCH_WORKERS):
+        """Parse datasets in parallel threads and return per-file timings.
+
+        Readers of a dataset that is still being parsed wait on its lock and
+        reuse the result, so only the datasets a rerun reads hold it up.
+        """
+        names = list(names if names is not None else self.datasets)
+        if not names:
+            return {}
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max_workers or len(names), thread_name_prefix='prefetch') as threads:
+            futures = {name: threads.submit(self._prefetch_one, name) for name in names}
+            timings = {name: future.result() for name, future in futures.items()}
+
+        total_seconds = time.perf_counter() - started
+        self.prefetch_timings = timings
+        slowest = max(timings, key=lambda name: timings[name]['seconds'])
+        print(f"Prefetched {len(timings)} datasets in {total_seconds:.3f}s "
+              f"(slowest: {slowest} {timings[slowest]['seconds']:.3f}s)")
+        return timings
+
+    def _prefetch_one(self, name):
+        with self._locks[name]:
+            before = self._snapshots.get(name)
+            snapshot = self._refresh_locked(name, before)
+
+        reused = before is not None and snapshot.generation == before.generation
+        return {
+            'path': snapshot.path,
+            'bytes': snapshot.signature.size if snapshot.signature else 0,
+            'seconds': 0.0 if reused else snapshot.parse_seconds,
+            'worker': 'cached' if reused else 'thread'
+        }
+
+    def generation(self, name=None):
+        """Generation of one dataset, or a tuple covering every loaded dataset"""
+        if name is not None:
+            snapshot = self._snapshots.get(name)
+            return snapshot.generation if snapshot else 0
+        return tuple(self.generation(dataset) for dataset in self.datasets)
+
+    def clear(self, name=None):
+        """Drop cached snapshots so the next access re-parses"""
+        names = [name] if name is not None else list(self.datasets)
+        for dataset in names:
+            self._snapshots.pop(dataset, None)
+            self._checked_at.pop(dataset, None)
+
+    def last_access(self, name):
+        """time.monotonic() of the last get() for a dataset, or None if it was never read"""
+        return self._last_access.get(name)
+
+    def snapshots(self):
+        """Currently held snapshots keyed by dataset name"""
+        return dict(self._snapshots)
+
+    def resolve_path(self, name):
+        """First existing candidate file for a dataset"""
+        for path in self.datasets[name]['files']:
+            if os.path.exists(path):
+                return path
+        return None
+
+    def _check_due(self, name):
+        return time.monotonic() - self._checked_at.get(name, float('-inf')) >= self.check_interval
+
+    def _refresh_locked(self, name, snapshot, parser=parse_json_file):
+        self._checked_at[name] = time.monotonic()
+        path = self.resolve_path(name)
+        signature = file_signature(path) if path else None
+
+        if snapshot is not None:
+            unchanged, current = self._compare_signatures(snapshot.signature, signature)
+            if unchanged:
+                if current != snapshot.signature:
+                    snapshot = snapshot._replace(signature=current)
+                    self._snapshots[name] = snapshot
+                return snapshot
+
+        snapshot = self._load(name, signature, parser)
+        self._snapshots[name] = snapshot
+        return snapshot
+
+    def _compare_signatures(self, old, new):
+        """Return (unchanged, signature to keep) for a previously loaded and a current file signature"""
+        if old is None or new is None:
+            return old == new, old
+        if old[:3] == new[:3]:
+            return True, old
+        # Rewritten with the same size - compare contents before paying for a parse
+        if self.content_hash and old.digest and old.path == new.path and old.size == new.size:
+            digest = file_digest(new.path)
+            if digest == old.digest:
+                return True, new._replace(digest=digest)
+        return False, new
+
+    def _load(self, name, signature, parser=parse_json_file):
+        if not self.datasets[name].get('resident', True):
+            # Only the file's identity is kept; its readers parse it
+            parser = lambda path: None
+        if signature is not None and self.content_hash:
+            signature = signature._replace(digest=file_digest(signature.path))
+
+        errors = []
+        started = time.perf_counter()
+        for path in self.datasets[name]['files']:
+            if not os.path.exists(path):
+                continue
+            try:
+                data = parser(path)
+                parse_seconds = time.perf_counter() - started
+                DATA_PARSE_SECONDS.observe(parse_seconds, dataset=name)
+                DATA_READ_BYTES.observe(os.path.getsize(path), dataset=name)
+                return Snapshot(name, data, path, next(self._generations), time.time(), (), signature,
+                                parse_seconds)
+            except Exception as e:
+                print(f"Error loading {name} data from {path}: {e}")
+                errors.append((path, str(e)))
+
+        return Snapshot(name, None, None, next(self._generations), time.time(), tuple(errors), signature,
+                        time.perf_counter() - started)
+
+
+# Global instance
+data_store = DataStore()
@@ -0,0 +1,131 @@
+"""
+Index of block proposal and sync committee duties by validator.
+
+Built once per proposals / sync committee data generation. Each validator's
+duty timestamps are kept sorted, and validators are also ordered by their most
+recent duty, so "validators with duties since T" is a single searchsorted
+instead of a rescan of the proposals list and sync committee stats.
+"""
+import threading
+import numpy as np
+from data_loader import load_proposals_data, load_sync_committee_data
+from memory_manager import TIER_INDEX, memory_manager
+from memory_report import register_cache
+from metrics import record_cache
+
+# Ethereum beacon chain genesis time: December 1, 2020, 12:00:23 UTC
+GENESIS_TIME = 1606824023
+SECONDS_PER_SLOT = 12
+
+
+def slot_to_timestamp(slot):
+    """Unix timestamp of a beacon chain slot (works on scalars and NumPy arrays)"""
+    return GENESIS_TIME + slot * SECONDS_PER_SLOT
+
+
+class DutyIndex:
+    """Sorted duty timestamps per validator_index"""
+
+    def __init__(self, validator_indices, timestamps):
+        validator_indices = np.asarray(validator_indices, dtype='int64')
+        timestamps = np.asarray(timestamps, dtype='int64')
+
+        # Group by validator, timestamps ascending within each validator
+        order = np.lexsort((timestamps, validator_indices))
+        self._timestamps = timestamps[order]
+        self.validators, starts = np.unique(validator_indices[order], return_index=True)
+        self._offsets = np.append(starts, len(order))
+
+        # Validators ordered by their latest duty, for "since T" lookups
+        last_duty = self._timestamps[self._offsets[1:] - 1] if len(self.validators) else self._timestamps[:0]
+        by_last_duty = np.argsort(last_duty, kind='stable')
+        self._last_duty = last_duty[by_last_duty]
+        self._validators_by_last_duty = self.validators[by_last_duty]
+
+        # All duties ordered by time, for bounded windows
+        by_time = np.argsort(timestamps, kind='stable')
+        self._duty_times = timestamps[by_time]
+        self._duty_validators = validator_indices[by_time]
+
+    def __len__(self):
+        return len(self._timestamps)
+
+    def duties(self, validator_index):
+        """Sorted duty timestamps of one validator (empty when it has none)"""
+        position = np.searchsorted(self.validators, validator_index)
+        if position == len(self.validators) or self.validators[position] != validator_index:
+            return self._timestamps[:0]
+        return self._timestamps[self._offsets[position]:self._offsets[position + 1]]
+
+    def validators_since(self, since):
+        """Validator indices with at least one duty at or after the since timestamp"""
+        return self._validators_by_last_duty[np.searchsorted(self._last_duty, since, side='left'):]
+
+    def validators_between(self, since, until):
+        """Validator indices with at least one duty in [since, until]"""
+        start = np.searchsorted(self._duty_times, since, side='left')
+        end = np.searchsorted(self._duty_times, until, side='right')
+        return np.unique(self._duty_validators[start:end])
+
+
+def build_duty_index(proposals_data, sync_committee_data):
+    """Index proposals (block timestamp) and sync committee periods (end slot) by validator"""
+    validator_indices = []
+    timestamps = []
+
+    for proposal in (proposals_data or {}).get('proposals', []):
+        validator_index = proposal.get('validator_index')
+        if validator_index:
+            validator_indices.append(validator_index)
+            timestamps.append(proposal.get('timestamp') or 0)
+
+    # A sync committee period counts up to its last slot
+    for sync_entry in (sync_committee_data or {}).get('detailed_stats', []):
+        validator_index = sync_entry.get('validator_index')
+        if validator_index:
+            validator_indices.append(validator_index)
+            timestamps.append(slot_to_timestamp(sync_entry.get('end_slot') or 0))
+
+    return DutyIndex(validator_indices, timestamps)
+
+
+_lock = threading.Lock()
+_current = (None, None, None)
+# Only the index is owned here; the data it was built from belongs to data_store
+register_cache('duty_index', lambda: _current[2])
+
+
+def _evict():
+    global _current
+    with _lock:
+        _current = (None, None, None)
+
+
+memory_manager.register('duty_index', _evict, TIER_INDEX)
+
+
+def get_duty_index(proposals_data=None, sync_committee_data=None):
+    """Duty index for the current data, or for the given data when both are passed.
+
+    Snapshots are shared and read-only, so a new data generation is a new object
+    and the index is rebuilt only when either input object changes.
+    """
+    global _current
+    if proposals_data is None and sync_committee_data is None:
+        proposals_data, _ = load_proposals_data()
+        sync_committee_data, _ = load_sync_committee_data()
+    memory_manager.touch('duty_index')
+
+    cached_proposals, cached_sync, index = _current
+    if index is not None and cached_proposals is proposals_data and cached_sync is sync_committee_data:
+        record_cache('duty_index', True)
+        return index
+
+    with _lock:
+        cached_proposals, cached_sync, index = _current
+        stale = index is None or cached_proposals is not proposals_data or cached_sync is not sync_committee_data
+        record_cache('duty_index', not stale)
+        if stale:
+            index = build_duty_index(proposals_data, sync_committee_data)
+            _current = (proposals_data, sync_committee_data, index)
+        return index
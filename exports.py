@@ -0,0 +1,137 @@
+"""
+On-demand file exports for the dashboard's download buttons.
+
+Download buttons are given a callable instead of file contents, so a table
+is only serialized when someone clicks (Streamlit 1.52+; older releases
+serialize while the page is built). Serialized files are kept in a small
+LRU keyed by export name, data generation and format, so repeated downloads
+of the same table reuse the bytes until the data files change. CSV and NDJSON
+are always available; Parquet needs pyarrow.
+"""
+import io
+import threading
+from collections import OrderedDict
+import pandas as pd
+import streamlit as st
+from config import EXPORT_CACHE_SIZE, EXPORT_FORMAT_KEY
+from data_store import data_store
+from memory_manager import TIER_DERIVED, memory_manager
+from memory_report import register_cache
+from metrics import record_cache
+from utils import streamlit_version_at_least
+
+try:
+    import pyarrow  # noqa: F401 - Parquet engine for DataFrame.to_parquet
+    PARQUET_AVAILABLE = True
+except ImportError:  # optional - Parquet downloads are hidden without it
+    PARQUET_AVAILABLE = False
+
+# Streamlit 1.52+ runs a callable download_button data argument on click; older
+# releases need the file contents while the page is built
+DEFERRED_DOWNLOADS = streamlit_version_at_least(1, 52)
+
+# Format -> (label, file extension, MIME type)
+FORMATS = {
+    'csv': ('CSV', '.csv', 'text/csv'),
+    'ndjson': ('NDJSON', '.ndjson', 'application/x-ndjson'),
+    'parquet': ('Parquet', '.parquet', 'application/vnd.apache.parquet'),
+}
+
+
+def available_formats():
+    return [fmt for fmt in FORMATS if fmt != 'parquet' or PARQUET_AVAILABLE]
+
+
+def serialize(frame, fmt):
+    """File contents of a DataFrame in one of FORMATS"""
+    if fmt == 'csv':
+        return frame.to_csv(index=False)
+    if fmt == 'ndjson':
+        return frame.to_json(orient='records', lines=True, date_format='iso')
+    if fmt == 'parquet':
+        buffer = io.BytesIO()
+        # Mixed-type object columns (formatted values next to numbers) are written as text
+        frame.astype({column: str for column in frame.columns if frame[column].dtype == object}) \
+             .to_parquet(buffer, index=False)
+        return buffer.getvalue()
+    raise ValueError(f"Unknown export format: {fmt}")
+
+
+_lock = threading.Lock()
+_files = OrderedDict()
+register_cache('exports', lambda: list(_files.values()))
+
+
+def _evict():
+    with _lock:
+        _files.clear()
+
+
+memory_manager.register('exports', _evict, TIER_DERIVED)
+
+
+def export_file(name, build, fmt, generation=None):
+    """Serialized export, cached per (name, data generation, format).
+
+    build is the DataFrame or a callable returning it; it is only called on a
+    cache miss. name must identify the content for a given data generation.
+    """
+    key = (name, generation if generation is not None else data_store.generation(), fmt)
+    memory_manager.touch('exports')
+    with _lock:
+        contents = _files.get(key)
+        if contents is not None:
+            _files.move_to_end(key)
+    record_cache('exports', contents is not None)
+    if contents is not None:
+        return contents
+
+    frame = build() if callable(build) else build
+    contents = serialize(frame if frame is not None else pd.DataFrame(), fmt)
+    with _lock:
+        _files[key] = contents
+        while len(_files) > EXPORT_CACHE_SIZE:
+            _files.popitem(last=False)
+    return contents
+
+
+def selected_format():
+    """Format chosen with export_format_selector(), CSV by default"""
+    fmt = st.session_state.get(EXPORT_FORMAT_KEY, 'csv')
+    return fmt if fmt in available_formats() else 'csv'
+
+
+def export_format_selector():
+    """Choice of the file format every export button downloads, under the refresh button"""
+    _, format_col = st.columns([3, 1])
+    with format_col:
+        st.selectbox("📥 Download format", available_formats(), key=EXPORT_FORMAT_KEY,
+                     format_func=lambda fmt: FORMATS[fmt][0],
+                     help="File format of every download button on the dashboard")
+
+
+def export_button(label, build, name, file_name, **button_kwargs):
+    """Download button that serializes build (a DataFrame or a callable returning one) on click.
+
+    file_name is given without an extension; the selected format adds it.
+    """
+    fmt = selected_format()
+    _, extension, mime = FORMATS[fmt]
+    # Captured now so the click serializes the data this rerun displayed
+    generation = data_store.generation()
+
+    def contents():
+        # Errors propagate so a failed export is reported as a failed download, not an empty file
+        return export_file(name, build, fmt, generation)
+
+    if DEFERRED_DOWNLOADS:
+        data = contents
+    else:
+        try:
+            data = contents()
+        except Exception as e:
+            st.error(f"❌ Could not prepare {file_name}{extension}: {e}")
+            return False
+
+    return st.download_button(label=label, data=data, file_name=f"{file_name}{extension}", mime=mime,
+                              **button_kwargs)
@@ -0,0 +1,95 @@
+"""
+Shared cache of the Plotly figures built by charts.py.
+
+Chart inputs only change when a data file does, so a builder's figures are
+serialized to JSON once per data generation and set of arguments, kept in an
+LRU shared by every session, and loaded from the JSON on later reruns instead
+of rebuilding the DataFrames and running Plotly Express again. Arguments that
+are data snapshots (FrozenDict / FrozenList) are keyed by identity, since a
+snapshot never changes within a generation; other arguments by their pickle.
+"""
+import hashlib
+import io
+import pickle
+import threading
+from collections import OrderedDict
+from functools import wraps
+import plotly.io as pio
+from config import FIGURE_CACHE_SIZE
+from data_store import FrozenDict, FrozenList, data_store
+from memory_manager import TIER_DERIVED, memory_manager
+from memory_report import register_cache
+from metrics import record_cache
+
+_MISSING = object()
+
+
+class _ArgumentPickler(pickle.Pickler):
+    def persistent_id(self, obj):
+        # Snapshot data is shared and read-only for a whole generation, so its identity is enough
+        if isinstance(obj, (FrozenDict, FrozenList)):
+            return id(obj)
+        return None
+
+
+def arguments_key(args, kwargs):
+    """Digest of a builder's arguments"""
+    buffer = io.BytesIO()
+    _ArgumentPickler(buffer, protocol=pickle.HIGHEST_PROTOCOL).dump((args, sorted(kwargs.items())))
+    return hashlib.blake2b(buffer.getvalue(), digest_size=16).digest()
+
+
+def _dump(result):
+    """Figure JSON of a builder result (a figure, None, or a tuple of them)"""
+    if isinstance(result, tuple):
+        return tuple(_dump(item) for item in result)
+    return result.to_json() if result is not None else None
+
+
+def _load(stored):
+    if isinstance(stored, tuple):
+        return tuple(_load(item) for item in stored)
+    return pio.from_json(stored) if stored is not None else None
+
+
+_lock = threading.Lock()
+_figures = OrderedDict()
+register_cache('figures', lambda: list(_figures.values()))
+
+
+def _evict():
+    with _lock:
+        _figures.clear()
+
+
+memory_manager.register('figures', _evict, TIER_DERIVED)
+
+
+def cached_figures(builder):
+    """Decorator for chart builders: reuse their figures while the data and arguments are unchanged.
+
+    Every call returns new figure objects, so callers may still modify them.
+    """
+    @wraps(builder)
+    def wrapper(*args, **kwargs):
+        try:
+            key = (builder.__name__, data_store.generation(), arguments_key(args, kwargs))
+        except (pickle.PicklingError, TypeError, AttributeError):
+            # Arguments that cannot be pickled are never cached
+            return builder(*args, **kwargs)
+        memory_manager.touch('figures')
+        with _lock:
+            stored = _figures.get(key, _MISSING)
+            if stored is not _MISSING:
+                _figures.move_to_end(key)
+        record_cache('figures', stored is not _MISSING)
+        if stored is not _MISSING:
+            return _load(stored)
+
+        result = builder(*args, **kwargs)
+        with _lock:
+            _figures[key] = _dump(result)
+            while len(_figures) > FIGURE_CACHE_SIZE:
+                _figures.popitem(last=False)
+        return result
+    return wrapper
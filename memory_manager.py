@@ -0,0 +1,159 @@
+"""
+Memory-pressure eviction for the process-wide caches.
+
+RSS is sampled on page reruns and API requests (at most every
+MEMORY_CHECK_INTERVAL seconds). Once utils.should_clear_cache() reports the
+high-water mark, cached artifacts are dropped one at a time - derived results
+first, then indexes and columnar views, then idle datasets, least recently used
+first within each tier - until utils.is_memory_high() no longer holds or
+nothing evictable is left. CPython's allocator rarely hands freed memory back
+to the OS straight away, so progress is judged by the deep size
+(memory_report) of what was evicted rather than by the drop in RSS, and
+malloc_trim() is called where glibc provides it. data_store datasets are only
+candidates once no rerun has read them for MEMORY_DATASET_IDLE_SECONDS:
+evicting one the next rerun reads would re-parse it on the request path and
+start a new generation, invalidating every cache built from it. After a relief
+pass no other runs for MEMORY_RELIEF_COOLDOWN seconds. Everything evicted is
+rebuilt on its next use.
+"""
+import ctypes
+import gc
+import threading
+import time
+from collections import deque
+from config import (MEMORY_CHECK_INTERVAL, MEMORY_DATASET_IDLE_SECONDS, MEMORY_EVICTION_LOG_SIZE,
+                    MEMORY_RELIEF_COOLDOWN)
+from data_store import data_store
+from memory_report import cache_size, dataset_size
+from metrics import registry
+from utils import get_memory_usage, is_memory_high, should_clear_cache
+
+# Eviction order: cheapest to rebuild first
+TIER_DERIVED = 0  # results computed from indexes (rankings, responses, figures)
+TIER_INDEX = 1  # indexes and columnar views built from raw datasets
+TIER_DATASET = 2  # parsed data files, only once idle for MEMORY_DATASET_IDLE_SECONDS
+TIER_NAMES = {TIER_DERIVED: 'derived', TIER_INDEX: 'index', TIER_DATASET: 'dataset'}
+
+try:
+    _malloc_trim = ctypes.CDLL('libc.so.6').malloc_trim
+except (OSError, AttributeError):  # not glibc - freed memory stays with the allocator until reused
+    _malloc_trim = None
+
+MB = 1024 * 1024
+
+EVICTIONS = registry.counter(
+    'nodeset_cache_evictions_total', 'Caches dropped because of memory pressure', ['cache', 'tier'])
+
+
+class MemoryManager:
+    """Evicts registered caches and data_store datasets while memory is over the high-water mark"""
+
+    def __init__(self, store, check_interval=MEMORY_CHECK_INTERVAL, cooldown=MEMORY_RELIEF_COOLDOWN,
+                 dataset_idle_seconds=MEMORY_DATASET_IDLE_SECONDS,
+                 over_limit=should_clear_cache, relieved=lambda freed_mb: not is_memory_high(freed_mb)):
+        self.store = store
+        self.check_interval = check_interval
+        self.cooldown = cooldown
+        self.dataset_idle_seconds = dataset_idle_seconds
+        self.over_limit = over_limit
+        self.relieved = relieved
+        self.evictions = deque(maxlen=MEMORY_EVICTION_LOG_SIZE)
+        self._caches = {}
+        self._last_used = {}
+        self._last_check = float('-inf')
+        self._last_relief = float('-inf')
+        self._lock = threading.Lock()
+
+    def register(self, name, evict, tier=TIER_DERIVED):
+        """Make a cache evictable; evict() must drop everything it holds"""
+        self._caches[name] = (tier, evict)
+        self._last_used.setdefault(name, time.monotonic())
+
+    def touch(self, name):
+        """Mark a registered cache as used now (eviction is least recently used first)"""
+        self._last_used[name] = time.monotonic()
+
+    def clear(self):
+        """Drop every registered cache regardless of memory pressure (benchmarks use this for cold timings)"""
+        for name, (tier, evict) in list(self._caches.items()):
+            try:
+                evict()
+            except Exception as e:
+                print(f"Clearing {name} failed: {e}")
+
+    def check(self, force=False):
+        """Sample memory and evict if over the high-water mark; returns the evicted names"""
+        now = time.monotonic()
+        if not force and now - self._last_check < self.check_interval:
+            return []
+        # Only one thread samples and evicts; others carry on serving
+        if not self._lock.acquire(blocking=False):
+            return []
+        try:
+            self._last_check = now
+            # Hysteresis: memory freed by the last pass takes time to show up in RSS
+            if not force and now - self._last_relief < self.cooldown:
+                return []
+            if not self.over_limit():
+                return []
+            self._last_relief = now
+            return self._relieve()
+        finally:
+            self._lock.release()
+
+    def _candidates(self):
+        candidates = [(tier, self._last_used.get(name, 0), name, evict, lambda cache=name: cache_size(cache))
+                      for name, (tier, evict) in self._caches.items()]
+        # Datasets a rerun still reads would be re-parsed straight back
+        idle_before = time.monotonic() - self.dataset_idle_seconds
+        for name in self.store.snapshots():
+            last_access = self.store.last_access(name) or 0
+            if last_access < idle_before:
+                candidates.append((TIER_DATASET, last_access, f"dataset:{name}",
+                                   lambda dataset=name: self.store.clear(dataset),
+                                   lambda dataset=name: dataset_size(dataset)))
+        return sorted(candidates, key=lambda candidate: candidate[:2])
+
+    def _relieve(self):
+        evicted = []
+        freed_bytes = 0
+        for tier, last_used, name, evict, size in self._candidates():
+            rss_before, _ = get_memory_usage()
+            try:
+                # Measured before eviction; CPython may keep the memory, so RSS alone would show no progress
+                estimated_bytes = size()
+            except Exception as e:
+                print(f"Measuring {name} failed: {e}")
+                estimated_bytes = 0
+            try:
+                evict()
+            except Exception as e:
+                print(f"Evicting {name} failed: {e}")
+                continue
+            gc.collect()
+            if _malloc_trim is not None:
+                _malloc_trim(0)
+            rss_after, _ = get_memory_usage()
+            freed_bytes += estimated_bytes
+
+            EVICTIONS.inc(cache=name, tier=TIER_NAMES[tier])
+            self.evictions.append({
+                'time': time.time(),
+                'cache': name,
+                'tier': TIER_NAMES[tier],
+                'idle_seconds': time.monotonic() - last_used,
+                'estimated_mb': estimated_bytes / MB,
+                'rss_before_mb': rss_before,
+                'rss_after_mb': rss_after
+            })
+            print(f"Memory pressure: evicted {name} ({TIER_NAMES[tier]}, ~{estimated_bytes / MB:.1f} MB), "
+                  f"RSS {rss_before:.0f} -> {rss_after:.0f} MB")
+            evicted.append(name)
+
+            if self.relieved(freed_bytes / MB):
+                break
+        return evicted
+
+
+# Global instance
+memory_manager = MemoryManager(data_store)
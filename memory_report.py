@@ -0,0 +1,180 @@
+"""
+In-memory footprint of the dashboard's data structures.
+
+Deep sizes are measured for every data_store snapshot, the top-level keys of
+the main validator cache, the derived caches that modules register with
+register_cache(), and the DataFrames the table builders return for each tab.
+The Raw Data tab ranks them so it is clear which structure to slim when RSS
+approaches the limit is_memory_high() warns about.
+"""
+import sys
+import threading
+import types
+from contextlib import contextmanager
+from functools import wraps
+import numpy as np
+import pandas as pd
+from data_store import data_store
+
+# Objects that are not data owned by the structure being measured
+_SKIP_TYPES = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType, types.MethodType,
+               type(threading.Lock()), type(threading.RLock()))
+
+
+def deep_sizeof(obj):
+    """Approximate bytes held by obj and everything it references, each object counted once.
+
+    DataFrames and Series report pandas' deep memory usage, NumPy arrays the
+    buffer they own; memory-mapped arrays live in the page cache and count only
+    their header.
+    """
+    seen = set()
+    stack = [obj]
+    total = 0
+    while stack:
+        item = stack.pop()
+        if id(item) in seen or isinstance(item, _SKIP_TYPES):
+            continue
+        seen.add(id(item))
+
+        if isinstance(item, (pd.DataFrame, pd.Series, pd.Index)):
+            usage = item.memory_usage(deep=True)
+            total += int(usage.sum()) if isinstance(usage, pd.Series) else int(usage)
+            continue
+        if isinstance(item, np.ndarray):
+            total += sys.getsizeof(item)
+            if not isinstance(item, np.memmap) and item.base is not None and not item.flags.owndata:
+                stack.append(item.base)
+            continue
+
+        total += sys.getsizeof(item)
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+        elif isinstance(item, (str, bytes, bytearray, int, float, bool)) or item is None:
+            continue
+        else:
+            if hasattr(item, '__dict__'):
+                stack.append(vars(item))
+            for slot in getattr(type(item), '__slots__', ()):
+                if hasattr(item, slot):
+                    stack.append(getattr(item, slot))
+    return total
+
+
+_lock = threading.Lock()
+_caches = {}
+_dataset_sizes = {}
+_frame_sizes = {}
+_current_tab = threading.local()
+
+
+def register_cache(name, get_contents):
+    """Include a module-level cache in the report; get_contents() returns what it currently holds"""
+    with _lock:
+        _caches[name] = get_contents
+
+
+@contextmanager
+def tab_scope(tab):
+    """Attribute DataFrames recorded inside the with block to a dashboard tab"""
+    previous = getattr(_current_tab, 'name', None)
+    _current_tab.name = tab
+    try:
+        yield
+    finally:
+        _current_tab.name = previous
+
+
+def record_frame(name, frame):
+    """Remember the deep size of a DataFrame built while rendering the current tab"""
+    if not isinstance(frame, pd.DataFrame):
+        return
+    tab = getattr(_current_tab, 'name', None) or 'Other'
+    size = int(frame.memory_usage(deep=True).sum())
+    with _lock:
+        _frame_sizes[(tab, name)] = (size, len(frame))
+
+
+def recorded_frames(builder):
+    """Decorator for table builders: record the DataFrame they return (alone or first in a tuple)"""
+    @wraps(builder)
+    def wrapper(*args, **kwargs):
+        result = builder(*args, **kwargs)
+        record_frame(builder.__name__, result[0] if isinstance(result, tuple) and result else result)
+        return result
+    return wrapper
+
+
+def _dataset_size(snapshot):
+    # Snapshots are immutable, so each generation is measured once
+    key = (snapshot.name, snapshot.generation)
+    size = _dataset_sizes.get(key)
+    if size is None:
+        size = deep_sizeof(snapshot.data)
+        with _lock:
+            for stale_key in [k for k in _dataset_sizes if k[0] == snapshot.name]:
+                del _dataset_sizes[stale_key]
+            _dataset_sizes[key] = size
+    return size
+
+
+def _main_cache_key_sizes(snapshot):
+    key = ('validator_data keys', snapshot.generation)
+    sizes = _dataset_sizes.get(key)
+    if sizes is None:
+        sizes = {name: deep_sizeof(value) for name, value in (snapshot.data or {}).items()}
+        with _lock:
+            for stale_key in [k for k in _dataset_sizes if k[0] == key[0]]:
+                del _dataset_sizes[stale_key]
+            _dataset_sizes[key] = sizes
+    return sizes
+
+
+def cache_size(name):
+    """Deep size of a cache registered with register_cache(), 0 when it is not registered"""
+    with _lock:
+        get_contents = _caches.get(name)
+    return deep_sizeof(get_contents()) if get_contents is not None else 0
+
+
+def dataset_size(name):
+    """Deep size of a data_store dataset, 0 when it is not loaded"""
+    snapshot = data_store.snapshots().get(name)
+    return _dataset_size(snapshot) if snapshot is not None and snapshot.data is not None else 0
+
+
+def memory_report():
+    """Measured structures, largest first: dicts with structure, kind, bytes and detail"""
+    rows = []
+    snapshots = data_store.snapshots()
+    for name, snapshot in snapshots.items():
+        if snapshot.data is not None:
+            rows.append({'structure': name, 'kind': 'Dataset', 'bytes': _dataset_size(snapshot),
+                         'detail': f"generation {snapshot.generation}"})
+
+    main_cache = snapshots.get('validator_data')
+    if main_cache is not None and main_cache.data is not None:
+        for key, size in _main_cache_key_sizes(main_cache).items():
+            value = main_cache.data[key]
+            rows.append({'structure': f"validator_data['{key}']", 'kind': 'Main cache key', 'bytes': size,
+                         'detail': f"{len(value)} entries" if hasattr(value, '__len__') else ''})
+
+    with _lock:
+        caches = dict(_caches)
+        frames = dict(_frame_sizes)
+    for name, get_contents in caches.items():
+        try:
+            size = deep_sizeof(get_contents())
+        except Exception as e:
+            print(f"Could not measure {name}: {e}")
+            continue
+        rows.append({'structure': name, 'kind': 'Derived cache', 'bytes': size, 'detail': ''})
+
+    for (tab, name), (size, length) in frames.items():
+        rows.append({'structure': f"{tab}: {name}", 'kind': 'Tab DataFrame', 'bytes': size,
+                     'detail': f"{length} rows (last render)"})
+
+    return sorted(rows, key=lambda row: row['bytes'], reverse=True)
@@ -0,0 +1,264 @@
+"""
+Process metrics in the Prometheus text exposition format.
+
+Counters, gauges and histograms are kept in memory by a small thread-safe
+registry. api_server.py serves them at /metrics; the dashboard process writes
+them to METRICS_TEXTFILE_PATH for node_exporter's textfile collector, since a
+Streamlit app cannot serve an extra HTTP path itself.
+"""
+import bisect
+import gc
+import os
+import threading
+import time
+from contextlib import contextmanager
+import psutil
+from config import METRICS_TEXTFILE_PATH, METRICS_TEXTFILE_INTERVAL
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# Seconds, from a cache hit to a slow full-file parse
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+# Bytes, 1 KiB to 1 GiB in powers of 4
+BYTE_BUCKETS = tuple(1024 * 4 ** i for i in range(11))
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(names, values, extra=()):
+    pairs = list(zip(names, values)) + list(extra)
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in pairs) + '}'
+
+
+def _format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    type_name = None
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels):
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}"]
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}")
+        return lines
+
+
+class Counter(_Metric):
+    """Monotonically increasing count"""
+    type_name = 'counter'
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def set_total(self, value, **labels):
+        """Mirror a count kept elsewhere (for collectors)"""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+
+class Gauge(_Metric):
+    """Value that can go up and down"""
+    type_name = 'gauge'
+
+    def set(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+
+class Histogram(_Metric):
+    """Observation counts in cumulative buckets, plus their sum and count"""
+    type_name = 'histogram'
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts = self._values.get(key)
+            if counts is None:
+                # One slot per bucket plus +Inf, then the sum
+                counts = self._values[key] = [0] * (len(self.buckets) + 1) + [0.0]
+            counts[index] += 1
+            counts[-1] += value
+
+    def totals(self, **labels):
+        """(count, sum) of the observations for one label set"""
+        with self._lock:
+            counts = self._values.get(self._key(labels))
+            return (sum(counts[:-1]), counts[-1]) if counts else (0, 0.0)
+
+    @contextmanager
+    def time(self, **labels):
+        """Observe the duration of the with block in seconds"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}"]
+        with self._lock:
+            items = sorted((key, list(counts)) for key, counts in self._values.items())
+        for key, counts in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float('inf'),), counts[:-1]):
+                cumulative += count
+                labels = _format_labels(self.labelnames, key, [('le', _format_value(float(bound)))])
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(counts[-1])}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """Named metrics plus collectors that report point-in-time values when rendered"""
+
+    def __init__(self):
+        self._metrics = {}
+        self._collectors = []
+        self._lock = threading.Lock()
+
+    def _register(self, metric):
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name, documentation, labelnames=()):
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name, documentation, labelnames=()):
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def add_collector(self, collect):
+        """Call collect() before every render, e.g. to set gauges from the current process state"""
+        with self._lock:
+            self._collectors.append(collect)
+
+    def render(self):
+        """All metrics in the Prometheus text format"""
+        for collect in list(self._collectors):
+            try:
+                collect()
+            except Exception as e:
+                print(f"Metrics collector {getattr(collect, '__name__', collect)} failed: {e}")
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda metric: metric.name)
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+    def write_textfile(self, path):
+        """Write the metrics atomically, so the textfile collector never reads a partial file"""
+        temp_file = f"{path}.{os.getpid()}.tmp"
+        with open(temp_file, 'w') as f:
+            f.write(self.render())
+        os.replace(temp_file, path)
+
+
+# Global instance
+registry = MetricsRegistry()
+
+DATA_PARSE_SECONDS = registry.histogram(
+    'nodeset_data_parse_seconds', 'Time to read and parse a data file', ['dataset'])
+DATA_READ_BYTES = registry.histogram(
+    'nodeset_data_read_bytes', 'Size of each data file read', ['dataset'], buckets=BYTE_BUCKETS)
+DATA_OPERATIONS = registry.counter(
+    'nodeset_data_operations_total', 'Data loading operations reported by the tabs', ['operation', 'result'])
+CACHE_REQUESTS = registry.counter(
+    'nodeset_cache_requests_total', 'Cache lookups by cache and result (hit or miss)', ['cache', 'result'])
+TAB_RENDER_SECONDS = registry.histogram(
+    'nodeset_tab_render_seconds', 'Time to build one dashboard tab', ['tab'])
+API_REQUEST_SECONDS = registry.histogram(
+    'nodeset_api_request_seconds', 'JSON API request latency', ['endpoint', 'status'])
+
+PROCESS_RESIDENT_MEMORY = registry.gauge(
+    'process_resident_memory_bytes', 'Resident memory size in bytes')
+GC_COLLECTIONS = registry.counter(
+    'python_gc_collections_total', 'Garbage collections per generation', ['generation'])
+GC_COLLECTED = registry.counter(
+    'python_gc_objects_collected_total', 'Objects collected by the garbage collector per generation', ['generation'])
+GC_UNCOLLECTABLE = registry.counter(
+    'python_gc_objects_uncollectable_total', 'Uncollectable objects found per generation', ['generation'])
+GC_PENDING = registry.gauge(
+    'python_gc_pending_objects', 'Allocations counted towards the next collection per generation', ['generation'])
+
+
+def record_cache(cache, hit):
+    """Count one cache lookup"""
+    CACHE_REQUESTS.inc(cache=cache, result='hit' if hit else 'miss')
+
+
+def collect_process_metrics():
+    """Refresh the RSS and garbage collector gauges"""
+    PROCESS_RESIDENT_MEMORY.set(psutil.Process().memory_info().rss)
+    for generation, (stats, pending) in enumerate(zip(gc.get_stats(), gc.get_count())):
+        GC_COLLECTIONS.set_total(stats['collections'], generation=generation)
+        GC_COLLECTED.set_total(stats['collected'], generation=generation)
+        GC_UNCOLLECTABLE.set_total(stats['uncollectable'], generation=generation)
+        GC_PENDING.set(pending, generation=generation)
+
+
+registry.add_collector(collect_process_metrics)
+
+
+_textfile_thread = None
+_textfile_lock = threading.Lock()
+
+
+def start_textfile_writer(path=METRICS_TEXTFILE_PATH, interval=METRICS_TEXTFILE_INTERVAL):
+    """Write the metrics to path every interval seconds from a daemon thread; no-op without a path"""
+    global _textfile_thread
+    if not path:
+        return False
+    with _textfile_lock:
+        if _textfile_thread is not None and _textfile_thread.is_alive():
+            return False
+
+        def run():
+            while True:
+                try:
+                    registry.write_textfile(path)
+                except OSError as e:
+                    print(f"Could not write metrics to {path}: {e}")
+                time.sleep(interval)
+
+        _textfile_thread = threading.Thread(target=run, name='metrics-textfile', daemon=True)
+        _textfile_thread.start()
+        return True
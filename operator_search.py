@@ -0,0 +1,208 @@
+"""
+Trigram search index over operator addresses, ENS names and manual names.
+
+Built once per validator cache / manual names generation. Every searchable
+name is lowercased once and its character trigrams are posted to sorted
+NumPy arrays of name ids, so a search box query intersects a few posting
+lists and verifies the survivors instead of lowercasing and scanning every
+operator on every keystroke rerun. One- and two-character queries are looked
+up directly in their own postings.
+"""
+import threading
+from collections import OrderedDict
+from operator import itemgetter
+import numpy as np
+from data_loader import load_ens_names, load_validator_data
+from memory_manager import TIER_INDEX, memory_manager
+from memory_report import register_cache
+from metrics import record_cache
+
+# Match ranks, best first
+RANK_EXACT = 0
+RANK_PREFIX = 1
+RANK_WORD_PREFIX = 2
+RANK_SUBSTRING = 3
+
+# Recent queries remembered per index; widget reruns repeat the same search term
+_RECENT_QUERIES = 64
+
+_WORD_SEPARATORS = ' .-_()#'
+
+
+def _trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def _grams(text):
+    """Every 1-, 2- and 3-character substring, the keys a name is posted under"""
+    return {text[i:i + size] for size in (1, 2, 3) for i in range(len(text) - size + 1)}
+
+
+def _rank(query, text):
+    position = text.find(query)
+    if position < 0:
+        return None
+    if position == 0:
+        return RANK_EXACT if len(text) == len(query) else RANK_PREFIX
+    if text[position - 1] in _WORD_SEPARATORS:
+        return RANK_WORD_PREFIX
+    # Addresses are also matched without the 0x prefix
+    if position == 2 and text.startswith('0x'):
+        return RANK_PREFIX
+    return RANK_SUBSTRING
+
+
+class OperatorSearchIndex:
+    """Case-insensitive substring search over every name of each operator"""
+
+    def __init__(self, operator_names):
+        """operator_names: {operator address: iterable of names (ENS, manual)}"""
+        self._operators = []
+        self._texts = []
+        for operator, names in operator_names.items():
+            for text in {operator.lower(), *(name.lower() for name in names if name)}:
+                self._operators.append(operator)
+                self._texts.append(text)
+        self.operators = frozenset(operator_names)
+
+        postings = {}
+        for text_id, text in enumerate(self._texts):
+            for gram in _grams(text):
+                postings.setdefault(gram, []).append(text_id)
+        self._postings = {gram: np.array(ids, dtype='int32') for gram, ids in postings.items()}
+        self._recent = OrderedDict()
+        self._recent_lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.operators)
+
+    def _candidates(self, query):
+        if len(query) < 3:
+            return self._postings.get(query, np.empty(0, dtype='int32')).tolist()
+        lists = []
+        for trigram in _trigrams(query):
+            ids = self._postings.get(trigram)
+            if ids is None:
+                return ()
+            lists.append(ids)
+        lists.sort(key=len)
+        candidates = lists[0]
+        for ids in lists[1:]:
+            if not len(candidates):
+                break
+            candidates = np.intersect1d(candidates, ids, assume_unique=True)
+        return candidates.tolist()
+
+    def ranks(self, search_term):
+        """{operator: (rank, name length)} for every operator with a name containing search_term.
+
+        Lower sorts first: exact, prefix, word prefix, then substring matches,
+        shorter names first within a rank.
+        """
+        query = search_term.strip().lower()
+        if not query:
+            return {}
+        with self._recent_lock:
+            if query in self._recent:
+                self._recent.move_to_end(query)
+                return self._recent[query]
+
+        ranks = {}
+        # Trigrams only narrow the candidates; each one is verified as a real substring
+        for text_id in self._candidates(query):
+            text = self._texts[text_id]
+            rank = _rank(query, text)
+            if rank is not None:
+                operator = self._operators[text_id]
+                score = (rank, len(text))
+                if operator not in ranks or score < ranks[operator]:
+                    ranks[operator] = score
+
+        with self._recent_lock:
+            self._recent[query] = ranks
+            while len(self._recent) > _RECENT_QUERIES:
+                self._recent.popitem(last=False)
+        return ranks
+
+    def search(self, search_term, limit=None):
+        """Matching operators, best match first"""
+        ranks = self.ranks(search_term)
+        matches = sorted(ranks, key=lambda operator: (ranks[operator], operator))
+        return matches[:limit] if limit is not None else matches
+
+
+def build_operator_search_index(cache_data, manual_names):
+    """Index every operator in the validator cache with its ENS name and any manual name"""
+    cache_data = cache_data or {}
+    manual_names = manual_names or {}
+    ens_names = cache_data.get('ens_names', {})
+
+    operators = set(cache_data.get('operator_validators', {}))
+    operators.update(cache_data.get('exited_validators', {}))
+    operators.update(ens_names)
+    operators.update(manual_names)
+    return OperatorSearchIndex({operator: (ens_names.get(operator), manual_names.get(operator))
+                                for operator in operators})
+
+
+_lock = threading.Lock()
+_current = (None, None, None)
+# Only the index is owned here; the names it was built from belong to data_store
+register_cache('operator_search', lambda: _current[2])
+
+
+def _evict():
+    global _current
+    with _lock:
+        _current = (None, None, None)
+
+
+memory_manager.register('operator_search', _evict, TIER_INDEX)
+
+
+def get_operator_search_index():
+    """Search index for the current validator cache and manual names, rebuilt when either changes"""
+    global _current
+    cache_data, _ = load_validator_data()
+    # load_ens_names() returns a fresh {} when there is no manual names file
+    manual_names = load_ens_names() or None
+    memory_manager.touch('operator_search')
+
+    cached_data, cached_names, index = _current
+    if index is not None and cached_data is cache_data and cached_names is manual_names:
+        record_cache('operator_search', True)
+        return index
+
+    with _lock:
+        cached_data, cached_names, index = _current
+        stale = index is None or cached_data is not cache_data or cached_names is not manual_names
+        record_cache('operator_search', not stale)
+        if stale:
+            index = build_operator_search_index(cache_data, manual_names)
+            _current = (cache_data, manual_names, index)
+        return index
+
+
+def filter_operators(items, search_term, operator=itemgetter('operator')):
+    """Items whose operator matches search_term, best matches first (ties keep their order)"""
+    query = search_term.strip().lower()
+    if not query:
+        return list(items)
+    index = get_operator_search_index()
+    ranks = index.ranks(query)
+    indexed = index.operators
+    matched = []
+    for item in items:
+        address = operator(item)
+        rank = ranks.get(address)
+        if rank is None:
+            # Operators missing from the validator cache can only be matched by address
+            if address in indexed:
+                continue
+            rank = _rank(query, address.lower())
+            if rank is None:
+                continue
+            rank = (rank, len(address))
+        matched.append((rank, item))
+    matched.sort(key=lambda match: match[0])
+    return [item for _, item in matched]
@@ -0,0 +1,137 @@
+"""
+Attestation-only operator performance shared by the dashboard and the API.
+
+Validators with a block proposal or sync committee duty inside the lookback
+window are excluded, so operators are compared on attestation rewards alone.
+Everything is computed in one vectorized pass over the columnar performance
+store and memoized per data generation and period.
+"""
+import threading
+import time
+from collections import namedtuple
+import numpy as np
+import pandas as pd
+from config import PERFORMANCE_ENGINE_TIME_BUCKET
+from data_store import data_store
+from duty_index import get_duty_index
+from memory_manager import TIER_DERIVED, memory_manager
+from memory_report import register_cache
+from metrics import record_cache
+from performance_store import load_performance_columns
+
+SECONDS_PER_DAY = 24 * 60 * 60
+
+# metric: performance column; active_days: minimum validator age;
+# exclude_days: duty lookback, a little wider than the window so no duty reward leaks in
+ATTESTATION_PERIODS = {
+    '7d': {'metric': 'performance_7d', 'active_days': 7, 'exclude_days': 10},
+    '31d': {'metric': 'performance_31d', 'active_days': 32, 'exclude_days': 34},
+}
+
+# validators: rows in the performance data; operators: one row per ranked operator with columns
+# operator, rank, regular_performance, attestation_validators, excluded_validators, total_validators,
+# relative_score
+AttestationPerformance = namedtuple('AttestationPerformance', ['period', 'computed_at', 'validators', 'operators'])
+
+OPERATOR_COLUMNS = ['operator', 'rank', 'regular_performance', 'attestation_validators',
+                    'excluded_validators', 'total_validators', 'relative_score']
+
+
+def compute_attestation_performance(columns, duty_index, period, now):
+    """Rank operators by mean attestation-only performance for one period"""
+    settings = ATTESTATION_PERIODS[period]
+    active_cutoff = now - settings['active_days'] * SECONDS_PER_DAY
+    exclude_cutoff = now - settings['exclude_days'] * SECONDS_PER_DAY
+
+    operator = np.asarray(columns.column('operator'))
+    activation = np.asarray(columns.column('activation_timestamp'))
+    validator_index = np.asarray(columns.column('validator_index'))
+    status = np.asarray(columns.column('status'))
+    performance = np.asarray(columns.column(settings['metric']))
+
+    # Validators that count towards an operator: known operator and index,
+    # active for the whole window and not exited
+    counted = ((operator >= 0) & (operator != columns.code('operator', ''))
+               & (activation != 0) & (activation <= active_cutoff)
+               & (validator_index != -1) & (status != columns.code('status', 'exited')))
+
+    excluded = np.isin(validator_index, duty_index.validators_since(exclude_cutoff))
+    regular = counted & ~excluded
+    # Zero rewards usually mean missing data, so they do not pull the mean down
+    rewarded = regular & (performance > 0)
+
+    operator_count = len(columns.categories('operator'))
+    total_validators = np.bincount(operator[counted], minlength=operator_count)
+    attestation_validators = np.bincount(operator[regular], minlength=operator_count)
+    rewarded_validators = np.bincount(operator[rewarded], minlength=operator_count)
+    rewarded_sum = np.bincount(operator[rewarded], weights=performance[rewarded].astype('float64'),
+                               minlength=operator_count)
+
+    # Category codes follow first appearance in the file, so the stable sort
+    # keeps file order for operators with equal performance
+    ranked = np.flatnonzero((attestation_validators > 0) & (rewarded_validators > 0))
+    regular_performance = rewarded_sum[ranked] / rewarded_validators[ranked]
+    order = np.argsort(-regular_performance, kind='stable')
+    ranked = ranked[order]
+    regular_performance = regular_performance[order]
+
+    top_performance = regular_performance[0] if len(regular_performance) else 0
+    operators = pd.DataFrame({
+        'operator': np.array(columns.categories('operator'), dtype=object)[ranked] if len(ranked) else [],
+        'rank': np.arange(1, len(ranked) + 1),
+        'regular_performance': regular_performance,
+        'attestation_validators': attestation_validators[ranked],
+        'excluded_validators': total_validators[ranked] - attestation_validators[ranked],
+        'total_validators': total_validators[ranked],
+        'relative_score': regular_performance / top_performance * 100 if top_performance else regular_performance
+    }, columns=OPERATOR_COLUMNS)
+
+    return AttestationPerformance(period, now, columns.rows, operators)
+
+
+_lock = threading.Lock()
+_results = {}
+register_cache('attestation_performance', lambda: _results)
+
+
+def _evict():
+    with _lock:
+        _results.clear()
+
+
+memory_manager.register('attestation_performance', _evict, TIER_DERIVED)
+
+
+def get_attestation_performance(period='7d'):
+    """Memoized attestation-only ranking for the current data; None when performance data is missing"""
+    if period not in ATTESTATION_PERIODS:
+        raise ValueError(f"Invalid period {period!r}. Use one of: {', '.join(ATTESTATION_PERIODS)}")
+
+    columns = load_performance_columns()
+    if columns is None:
+        return None
+
+    duty_index = get_duty_index()
+    duty_generation = (data_store.generation('proposals'), data_store.generation('sync_committee'))
+    # Windows are relative to now, so results also expire after one time bucket
+    time_bucket = int(time.time() // PERFORMANCE_ENGINE_TIME_BUCKET)
+    key = (columns.generation, duty_generation, period, time_bucket)
+    memory_manager.touch('attestation_performance')
+
+    result = _results.get(key)
+    if result is not None:
+        record_cache('attestation_performance', True)
+        return result
+
+    with _lock:
+        result = _results.get(key)
+        record_cache('attestation_performance', result is not None)
+        if result is not None:
+            return result
+
+        result = compute_attestation_performance(columns, duty_index, period, time.time())
+        # Only the current generation and time bucket are worth keeping
+        for stale_key in [k for k in _results if k[:2] != key[:2] or k[3] != time_bucket]:
+            del _results[stale_key]
+        _results[key] = result
+        return result
@@ -0,0 +1,250 @@
+"""
+Columnar copy of validator_performance_cache.json.
+
+The nested pubkey -> dict JSON is flattened once per data generation into one
+typed .npy file per column. data_store only tracks the file (the dataset is
+not resident), so the JSON is parsed once to build a store and then dropped;
+readers hold nothing but the column maps. Every column is memory-mapped when a store is
+opened, which costs no reads until a page is touched, so resident memory follows
+what is used rather than the number of validators in the file. Holding the maps
+also keeps a store readable after another process (the dashboard or the API
+server) replaces it; superseded stores are only deleted once they have gone
+unused for PERFORMANCE_STORE_RETENTION seconds. String columns (operator,
+status) are stored as int32 codes with their categories kept in the manifest.
+"""
+import json
+import os
+import shutil
+import threading
+import time
+import numpy as np
+import pandas as pd
+from config import PERFORMANCE_COLUMNAR_DIR, PERFORMANCE_STORE_RETENTION
+from data_store import data_store, read_json_file
+from memory_manager import TIER_INDEX, memory_manager
+from memory_report import register_cache
+from metrics import record_cache
+
+# Bump when the column layout changes so stale stores on disk are rebuilt
+SCHEMA_VERSION = 2
+
+# Column name -> (dtype, path into a validator record, value used when missing)
+PERFORMANCE_COLUMNS = {
+    'validator_index': ('int64', ('validator_index',), -1),
+    'operator': ('category', ('operator',), None),
+    'performance_1d': ('int64', ('performance_metrics', 'performance_1d'), 0),
+    'performance_7d': ('int64', ('performance_metrics', 'performance_7d'), 0),
+    'performance_31d': ('int64', ('performance_metrics', 'performance_31d'), 0),
+    'performance_365d': ('int64', ('performance_metrics', 'performance_365d'), 0),
+    'activation_timestamp': ('int64', ('activation_data', 'activation_timestamp'), 0),
+    'status': ('category', ('activation_data', 'status'), None),
+}
+
+
+def _field(record, path, default):
+    value = record
+    for key in path:
+        if not isinstance(value, dict):
+            return default
+        value = value.get(key)
+    return default if value is None else value
+
+
+def build_columns(performance_cache):
+    """Flatten parsed performance cache data into (columns, categories)"""
+    validators = performance_cache.get('validators', {}) if performance_cache else {}
+    records = list(validators.values())
+
+    columns = {}
+    categories = {}
+    for name, (dtype, path, default) in PERFORMANCE_COLUMNS.items():
+        values = [_field(record, path, default) for record in records]
+        if dtype == 'category':
+            # Missing values get code -1, as in pandas.Categorical
+            codes, uniques = pd.factorize(pd.Series(values, dtype=object))
+            columns[name] = codes.astype('int32')
+            categories[name] = [str(value) for value in uniques]
+        else:
+            columns[name] = np.array([value if isinstance(value, (int, float)) else default for value in values],
+                                     dtype=dtype)
+    return columns, categories
+
+
+class PerformanceColumns:
+    """Columns of one performance cache generation, memory-mapped from disk or held in memory"""
+
+    def __init__(self, generation, manifest, directory=None, arrays=None):
+        self.generation = generation
+        self.rows = manifest['rows']
+        self.source = manifest.get('source')
+        self.last_updated = manifest.get('last_updated')
+        self.directory = directory
+        self._categories = manifest['categories']
+        if directory is not None:
+            # Map every column up front so the store stays readable if its files are later removed
+            arrays = {name: np.load(os.path.join(directory, f"{name}.npy"), mmap_mode='r')
+                      for name in PERFORMANCE_COLUMNS}
+        self._arrays = dict(arrays)
+
+    def column(self, name):
+        """Raw values of one column; category columns are returned as integer codes"""
+        if name not in PERFORMANCE_COLUMNS:
+            raise KeyError(f"Unknown performance column: {name}")
+        return self._arrays[name]
+
+    def categories(self, name):
+        """Category labels for a category column, indexed by code"""
+        return self._categories[name]
+
+    def code(self, name, value):
+        """Integer code of a category value, or -1 when it does not occur"""
+        try:
+            return self._categories[name].index(value)
+        except ValueError:
+            return -1
+
+    def frame(self, columns=None):
+        """DataFrame with the requested columns; category columns become pandas Categoricals"""
+        data = {}
+        for name in (columns or list(PERFORMANCE_COLUMNS)):
+            values = self.column(name)
+            if PERFORMANCE_COLUMNS[name][0] == 'category':
+                data[name] = pd.Categorical.from_codes(values, categories=self._categories[name])
+            else:
+                data[name] = values
+        return pd.DataFrame(data)
+
+
+def _store_key(signature):
+    # Same file contents (or, without hashing, same mtime and size) -> same directory
+    if signature.digest:
+        return f"v{SCHEMA_VERSION}-{signature.digest}"
+    return f"v{SCHEMA_VERSION}-{signature.mtime_ns}-{signature.size}"
+
+
+def _read_manifest(directory):
+    try:
+        with open(os.path.join(directory, 'manifest.json'), 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_store(directory, columns, manifest):
+    """Write columns to a temporary directory, then rename it into place"""
+    parent = os.path.dirname(directory)
+    os.makedirs(parent, exist_ok=True)
+    temp_directory = f"{directory}.tmp-{os.getpid()}-{threading.get_ident()}"
+    shutil.rmtree(temp_directory, ignore_errors=True)
+    os.makedirs(temp_directory)
+    try:
+        for name, values in columns.items():
+            np.save(os.path.join(temp_directory, f"{name}.npy"), values)
+        with open(os.path.join(temp_directory, 'manifest.json'), 'w') as f:
+            json.dump(manifest, f)
+        os.rename(temp_directory, directory)
+    except OSError:
+        shutil.rmtree(temp_directory, ignore_errors=True)
+        # Another process finished the same store first
+        if _read_manifest(directory) is None:
+            raise
+
+    _prune_stores(parent, directory)
+
+
+def _prune_stores(parent, keep):
+    """Delete stores built from older versions of the file once no process has opened them for a while"""
+    cutoff = time.time() - PERFORMANCE_STORE_RETENTION
+    for entry in os.listdir(parent):
+        path = os.path.join(parent, entry)
+        if path == keep or '.tmp-' in entry:
+            continue
+        try:
+            if os.stat(path).st_mtime < cutoff:
+                shutil.rmtree(path, ignore_errors=True)
+        except OSError:
+            # Removed by another process in the meantime
+            pass
+
+
+_lock = threading.Lock()
+_current = None
+_unreadable = None  # generation whose file could not be parsed, so it is not retried on every use
+register_cache('performance_columns', lambda: _current)
+
+
+def _evict():
+    # The store on disk stays, so reloading only re-maps the columns
+    global _current
+    with _lock:
+        _current = None
+
+
+memory_manager.register('performance_columns', _evict, TIER_INDEX)
+
+
+def load_performance_columns():
+    """Columnar view of the current validator performance data, or None when it is unavailable"""
+    global _current, _unreadable
+    # File identity and generation only - the parsed JSON is never kept
+    snapshot = data_store.get('validator_performance')
+    if snapshot.path is None:
+        return None
+    memory_manager.touch('performance_columns')
+
+    current = _current
+    if current is not None and current.generation == snapshot.generation:
+        record_cache('performance_columns', True)
+        return current
+
+    with _lock:
+        hit = _current is not None and _current.generation == snapshot.generation
+        record_cache('performance_columns', hit)
+        if hit:
+            return _current
+        if _unreadable == snapshot.generation:
+            return None
+
+        directory = os.path.join(PERFORMANCE_COLUMNAR_DIR, _store_key(snapshot.signature))
+        manifest = _read_manifest(directory)
+        if manifest is not None:
+            try:
+                # Mark the store as in use so other processes do not prune it
+                os.utime(directory)
+            except OSError:
+                pass
+            try:
+                # The store may have been built from an identical file at another path
+                manifest['source'] = snapshot.path
+                _current = PerformanceColumns(snapshot.generation, manifest, directory=directory)
+                return _current
+            except (OSError, ValueError) as e:
+                # Removed or damaged - rebuild it below
+                print(f"Could not open columnar performance store {directory}: {e}")
+
+        try:
+            # One-off parse: plain dicts, released as soon as the columns are built
+            performance_cache = read_json_file(snapshot.path)
+            columns, categories = build_columns(performance_cache)
+            last_updated = performance_cache.get('last_updated') if isinstance(performance_cache, dict) else None
+            del performance_cache
+        except (OSError, ValueError) as e:
+            print(f"Error loading validator_performance data from {snapshot.path}: {e}")
+            _unreadable = snapshot.generation
+            return None
+        manifest = {
+            'schema_version': SCHEMA_VERSION,
+            'source': snapshot.path,
+            'rows': len(columns['validator_index']),
+            'last_updated': last_updated,
+            'dtypes': {name: str(values.dtype) for name, values in columns.items()},
+            'categories': categories
+        }
+        try:
+            _write_store(directory, columns, manifest)
+            _current = PerformanceColumns(snapshot.generation, manifest, directory=directory)
+        except (OSError, ValueError) as e:
+            # Read-only or full disk - keep serving the columns from memory
+            print(f"Could not write columnar performance store to {directory}: {e}")
+            _current = PerformanceColumns(snapshot.generation, manifest, arrays=columns)
+        return _current
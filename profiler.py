@@ -0,0 +1,133 @@
+"""
+Opt-in profiling of a full dashboard rerun (?profile=1).
+
+The rerun is run under cProfile for exact per-function cumulative times,
+while a background thread samples the script thread's stack every
+PROFILING_SAMPLE_INTERVAL seconds and aggregates the samples as folded
+stacks, which flamegraph.pl, speedscope and inferno read directly. cProfile
+is process-wide from Python 3.12 (sys.monitoring), so only one rerun at a time
+uses it; concurrent ?profile=1 reruns get the stack samples alone. Only
+enabled through PROFILING_ENABLED or a matching PROFILING_TOKEN, since a
+profiled rerun is several times slower and exposes source paths.
+"""
+import cProfile
+import hmac
+import io
+import marshal
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from config import PROFILING_ENABLED, PROFILING_SAMPLE_INTERVAL, PROFILING_TOKEN, PROFILING_TOP_FUNCTIONS
+
+
+def profiling_allowed(token=None):
+    """Whether a ?profile=1 request may run: enabled globally, or with the configured token"""
+    if PROFILING_ENABLED:
+        return True
+    if PROFILING_TOKEN and token:
+        return hmac.compare_digest(str(token), PROFILING_TOKEN)
+    return False
+
+
+def _frame_name(code):
+    # Semicolons separate frames in the folded format
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})".replace(';', ':')
+
+
+class _StackSampler(threading.Thread):
+    """Samples one thread's stack at a fixed interval into folded-stack counts"""
+
+    def __init__(self, thread_id, interval):
+        super().__init__(name='profile-sampler', daemon=True)
+        self.thread_id = thread_id
+        self.interval = interval
+        self.samples = Counter()
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                stack.append(_frame_name(frame.f_code))
+                frame = frame.f_back
+            if stack:
+                self.samples[';'.join(reversed(stack))] += 1
+
+    def stop(self):
+        self._stop_event.set()
+        self.join(timeout=1)
+
+
+# Held by the rerun that has cProfile enabled; others fall back to stack sampling
+_cprofile_lock = threading.Lock()
+
+
+class RerunProfiler:
+    """Context manager profiling the calling thread with cProfile and a stack sampler"""
+
+    def __init__(self, sample_interval=PROFILING_SAMPLE_INTERVAL):
+        self.sample_interval = sample_interval
+        self.profile = cProfile.Profile()
+        self.wall_seconds = None
+        # False when another rerun (or profiling tool) already had cProfile enabled
+        self.cprofile_active = False
+        self._sampler = None
+        self._started = None
+
+    def __enter__(self):
+        self._sampler = _StackSampler(threading.get_ident(), self.sample_interval)
+        self._sampler.start()
+        self._started = time.perf_counter()
+        if _cprofile_lock.acquire(blocking=False):
+            try:
+                self.profile.enable()
+                self.cprofile_active = True
+            except ValueError:  # another profiling tool is already active
+                _cprofile_lock.release()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        if self.cprofile_active:
+            self.profile.disable()
+            _cprofile_lock.release()
+        self.wall_seconds = time.perf_counter() - self._started
+        self._sampler.stop()
+        return False
+
+    @property
+    def sample_count(self):
+        return sum(self._sampler.samples.values()) if self._sampler else 0
+
+    def top_functions(self, limit=PROFILING_TOP_FUNCTIONS):
+        """Functions by cumulative time: dicts with function, location, calls, own and cumulative seconds"""
+        if not self.cprofile_active:
+            return []
+        rows = []
+        for (filename, line, name), (primitive_calls, calls, own, cumulative, _) in pstats.Stats(self.profile).stats.items():
+            rows.append({
+                'function': name,
+                'location': f"{filename}:{line}" if line else filename,
+                'calls': calls if calls == primitive_calls else f"{calls}/{primitive_calls}",
+                'own_seconds': own,
+                'cumulative_seconds': cumulative,
+            })
+        rows.sort(key=lambda row: row['cumulative_seconds'], reverse=True)
+        return rows[:limit]
+
+    def folded_stacks(self):
+        """Sampled stacks in the folded format ("frame;frame;frame count" per line)"""
+        samples = self._sampler.samples if self._sampler else {}
+        return ''.join(f"{stack} {count}\n" for stack, count in sorted(samples.items()))
+
+    def pstats_text(self, limit=PROFILING_TOP_FUNCTIONS):
+        stream = io.StringIO()
+        pstats.Stats(self.profile, stream=stream).sort_stats('cumulative').print_stats(limit)
+        return stream.getvalue()
+
+    def pstats_dump(self):
+        """Raw stats in the format of Profile.dump_stats, for snakeviz or pstats.Stats(path)"""
+        return marshal.dumps(pstats.Stats(self.profile).stats)
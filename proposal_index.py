@@ -0,0 +1,136 @@
+"""
+Columnar index of successful block proposals, grouped by operator.
+
+Built once per proposals data generation: the fields the proposal tables use
+are pulled into one DataFrame ordered latest first, each operator's rows are
+located with a single groupby, and the per-operator aggregates (gas totals,
+utilization and transaction means, highest value, first / last date) come from
+one vectorized aggregation. Tables slice and aggregate this instead of
+rescanning the proposals list per operator on every rerun.
+"""
+import threading
+import numpy as np
+import pandas as pd
+from data_loader import load_proposals_data
+from memory_manager import TIER_INDEX, memory_manager
+from memory_report import register_cache
+from metrics import record_cache
+
+# Proposal fields kept in the index, with the value used when a proposal lacks one
+FIELDS = {
+    'date': '',
+    'slot': 0,
+    'operator': '',
+    'validator_pubkey': '',
+    'total_value_eth': 0.0,
+    'execution_fees_eth': 0.0,
+    'consensus_reward_eth': 0.0,
+    'mev_breakdown_eth': 0.0,
+    'relay_tag': '',
+    'gas_used': 0,
+    'gas_utilization': 0.0,
+    'tx_count': 0,
+    'base_fee': 0,
+}
+
+# operators: one row per operator with proposals, indexed by address
+OPERATOR_COLUMNS = ['proposal_count', 'total_gas_used', 'avg_gas_utilization', 'avg_tx_count',
+                    'highest_value_eth', 'first_proposal', 'last_proposal']
+
+
+class ProposalIndex:
+    """Proposals as columns, latest first, with per-operator row positions and aggregates"""
+
+    def __init__(self, proposals):
+        columns = {field: [proposal.get(field) or default for proposal in proposals]
+                   for field, default in FIELDS.items()}
+        frame = pd.DataFrame(columns, columns=list(FIELDS))
+        # 'YYYY-MM-DD HH:MM:SS' strings sort chronologically
+        latest_first = np.argsort(frame['date'].to_numpy(dtype=str), kind='stable')[::-1]
+        self.frame = frame.iloc[latest_first].reset_index(drop=True)
+        # Position of each row in the proposals list it was built from
+        self._source_positions = latest_first
+
+        grouped = self.frame.groupby('operator', sort=False)
+        self._positions = grouped.indices
+        # Rows are latest first, so each group's first date is its last proposal
+        # (much cheaper than min / max over strings)
+        self.operators = grouped.agg(
+            proposal_count=('slot', 'size'),
+            total_gas_used=('gas_used', 'sum'),
+            avg_gas_utilization=('gas_utilization', 'mean'),
+            avg_tx_count=('tx_count', 'mean'),
+            highest_value_eth=('total_value_eth', 'max'),
+            first_proposal=('date', 'last'),
+            last_proposal=('date', 'first'),
+        )[OPERATOR_COLUMNS] if len(self.frame) else pd.DataFrame(columns=OPERATOR_COLUMNS)
+
+    def __len__(self):
+        return len(self.frame)
+
+    def operator_proposals(self, operator):
+        """One operator's proposals, latest first (empty when it has none)"""
+        positions = self._positions.get(operator)
+        if positions is None:
+            return self.frame.iloc[:0]
+        return self.frame.take(positions)
+
+    def source_positions(self, operator):
+        """Positions of one operator's proposals in the original proposals list, in list order"""
+        positions = self._positions.get(operator)
+        if positions is None:
+            return []
+        return np.sort(self._source_positions[positions]).tolist()
+
+    def latest(self, limit):
+        """The most recent proposals across all operators"""
+        return self.frame.head(limit)
+
+    def largest(self, limit):
+        """The highest value proposals across all operators"""
+        return self.frame.nlargest(limit, 'total_value_eth')
+
+    def relay_counts(self):
+        """Proposals per relay tag ('' for locally built blocks), most used first"""
+        return self.frame['relay_tag'].value_counts()
+
+
+_lock = threading.Lock()
+_current = (None, None)
+# Only the index is owned here; the proposals it was built from belong to data_store
+register_cache('proposal_index', lambda: _current[1])
+
+
+def _evict():
+    global _current
+    with _lock:
+        _current = (None, None)
+
+
+memory_manager.register('proposal_index', _evict, TIER_INDEX)
+
+
+def get_proposal_index(proposals_data=None):
+    """Proposal index for the current proposals data, or for proposals_data when passed.
+
+    Snapshots are shared and read-only, so the index is rebuilt only when the
+    proposals object changes (a new data generation).
+    """
+    global _current
+    if proposals_data is None:
+        proposals_data, _ = load_proposals_data()
+    memory_manager.touch('proposal_index')
+
+    cached_data, index = _current
+    if index is not None and cached_data is proposals_data:
+        record_cache('proposal_index', True)
+        return index
+
+    with _lock:
+        cached_data, index = _current
+        stale = index is None or cached_data is not proposals_data
+        record_cache('proposal_index', not stale)
+        if stale:
+            index = ProposalIndex((proposals_data or {}).get('proposals', []))
+            _current = (proposals_data, index)
+        return index
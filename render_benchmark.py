@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Headless full-rerun benchmark of the dashboard, one tab at a time.
+
+Runs app.py through Streamlit's AppTest against a data directory, selects
+each tab in turn and records the total rerun time, the time spent in the
+tab's create_*_tab builder (from nodeset_tab_render_seconds) and the
+tracemalloc peak of the rerun. Results are written as JSON so runs can be
+compared between commits.
+
+    python render_benchmark.py --data-dir synthetic/10k --output render.json
+    python render_benchmark.py --data-dir synthetic/10k --compare render.json
+
+Peak memory comes from one extra rerun per tab with tracemalloc enabled, so
+the timed reruns are not slowed down by it. Usage statistics of the benchmark
+sessions go to a temporary directory, not the data directory.
+"""
+import argparse
+import atexit
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+# Must be set before config is imported: AppTest runs the app in this process
+if 'USAGE_STATS_FILE' not in os.environ:
+    _usage_dir = tempfile.mkdtemp(prefix='render-benchmark-')
+    atexit.register(shutil.rmtree, _usage_dir, ignore_errors=True)
+    os.environ['USAGE_STATS_FILE'] = os.path.join(_usage_dir, 'usage_stats.json')
+
+from streamlit.testing.v1 import AppTest
+from config import ACTIVE_TAB_KEY
+from metrics import TAB_RENDER_SECONDS
+
+APP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'app.py')
+
+TAB_LABELS = ["📈 Distribution", "🎯 Concentration", "🏆 Top Operators", "⚡ Performance", "🤲 Proposals",
+              "📡 Sync Committee", "🚪 Exit Analysis", "💰 Costs", "🔧 Client Diversity", "🔥 Pump the Gas!",
+              "📋 Raw Data"]
+
+
+def _git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=os.path.dirname(APP_PATH), timeout=10).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def _rerun(app, timeout, label):
+    """Run the script with a tab selected; returns (total seconds, builder seconds, problems)"""
+    tab_name = label.split(' ', 1)[-1]
+    # AppTest does not carry the tab selection over between runs, so select it every time
+    app.session_state[ACTIVE_TAB_KEY] = label
+    builder_before = TAB_RENDER_SECONDS.totals(tab=tab_name)[1]
+    started = time.perf_counter()
+    app.run(timeout=timeout)
+    total = time.perf_counter() - started
+    builder = TAB_RENDER_SECONDS.totals(tab=tab_name)[1] - builder_before
+    problems = [str(element.value)[:200] for element in list(app.exception) + list(app.error)]
+    return total, builder, problems
+
+
+def _peak_memory(app, timeout, label):
+    """tracemalloc peak in bytes of one rerun"""
+    app.session_state[ACTIVE_TAB_KEY] = label
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        app.run(timeout=timeout)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run_benchmark(data_dir, tabs=TAB_LABELS, repeat=3, timeout=300):
+    """Render every tab headlessly against data_dir; returns the JSON-serializable results"""
+    previous_dir = os.getcwd()
+    os.chdir(data_dir)
+    try:
+        app = AppTest.from_file(APP_PATH, default_timeout=timeout)
+        # Cold start: parses every data file and renders the default tab
+        first_total, _, first_problems = _rerun(app, timeout, tabs[0])
+
+        results = {}
+        for label in tabs:
+            tab_name = label.split(' ', 1)[-1]
+            # The first rerun after switching is what a user waits for; the rest are warm reruns
+            runs = [_rerun(app, timeout, label) for _ in range(max(1, repeat))]
+            totals = [total for total, _, _ in runs]
+            builders = [builder for _, builder, _ in runs]
+            results[tab_name] = {
+                'label': label,
+                'switch_seconds': totals[0],
+                'rerun_seconds_median': statistics.median(totals),
+                'rerun_seconds_min': min(totals),
+                'builder_seconds_median': statistics.median(builders),
+                'peak_memory_bytes': _peak_memory(app, timeout, label),
+                # Page-wide messages are reported once, with the first run
+                'problems': sorted({problem for _, _, run_problems in runs for problem in run_problems}
+                                   - set(first_problems)),
+            }
+    finally:
+        os.chdir(previous_dir)
+
+    return {
+        'timestamp': datetime.now().isoformat(),
+        'commit': _git_commit(),
+        'data_dir': os.path.abspath(data_dir),
+        'python': platform.python_version(),
+        'repeat': repeat,
+        'first_run_seconds': first_total,
+        'first_run_problems': first_problems,
+        'tabs': results,
+    }
+
+
+def print_report(report, baseline=None):
+    baseline_tabs = (baseline or {}).get('tabs', {})
+    print(f"First run (cold): {report['first_run_seconds'] * 1000:.0f} ms")
+    for problem in report['first_run_problems']:
+        print(f"    ⚠ {problem}")
+    header = f"{'tab':20}{'switch ms':>12}{'rerun ms':>12}{'builder ms':>12}{'peak MB':>10}"
+    if baseline_tabs:
+        header += f"{'vs base':>10}"
+    print(header)
+    print('-' * len(header))
+    for tab_name, result in report['tabs'].items():
+        line = (f"{tab_name:20}{result['switch_seconds'] * 1000:12.0f}{result['rerun_seconds_median'] * 1000:12.0f}"
+                f"{result['builder_seconds_median'] * 1000:12.0f}{result['peak_memory_bytes'] / (1024 * 1024):10.1f}")
+        base = baseline_tabs.get(tab_name)
+        if base and base['rerun_seconds_median']:
+            change = result['rerun_seconds_median'] / base['rerun_seconds_median'] - 1
+            line += f"{change:+10.0%}"
+        print(line)
+        for problem in result['problems']:
+            print(f"    ⚠ {problem}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time a headless dashboard rerun for each tab")
+    parser.add_argument('--data-dir', default='.', help="directory holding the data files (default: current)")
+    parser.add_argument('--tabs', help="comma-separated tab names to run (default: all)")
+    parser.add_argument('--repeat', type=int, default=3, help="reruns per tab (default: 3)")
+    parser.add_argument('--timeout', type=float, default=300, help="seconds allowed per rerun")
+    parser.add_argument('--output', help="write the results as JSON to this file")
+    parser.add_argument('--compare', help="earlier JSON results to show the change against")
+    args = parser.parse_args()
+
+    tabs = TAB_LABELS
+    if args.tabs:
+        wanted = {name.strip() for name in args.tabs.split(',')}
+        tabs = [label for label in TAB_LABELS if label.split(' ', 1)[-1] in wanted]
+        if not tabs:
+            parser.error(f"no tabs matched {args.tabs}")
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+
+    report = run_benchmark(args.data_dir, tabs=tabs, repeat=args.repeat, timeout=args.timeout)
+    print_report(report, baseline)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+Mergeable probabilistic sketches for usage statistics.
+
+HyperLogLog estimates the number of distinct items (unique sessions) in a
+fixed number of registers, and Space-Saving keeps approximate counts for the
+most frequent items (user agents) in a fixed number of counters. Memory and
+serialized size stay constant however much traffic is recorded, and sketches
+from different replicas can be merged into one.
+"""
+import base64
+import hashlib
+import math
+import zlib
+
+
+def _hash64(value) -> int:
+    return int.from_bytes(hashlib.blake2b(str(value).encode('utf-8'), digest_size=8).digest(), 'big')
+
+
+class HyperLogLog:
+    """Distinct count estimate with about 1.04 / sqrt(2 ** precision) relative error"""
+
+    def __init__(self, precision: int = 12, registers: bytes = None):
+        if not 4 <= precision <= 16:
+            raise ValueError(f"HyperLogLog precision must be between 4 and 16, got {precision}")
+        self.precision = precision
+        self.size = 1 << precision
+        self.registers = bytearray(registers) if registers is not None else bytearray(self.size)
+        if len(self.registers) != self.size:
+            raise ValueError(f"Expected {self.size} registers, got {len(self.registers)}")
+        self._estimate = None
+
+    def add(self, value):
+        """Add one item; adding the same item again has no effect"""
+        hashed = _hash64(value)
+        bits = 64 - self.precision
+        index = hashed >> bits
+        # Position of the first 1 bit in the remaining bits
+        rank = bits - (hashed & ((1 << bits) - 1)).bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+            self._estimate = None
+
+    def merge(self, other: 'HyperLogLog'):
+        """Fold another sketch in; the result estimates the union of both"""
+        if other.precision != self.precision:
+            raise ValueError(f"Cannot merge HyperLogLog sketches with precision {self.precision} and {other.precision}")
+        self.registers = bytearray(map(max, self.registers, other.registers))
+        self._estimate = None
+        return self
+
+    def count(self) -> int:
+        """Estimated number of distinct items added"""
+        if self._estimate is None:
+            alpha = 0.7213 / (1 + 1.079 / self.size)
+            estimate = alpha * self.size ** 2 / sum(2.0 ** -register for register in self.registers)
+            zeros = self.registers.count(0)
+            if estimate <= 2.5 * self.size and zeros:
+                # Small cardinalities: linear counting is more accurate
+                estimate = self.size * math.log(self.size / zeros)
+            self._estimate = int(round(estimate))
+        return self._estimate
+
+    def to_dict(self):
+        return {
+            'precision': self.precision,
+            'registers': base64.b64encode(zlib.compress(bytes(self.registers))).decode('ascii')
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data['precision'], zlib.decompress(base64.b64decode(data['registers'])))
+
+
+class SpaceSaving:
+    """Approximate top-k counts (Space-Saving); counts never underestimate, by at most the tracked error"""
+
+    def __init__(self, capacity: int = 50, counters=None):
+        if capacity < 1:
+            raise ValueError(f"SpaceSaving capacity must be at least 1, got {capacity}")
+        self.capacity = capacity
+        # item -> [count, error]
+        self.counters = {item: list(counter) for item, counter in (counters or {}).items()}
+
+    def _floor(self):
+        # Any untracked item has been seen at most this many times
+        if len(self.counters) < self.capacity:
+            return 0
+        return min(counter[0] for counter in self.counters.values())
+
+    def add(self, item, count: int = 1):
+        """Count an item, replacing the least frequent one when all counters are in use"""
+        counter = self.counters.get(item)
+        if counter is not None:
+            counter[0] += count
+        elif len(self.counters) < self.capacity:
+            self.counters[item] = [count, 0]
+        else:
+            smallest = min(self.counters, key=lambda key: self.counters[key][0])
+            floor = self.counters.pop(smallest)[0]
+            self.counters[item] = [floor + count, floor]
+
+    def merge(self, other: 'SpaceSaving'):
+        """Fold another summary in; counts add up as if both streams had been counted here"""
+        own_floor, other_floor = self._floor(), other._floor()
+        merged = {}
+        for item in set(self.counters) | set(other.counters):
+            own = self.counters.get(item, [own_floor, own_floor])
+            theirs = other.counters.get(item, [other_floor, other_floor])
+            merged[item] = [own[0] + theirs[0], own[1] + theirs[1]]
+        self.capacity = max(self.capacity, other.capacity)
+        top = sorted(merged.items(), key=lambda entry: entry[1][0], reverse=True)[:self.capacity]
+        self.counters = dict(top)
+        return self
+
+    def top(self, n: int = None):
+        """(item, estimated count) pairs, most frequent first"""
+        ranked = sorted(self.counters.items(), key=lambda entry: entry[1][0], reverse=True)
+        return [(item, counter[0]) for item, counter in ranked[:n]]
+
+    def to_dict(self):
+        return {'capacity': self.capacity, 'counters': self.counters}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data['capacity'], data['counters'])
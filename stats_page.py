@@ -337,6 +337,20 @@ def show_statistics_page():
     with col2:
         st.metric("Active Sessions", summary['active_sessions'])
     
+    # HyperLogLog estimates - not limited to the retained sessions
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.metric("Unique Sessions Today", summary['unique_sessions_today'])
+    
+    with col2:
+        st.metric("Unique Sessions This Month", summary['unique_sessions_month'])
+    
+    with col3:
+        st.metric("Unique Sessions All Time", summary['unique_sessions_total'])
+    
+    st.caption("Unique session counts are estimates (about ±2%).")
+    
     # User agents (simplified)
     if stats['user_agents']:
         st.markdown("---")
@@ -358,6 +372,8 @@ def show_statistics_page():
             
             simplified_agents[browser] = simplified_agents.get(browser, 0) + count
         
+        st.caption(f"Based on the {len(stats['user_agents'])} most common user agents; counts are approximate.")
+        
         if simplified_agents:
             browser_df = pd.DataFrame(
                 list(simplified_agents.items()),
@@ -410,7 +426,7 @@ def show_statistics_page():
         st.json(stats)
     
     st.markdown("---")
-    st.caption("Statistics are automatically saved to `usage_stats.json` and persist across app restarts.")
+    st.caption("Statistics are logged to `usage_stats_events.jsonl`, compacted into `usage_stats.json` and persist across app restarts.")
 
 def show_usage_api():
     """Show usage statistics in API format"""
@@ -0,0 +1,722 @@
+#!/usr/bin/env python3
+"""
+Deterministic synthetic data for load testing the dashboard.
+
+Writes schema-faithful versions of the seven data files the dashboard reads
+(tracker cache, proposals, validator performance, sync committee, MEV
+analysis, missed proposals, exit data) at a configurable scale. The same seed
+and reference time always produce the same files, so timings from
+benchmark.py are comparable between runs.
+
+    python synthetic_data.py --scale 10k --output-dir synthetic/10k
+    python synthetic_data.py --validators 250000 --operators 8000 --proposals 200000 --output-dir synthetic/250k
+
+Run the dashboard against the output by starting it from that directory.
+"""
+import argparse
+import json
+import os
+import random
+import time
+from collections import Counter, defaultdict
+from datetime import datetime, timezone
+from duty_index import GENESIS_TIME, SECONDS_PER_SLOT
+
+SLOTS_PER_EPOCH = 32
+EPOCHS_PER_SYNC_PERIOD = 256
+SECONDS_PER_DAY = 24 * 60 * 60
+
+# Named scales: validators, operators and successful proposals
+SCALES = {
+    '1k': {'validators': 1_000, 'operators': 100, 'proposals': 1_000},
+    '10k': {'validators': 10_000, 'operators': 500, 'proposals': 10_000},
+    '100k': {'validators': 100_000, 'operators': 5_000, 'proposals': 100_000},
+}
+
+# Output file name for each generated dataset (the first candidate path in config.py)
+FILES = {
+    'validator_data': 'nodeset_validator_tracker_cache.json',
+    'proposals': 'proposals.json',
+    'validator_performance': 'validator_performance_cache.json',
+    'sync_committee': 'sync_committee_participation.json',
+    'mev_analysis': 'mev_analysis_results.json',
+    'missed_proposals': 'missed_proposals_cache.json',
+    'exit_data': 'dashboard_exit_data.json',
+}
+
+RELAYS = {
+    'flashbots': ('Flashbots', 'flashbots-relay'),
+    'bloxroute_max_profit': ('bloXroute Max Profit', 'bloxroute-max-profit-relay'),
+    'bloxroute_regulated': ('bloXroute Regulated', 'bloxroute-regulated-relay'),
+    'ultrasound': ('Ultra Sound', 'ultrasound-relay'),
+    'aestus': ('Aestus', 'aestus-relay'),
+    'agnostic': ('Agnostic Relay', 'agnostic-relay'),
+}
+EXTRA_RELAY_TAGS = ['titan-relay']
+FEE_RECIPIENTS = ['0x4838B106FCe9647Bdf1E7877BF73cE8B0BAD5f97', '0xdadB0d80178819F2319190D340ce9A924f783711',
+                  '0x95222290DD7278Aa3Ddd389Cc1E1d165CC4BAfe5', '0x396343362be2A4dA1cE0C1C210945346fb82Aa49']
+GAS_LIMITS = [(30000000, 25), (36000000, 56), (45000000, 5), (60000000, 7)]
+EXECUTION_CLIENTS = 'GNBR'
+CONSENSUS_CLIENTS = 'LSNPT'
+CLIENT_VERSIONS = ['1.2.0', '1.2.1', '1.2.2']
+
+
+def _hex(rng, digits):
+    return f"{rng.getrandbits(digits * 4):0{digits}x}"
+
+
+def _address(rng):
+    # Mixed case like checksummed addresses; the exact checksum does not matter to the dashboard
+    return '0x' + ''.join(c.upper() if c.isalpha() and rng.random() < 0.5 else c for c in _hex(rng, 40))
+
+
+def _short(address):
+    return f"{address[:8]}...{address[-6:]}"
+
+
+def _display_name(address, ens_names):
+    ens_name = ens_names.get(address)
+    return f"{ens_name} ({_short(address)})" if ens_name else _short(address)
+
+
+def _slot(timestamp):
+    return (timestamp - GENESIS_TIME) // SECONDS_PER_SLOT
+
+
+def _iso(timestamp, fmt='%Y-%m-%dT%H:%M:%S'):
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).strftime(fmt)
+
+
+class SyntheticNetwork:
+    """Operators, validators and their history, from which every file is derived"""
+
+    def __init__(self, validators, operators, proposals, seed=0, reference_time=None):
+        self.rng = random.Random(seed)
+        self.now = int(reference_time if reference_time is not None else time.time() // SECONDS_PER_DAY * SECONDS_PER_DAY)
+        self.proposal_count = proposals
+        rng = self.rng
+
+        self.operators = [_address(rng) for _ in range(operators)]
+        # Skewed operator sizes, every operator with at least one validator
+        weights = [rng.paretovariate(2.0) for _ in self.operators]
+        owners = list(range(min(operators, validators)))
+        owners += rng.choices(range(operators), weights=weights, k=validators - len(owners))
+
+        self.validators = []
+        for position, owner in enumerate(owners):
+            activation = self.now - rng.randint(SECONDS_PER_DAY, 400 * SECONDS_PER_DAY)
+            self.validators.append({
+                'pubkey': '0x' + _hex(rng, 96),
+                'index': 1_894_000 + position,
+                'operator': self.operators[owner],
+                'activation_timestamp': activation,
+                'exited': False,
+                'exit_timestamp': None,
+            })
+
+        # ~3.6% exits, all after activation
+        for validator in rng.sample(self.validators, int(validators * 0.036)):
+            validator['exited'] = True
+            validator['exit_timestamp'] = rng.randint(validator['activation_timestamp'], self.now - 3600)
+
+        self.by_operator = defaultdict(list)
+        for validator in self.validators:
+            self.by_operator[validator['operator']].append(validator)
+
+        self.ens_names = {}
+        self.ens_sources = {}
+        for number, operator in enumerate(rng.sample(self.operators, int(operators * 0.35))):
+            self.ens_names[operator] = f"operator{number}.eth"
+            self.ens_sources[operator] = 'on-chain' if rng.random() < 0.6 else 'manual'
+
+        # Per-operator client setup and reward efficiency
+        self.setups = {operator: (rng.choice(EXECUTION_CLIENTS), rng.choice(CONSENSUS_CLIENTS), rng.choice('LX'))
+                       for operator in self.operators}
+        self.efficiency = {operator: rng.uniform(0.9, 1.0) for operator in self.operators}
+
+    def write(self, output_dir):
+        """Write every dataset to output_dir; returns {file name: bytes}"""
+        os.makedirs(output_dir, exist_ok=True)
+        proposals = self.proposals()
+        builders = {
+            'validator_data': self.tracker_cache,
+            'proposals': lambda: proposals,
+            'validator_performance': self.validator_performance,
+            'sync_committee': self.sync_committee,
+            'mev_analysis': self.mev_analysis,
+            'missed_proposals': self.missed_proposals,
+            'exit_data': self.exit_data,
+        }
+        sizes = {}
+        for name, build in builders.items():
+            path = os.path.join(output_dir, FILES[name])
+            with open(path, 'w') as f:
+                json.dump(build(), f)
+            sizes[FILES[name]] = os.path.getsize(path)
+        return sizes
+
+    def _transactions(self, operator):
+        rng = self.rng
+        transactions = []
+        remaining = len(self.by_operator[operator])
+        while remaining > 0:
+            successful = rng.random() > 0.28
+            validator_count = min(remaining, rng.randint(1, 5)) if successful else rng.randint(1, 5)
+            gas_used = rng.randint(300_000, 450_000)
+            gas_price = rng.randint(500_000_000, 30_000_000_000)
+            timestamp = self.now - rng.randint(SECONDS_PER_DAY, 400 * SECONDS_PER_DAY)
+            transactions.append({
+                'hash': '0x' + _hex(rng, 64),
+                'date': _iso(timestamp, '%Y-%m-%d'),
+                'time': _iso(timestamp, '%H:%M:%S'),
+                'gas_used': gas_used,
+                'gas_price': gas_price,
+                'total_cost_eth': gas_used * gas_price / 1e18,
+                'status': 'Successful' if successful else 'Failed',
+                'validator_count': validator_count,
+            })
+            if successful:
+                remaining -= validator_count
+        return transactions
+
+    def tracker_cache(self):
+        rng = self.rng
+        exited_by_operator = Counter(v['operator'] for v in self.validators if v['exited'])
+        operator_transactions = {operator: self._transactions(operator) for operator in self.operators}
+
+        operator_costs = {}
+        for operator, transactions in operator_transactions.items():
+            successful = [tx for tx in transactions if tx['status'] == 'Successful']
+            total_cost = sum(tx['total_cost_eth'] for tx in transactions)
+            operator_costs[operator] = {
+                'total_cost_eth': total_cost,
+                'successful_txs': len(successful),
+                'failed_txs': len(transactions) - len(successful),
+                'avg_cost_per_tx': total_cost / len(transactions) if transactions else 0,
+                'total_txs': len(transactions),
+                'total_validators_created': sum(tx['validator_count'] for tx in successful),
+            }
+
+        exit_details = {}
+        for validator in self.validators:
+            if not validator['exited']:
+                continue
+            exit_epoch = _slot(validator['exit_timestamp']) // SLOTS_PER_EPOCH
+            done = rng.random() < 0.26
+            exit_details[validator['pubkey']] = {
+                'validator_index': validator['index'],
+                'operator': validator['operator'],
+                'operator_name': _short(validator['operator']),
+                'status': 'withdrawal_done' if done else 'exited_unslashed',
+                'exit_epoch': str(exit_epoch),
+                'exit_timestamp': validator['exit_timestamp'],
+                'withdrawable_epoch': str(exit_epoch + 256),
+                'withdrawable_timestamp': validator['exit_timestamp'] + 256 * SLOTS_PER_EPOCH * SECONDS_PER_SLOT,
+                'balance': None,
+                'effective_balance': '0',
+                'slashed': False,
+                'discovered_timestamp': validator['exit_timestamp'] + rng.randint(600, 3 * SECONDS_PER_DAY),
+            }
+
+        return {
+            'last_block': 22_000_000 + (self.now - 1_740_000_000) // SECONDS_PER_SLOT,
+            'last_epoch_checked': _slot(self.now) // SLOTS_PER_EPOCH,
+            'operator_validators': {operator: len(validators) for operator, validators in self.by_operator.items()},
+            'validator_pubkeys': {operator: [v['pubkey'] for v in validators]
+                                  for operator, validators in self.by_operator.items()},
+            'validator_indices': {v['pubkey']: v['index'] for v in self.validators},
+            'pending_pubkeys': ['0x' + _hex(rng, 96) for _ in range(max(1, len(self.validators) // 1000))],
+            'exited_validators': dict(exited_by_operator),
+            'exited_pubkeys': [v['pubkey'] for v in self.validators if v['exited']],
+            'total_validators': len(self.validators),
+            'total_exited': sum(exited_by_operator.values()),
+            'processed_transactions': [tx['hash'][2:] for transactions in operator_transactions.values()
+                                       for tx in transactions if tx['status'] == 'Successful'],
+            'operator_performance': {operator: rng.uniform(95.0, 100.0) for operator in self.operators
+                                     if rng.random() < 0.98},
+            'performance_last_updated': self.now - 3600,
+            'operator_transactions': operator_transactions,
+            'operator_costs': operator_costs,
+            'cost_last_updated': self.now - 3600,
+            'ens_names': dict(self.ens_names),
+            'ens_last_updated': self.now - 1800,
+            'ens_update_failures': {operator: self.now - 1800 for operator in self.operators
+                                    if operator not in self.ens_names},
+            'exit_details': exit_details,
+            'ens_sources': dict(self.ens_sources),
+        }
+
+    def proposals(self):
+        rng = self.rng
+        proposals = []
+        for _ in range(self.proposal_count):
+            validator = rng.choice(self.validators)
+            end = validator['exit_timestamp'] or self.now
+            # Validators that exited before the last year propose at their exit
+            start = min(max(validator['activation_timestamp'], self.now - 365 * SECONDS_PER_DAY), end)
+            timestamp = rng.randint(start, end)
+            slot = _slot(timestamp)
+            timestamp = GENESIS_TIME + slot * SECONDS_PER_SLOT
+            operator = validator['operator']
+            execution_client, consensus_client, setup = self.setups[operator]
+            version = rng.choice(CLIENT_VERSIONS)
+
+            is_mev = rng.random() < 0.94
+            consensus_eth = round(rng.uniform(0.035, 0.06), 9)
+            execution_wei = int(rng.lognormvariate(17.0, 0.8)) * 10 ** 9
+            execution_eth = round(execution_wei / 1e18, 10)
+            total_wei = consensus_eth * 1e18 + execution_wei
+            gas_limit = rng.choice([36000000, 35999965, 35964845, 45000000])
+            gas_used = rng.randint(gas_limit // 5, gas_limit)
+
+            proposal = {
+                'slot': slot,
+                'epoch': slot // SLOTS_PER_EPOCH,
+                'timestamp': timestamp,
+                'date': _iso(timestamp, '%Y-%m-%d %H:%M:%S'),
+                'validator_index': validator['index'],
+                'validator_pubkey': validator['pubkey'],
+                'operator': operator,
+                'operator_name': _display_name(operator, self.ens_names),
+                'total_value_wei': total_wei,
+                'total_value_eth': round(total_wei / 1e18, 10),
+                'block_number': 22_000_000 + (timestamp - 1_740_000_000) // SECONDS_PER_SLOT,
+                'proposer_index': validator['index'],
+                'fee_recipient': rng.choice(FEE_RECIPIENTS),
+                'graffiti_hex': '0x' + f"NS{execution_client}{consensus_client}{setup} v{version}".encode().hex().ljust(64, '0'),
+                'graffiti_text': f"NS{execution_client}{consensus_client}{setup} v{version}",
+                'consensus_client': None,
+                'client_version': version,
+                'has_pool_signature': False,
+                'consensus_reward_eth': consensus_eth,
+                'execution_fees_eth': execution_eth,
+                'mev_breakdown_eth': execution_eth if is_mev else 0.0,
+                'mev_percentage': 100.0 if is_mev else 0.0,
+                'gas_used': gas_used,
+                'gas_limit': gas_limit,
+                'base_fee': rng.randint(100_000_000, 5_000_000_000),
+                'tx_count': rng.randint(50, 400),
+                'gas_utilization': round(gas_used / gas_limit * 100, 2),
+                'is_mev_boost_block': is_mev,
+                'relay_tag': rng.choice([tag for _, tag in RELAYS.values()] + EXTRA_RELAY_TAGS) if is_mev else '',
+                'total_rewards_wei': total_wei,
+                'total_rewards_eth': round(total_wei / 1e18, 10),
+                'data_sources_used': ['local_beacon_api', 'beaconchain_api'],
+                'calculation_method': 'lighthouse_plus_beaconchain_plus_graffiti',
+                'detailed_consensus': {
+                    'consensus_rewards_wei': consensus_eth * 1e18,
+                    'attestations_gwei': int(consensus_eth * 1e9 * 0.96),
+                    'deposits_gwei': 0,
+                    'sync_aggregate_gwei': int(consensus_eth * 1e9 * 0.04),
+                },
+                'detailed_execution': {
+                    'execution_reward_wei': execution_wei,
+                    'mev_breakdown_wei': execution_wei if is_mev else 0,
+                    'traditional_fees_wei': 0 if is_mev else execution_wei,
+                    'block_reward_wei': int(execution_wei * rng.uniform(1.0, 1.2)),
+                    'producer_reward_wei': execution_wei,
+                },
+            }
+            if is_mev:
+                proposal['builder_pubkey'] = '0x' + _hex(rng, 96)
+            proposals.append(proposal)
+        proposals.sort(key=lambda proposal: proposal['slot'])
+
+        operator_summary = {}
+        for operator, operator_proposals in _group(proposals, 'operator').items():
+            count = len(operator_proposals)
+            mev_blocks = sum(1 for p in operator_proposals if p['is_mev_boost_block'])
+            total_value = sum(p['total_value_eth'] for p in operator_proposals)
+            operator_summary[operator] = {
+                'proposal_count': count,
+                'total_value_eth': total_value,
+                'average_value_eth': total_value / count,
+                'consensus_rewards_eth': sum(p['consensus_reward_eth'] for p in operator_proposals),
+                'execution_rewards_eth': sum(p['execution_fees_eth'] for p in operator_proposals),
+                'mev_rewards_eth': sum(p['mev_breakdown_eth'] for p in operator_proposals),
+                'mev_blocks_count': mev_blocks,
+                'mev_blocks_percentage': mev_blocks / count * 100,
+                'clients_used': {},
+                'primary_client': None,
+                'pool_signatures_count': 0,
+                'pool_signatures_percentage': 0.0,
+            }
+
+        mev_blocks = sum(1 for p in proposals if p['is_mev_boost_block'])
+        return {
+            'metadata': {
+                'last_updated': _iso(self.now),
+                'total_proposals': len(proposals),
+                'total_value_eth': sum(p['total_value_eth'] for p in proposals),
+                'total_consensus_eth': sum(p['consensus_reward_eth'] for p in proposals),
+                'total_execution_eth': sum(p['execution_fees_eth'] for p in proposals),
+                'total_mev_eth': sum(p['mev_breakdown_eth'] for p in proposals),
+                'mev_boost_blocks': mev_blocks,
+                'mev_boost_percentage': mev_blocks / len(proposals) * 100 if proposals else 0,
+                'operators_tracked': len(operator_summary),
+                'data_sources': ['local_lighthouse', 'beaconchain_api', 'graffiti_analysis'],
+                'calculation_method': 'lighthouse_plus_beaconchain_plus_graffiti',
+            },
+            'client_diversity': {
+                'total_proposals': len(proposals),
+                'identified_proposals': 0,
+                'identification_rate': 0.0,
+                'client_distribution': {},
+                'analysis_timestamp': _iso(self.now),
+            },
+            'operator_summary': operator_summary,
+            'proposals': proposals,
+        }
+
+    def validator_performance(self):
+        rng = self.rng
+        validators = {}
+        daily_reward = 2_370_000  # gwei of attestation rewards per validator per day
+        for validator in self.validators:
+            operator = validator['operator']
+            end = validator['exit_timestamp'] or self.now
+
+            def earned(days):
+                # Rewards for the part of the window the validator was active
+                start = max(validator['activation_timestamp'], self.now - days * SECONDS_PER_DAY)
+                active_days = max(0, end - start) / SECONDS_PER_DAY
+                return int(active_days * daily_reward * self.efficiency[operator] * rng.uniform(0.95, 1.05))
+
+            # A few validators have missing recent data, reported as zero
+            missing = rng.random() < 0.02
+            activation_epoch = _slot(validator['activation_timestamp']) // SLOTS_PER_EPOCH
+            eligibility_timestamp = validator['activation_timestamp'] - 8448
+            if validator['exited']:
+                status = 'exited'
+            else:
+                status = 'active_offline' if rng.random() < 0.001 else 'active_online'
+            validators[validator['pubkey']] = {
+                'validator_index': validator['index'],
+                'operator': operator,
+                'current_balance': 0 if validator['exited'] else 32_000_000_000 + rng.randint(0, 50_000_000),
+                'performance_metrics': {
+                    'performance_today': 0 if missing else earned(0.5),
+                    'performance_1d': 0 if missing else earned(1),
+                    'performance_7d': 0 if missing else earned(7),
+                    'performance_31d': earned(31),
+                    'performance_365d': earned(365),
+                    'performance_total': earned(10_000),
+                    'rank_7d': rng.randint(1, 2_000_000),
+                },
+                'last_updated': _iso(self.now - rng.randint(0, 3600)) + '+00:00',
+                'activation_data': {
+                    'activation_epoch': activation_epoch,
+                    'activation_timestamp': validator['activation_timestamp'],
+                    'activation_date': _iso(validator['activation_timestamp']) + '+00:00',
+                    'activation_eligibility_epoch': activation_epoch - 22,
+                    'activation_eligibility_timestamp': eligibility_timestamp,
+                    'activation_eligibility_date': _iso(eligibility_timestamp) + '+00:00',
+                    'status': status,
+                    'slashed': False,
+                },
+            }
+        return {
+            'last_updated': _iso(self.now) + '+00:00',
+            'total_validators': sum(1 for v in self.validators if not v['exited']),
+            'validators': validators,
+        }
+
+    def sync_committee(self):
+        rng = self.rng
+        current_period = _slot(self.now) // SLOTS_PER_EPOCH // EPOCHS_PER_SYNC_PERIOD
+        periods = 32
+        slots_per_period = EPOCHS_PER_SYNC_PERIOD * SLOTS_PER_EPOCH
+
+        detailed_stats = []
+        for _ in range(max(2, len(self.validators) // 50)):
+            period = current_period - rng.randint(0, periods - 1)
+            validator = rng.choice(self.validators)
+            start_epoch = period * EPOCHS_PER_SYNC_PERIOD
+            start_slot = start_epoch * SLOTS_PER_EPOCH
+            end_slot = start_slot + slots_per_period - 1
+            partial = period == current_period
+            total_slots = (_slot(self.now) - start_slot) if partial else slots_per_period
+            successful = int(total_slots * rng.uniform(0.9, 1.0))
+            detailed_stats.append({
+                'period': period,
+                'start_epoch': start_epoch,
+                'end_epoch': start_epoch + EPOCHS_PER_SYNC_PERIOD - 1,
+                'start_slot': start_slot,
+                'end_slot': end_slot,
+                'validator_index': validator['index'],
+                'validator_pubkey': validator['pubkey'],
+                'operator': validator['operator'],
+                'operator_name': _display_name(validator['operator'], self.ens_names),
+                'total_slots': total_slots,
+                'successful_attestations': successful,
+                'missed_attestations': total_slots - successful,
+                'participation_rate': round(successful / total_slots * 100, 2) if total_slots else 0,
+                'is_partial_period': partial,
+                'actual_start_slot': start_slot,
+                'actual_end_slot': min(end_slot, _slot(self.now)),
+                'api_failures': 0,
+                'scan_start_slot': start_slot,
+                'scan_end_slot': min(end_slot, _slot(self.now)),
+            })
+        detailed_stats.sort(key=lambda entry: entry['period'])
+
+        def summarize(entries):
+            total_slots = sum(e['total_slots'] for e in entries)
+            successful = sum(e['successful_attestations'] for e in entries)
+            return {
+                'total_slots': total_slots,
+                'total_successful': successful,
+                'total_missed': total_slots - successful,
+                'participation_rate': successful / total_slots * 100 if total_slots else 0,
+                'api_failures': 0,
+            }
+
+        period_summary = {str(period): dict({'our_validators_count': len(entries)}, **summarize(entries))
+                          for period, entries in _group(detailed_stats, 'period').items()}
+        operator_summary = {operator: dict({'total_periods': len({e['period'] for e in entries})}, **summarize(entries))
+                            for operator, entries in _group(detailed_stats, 'operator').items()}
+        overall = summarize(detailed_stats)
+        return {
+            'metadata': {
+                'last_updated': _iso(self.now),
+                'total_periods_tracked': len(period_summary),
+                'total_validators_in_committees': len({e['validator_index'] for e in detailed_stats}),
+                'total_attestations_tracked': overall['total_slots'],
+                'total_successful_attestations': overall['total_successful'],
+                'total_missed_attestations': overall['total_missed'],
+                'total_api_failures': 0,
+                'overall_participation_rate': round(overall['participation_rate'], 2),
+            },
+            'period_summary': period_summary,
+            'operator_summary': operator_summary,
+            'detailed_stats': detailed_stats,
+        }
+
+    def mev_analysis(self):
+        rng = self.rng
+        active = [v for v in self.validators if not v['exited']]
+        gas_choices, gas_weights = zip(*GAS_LIMITS)
+        operator_gas = {operator: rng.choices(gas_choices, weights=gas_weights)[0] for operator in self.operators}
+
+        registrations = {relay: [] for relay in RELAYS}
+        gas_by_validator = {}
+        inconsistent = {}
+        missing = []
+        for validator in active:
+            if rng.random() < 0.014:
+                missing.append(validator)
+                continue
+            gas_limit = operator_gas[validator['operator']]
+            # A few validators are registered with different limits on different relays
+            if rng.random() < 0.06:
+                relay_limits = {relay: rng.choice(gas_choices) for relay in RELAYS}
+                inconsistent[validator['pubkey']] = relay_limits
+            gas_by_validator[validator['pubkey']] = gas_limit
+            for relay in RELAYS:
+                if rng.random() < 0.6:
+                    registrations[relay].append(validator['pubkey'])
+
+        operator_analysis = {}
+        for operator, validators in self.by_operator.items():
+            gas_limits = [gas_by_validator[v['pubkey']] for v in validators if v['pubkey'] in gas_by_validator]
+            total = sum(1 for v in validators if not v['exited'])
+            operator_analysis[operator] = {
+                'display_name': _display_name(operator, self.ens_names),
+                'total_validators': total,
+                'mev_registered': len(gas_limits),
+                'mev_coverage_percent': len(gas_limits) / total * 100 if total else 0,
+                'missing_mev': total - len(gas_limits),
+                'average_gas_limit': sum(gas_limits) / len(gas_limits) if gas_limits else 0,
+                'gas_limit_count': len(gas_limits),
+                'gas_limits': gas_limits,
+            }
+
+        missing_by_operator = {}
+        for operator, validators in _group(missing, 'operator').items():
+            total = operator_analysis[operator]['total_validators']
+            missing_by_operator[operator] = {
+                'display_name': _display_name(operator, self.ens_names),
+                'missing_count': len(validators),
+                'total_count': total,
+                'mev_coverage_percent': (total - len(validators)) / total * 100 if total else 0,
+                'missing_pubkeys': [v['pubkey'] for v in validators],
+            }
+
+        registered = len(gas_by_validator)
+        consistency_rate = (registered - len(inconsistent)) / registered * 100 if registered else 0
+        return {
+            'metadata': {
+                'analysis_timestamp': _iso(self.now),
+                'analysis_duration_seconds': rng.uniform(600, 1800),
+                'total_active_validators': len(active),
+                'cache_file_used': FILES['validator_data'],
+                'relays_tested': len(RELAYS) + 2,
+                'working_relays': list(RELAYS),
+                'failed_relays': {'bloxroute_ethical': 'Connection timed out', 'securerpc': 'HTTP 400'},
+            },
+            'summary': {
+                'total_validators': len(active),
+                'mev_registered_validators': registered,
+                'mev_coverage_percentage': registered / len(active) * 100 if active else 0,
+                'missing_validators': len(missing),
+                'working_relays_count': len(RELAYS),
+                'gas_limit_consistency_rate': consistency_rate,
+            },
+            'relay_performance': {
+                relay: {
+                    'name': name,
+                    'validators_found': len(registrations[relay]),
+                    'coverage_percentage': len(registrations[relay]) / registered * 100 if registered else 0,
+                } for relay, (name, _) in RELAYS.items()
+            },
+            'gas_limit_analysis': {
+                'distribution': {str(gas): count for gas, count in Counter(gas_by_validator.values()).items()},
+                'consistency_stats': {
+                    'consistent': registered - len(inconsistent),
+                    'inconsistent': len(inconsistent),
+                    'consistency_rate': consistency_rate,
+                },
+                'inconsistent_validators': inconsistent,
+            },
+            'operator_analysis': operator_analysis,
+            'missing_validator_analysis': {
+                'total_missing': len(missing),
+                'missing_validators': [v['pubkey'] for v in missing],
+                'missing_by_operator': missing_by_operator,
+            },
+            'raw_data': {
+                'relay_registrations': {relay: {'count': len(pubkeys), 'sample_pubkeys': pubkeys[:5]}
+                                        for relay, pubkeys in registrations.items()},
+                'operator_info': {
+                    'operator_validators': {operator: len(validators) for operator, validators in self.by_operator.items()},
+                    'validator_pubkeys': {operator: [v['pubkey'] for v in validators]
+                                          for operator, validators in self.by_operator.items()},
+                    'ens_names': dict(self.ens_names),
+                    'total_validators': len(self.validators),
+                },
+            },
+        }
+
+    def missed_proposals(self):
+        rng = self.rng
+        missed = []
+        for _ in range(max(1, self.proposal_count // 50)):
+            validator = rng.choice(self.validators)
+            timestamp = self.now - rng.randint(3600, 180 * SECONDS_PER_DAY)
+            slot = _slot(timestamp)
+            timestamp = GENESIS_TIME + slot * SECONDS_PER_SLOT
+            missed.append({
+                'slot': slot,
+                'epoch': slot // SLOTS_PER_EPOCH,
+                'timestamp': timestamp,
+                'date': _iso(timestamp, '%Y-%m-%d %H:%M:%S'),
+                'validator_index': validator['index'],
+                'validator_pubkey': validator['pubkey'],
+                'operator': validator['operator'],
+                'operator_name': _display_name(validator['operator'], self.ens_names),
+                'reason': 'missed_proposal',
+                'detection_method': 'delayed_validation',
+            })
+        missed.sort(key=lambda entry: entry['slot'])
+        return {
+            'missed_proposals': missed,
+            'last_checked_epoch': _slot(self.now) // SLOTS_PER_EPOCH - 2,
+            'last_updated': self.now - 600,
+            'last_revalidation': self.now - 3 * SECONDS_PER_DAY,
+            'last_revalidation_date': _iso(self.now - 3 * SECONDS_PER_DAY),
+        }
+
+    def exit_data(self):
+        exited = sorted((v for v in self.validators if v['exited']), key=lambda v: v['exit_timestamp'])
+
+        operators_with_exits = []
+        for operator, validators in _group(exited, 'operator').items():
+            total = len(self.by_operator[operator])
+            latest = max(v['exit_timestamp'] for v in validators)
+            operators_with_exits.append({
+                'operator': operator,
+                'operator_name': _display_name(operator, self.ens_names),
+                'exits': len(validators),
+                'still_active': total - len(validators),
+                'total_ever': total,
+                'exit_rate': len(validators) / total * 100,
+                'latest_exit_timestamp': latest,
+                'latest_exit_date': _iso(latest, '%Y-%m-%d'),
+            })
+        operators_with_exits.sort(key=lambda entry: entry['exits'], reverse=True)
+
+        recent_exits = [{
+            'validator_index': v['index'],
+            'operator': v['operator'],
+            'operator_name': _display_name(v['operator'], self.ens_names),
+            'exit_timestamp': v['exit_timestamp'],
+            'exit_date': _iso(v['exit_timestamp'], '%Y-%m-%d %H:%M:%S'),
+            'status': 'exited_unslashed',
+            'slashed': False,
+            'balance_gwei': None,
+            'exit_epoch': str(_slot(v['exit_timestamp']) // SLOTS_PER_EPOCH),
+        } for v in reversed(exited[-50:])]
+
+        timeline = Counter(_iso(v['exit_timestamp'], '%Y-%m-%d') for v in exited)
+        manual = sum(1 for source in self.ens_sources.values() if source == 'manual')
+        return {
+            'exit_summary': {
+                'total_exited': len(exited),
+                'total_active': len(self.validators) - len(exited),
+                'exit_rate_percent': len(exited) / len(self.validators) * 100 if self.validators else 0,
+                'last_updated': self.now - 600,
+            },
+            'ens_summary': {
+                'total_ens_names': len(self.ens_names),
+                'manual_ens_count': manual,
+                'onchain_ens_count': len(self.ens_names) - manual,
+                'ens_coverage_percent': len(self.ens_names) / len(self.operators) * 100 if self.operators else 0,
+            },
+            'operators_with_exits': operators_with_exits,
+            'recent_exits': recent_exits,
+            'exit_timeline': [{'date': date, 'voluntary_exits': count, 'slashed_exits': 0, 'total_exits': count}
+                              for date, count in sorted(timeline.items())],
+        }
+
+
+def _group(entries, key):
+    groups = defaultdict(list)
+    for entry in entries:
+        groups[entry[key]].append(entry)
+    return groups
+
+
+def generate(output_dir, validators, operators, proposals, seed=0, reference_time=None):
+    """Generate every data file into output_dir; returns {file name: bytes}"""
+    network = SyntheticNetwork(validators, operators, proposals, seed=seed, reference_time=reference_time)
+    return network.write(output_dir)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate synthetic NodeSet dashboard data files")
+    parser.add_argument('--scale', choices=sorted(SCALES), default='10k', help="named scale (default: 10k)")
+    parser.add_argument('--validators', type=int, help="override the scale's validator count")
+    parser.add_argument('--operators', type=int, help="override the scale's operator count")
+    parser.add_argument('--proposals', type=int, help="override the scale's proposal count")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--reference-time', type=int,
+                        help="unix time the data ends at (default: start of the current UTC day)")
+    parser.add_argument('--output-dir', help="default: synthetic/<scale>")
+    args = parser.parse_args()
+
+    scale = dict(SCALES[args.scale])
+    for name in ('validators', 'operators', 'proposals'):
+        if getattr(args, name) is not None:
+            scale[name] = getattr(args, name)
+    output_dir = args.output_dir or os.path.join('synthetic', args.scale)
+
+    started = time.perf_counter()
+    sizes = generate(output_dir, seed=args.seed, reference_time=args.reference_time, **scale)
+    print(f"Generated {scale['validators']} validators, {scale['operators']} operators and "
+          f"{scale['proposals']} proposals in {time.perf_counter() - started:.1f}s -> {output_dir}")
+    for file_name, size in sizes.items():
+        print(f"  {file_name:40} {size / (1024 * 1024):8.2f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,38 +1,69 @@
+import numpy as np
 import pandas as pd
+import streamlit as st
 from datetime import datetime
-from utils import get_performance_category, get_performance_category_display
+from utils import (get_performance_category, get_performance_category_display, format_operator_display_plain,
+                   streamlit_version_at_least)
 from collections import Counter
+from memory_report import recorded_frames
+from proposal_index import get_proposal_index
 
+# Table frames keep their numbers numeric (percentages as percent values, 12.5
+# for 12.5%) so they sort and export as numbers; they are only formatted for
+# display, through these st.column_config.NumberColumn formats
+INTEGER = "%d"
+# Format presets such as "localized" (thousands separators) need Streamlit 1.43+
+THOUSANDS = "localized" if streamlit_version_at_least(1, 43) else INTEGER
+ETH = "%.4f"
+ETH_PRECISE = "%.6f"
+PERCENT_1 = "%.1f%%"
+PERCENT_2 = "%.2f%%"
+
+def number_column(label, format=INTEGER, width="small"):
+    """Column config showing a numeric column with one of the display formats above"""
+    return st.column_config.NumberColumn(label, format=format, width=width)
+
+def with_placeholder(df, column, format, placeholder="N/A"):
+    """Styler displaying column in one of the formats above and placeholder where it is NaN.
+
+    The values stay numeric, so the column still sorts as numbers. Its column_config must
+    not set a format, or that format replaces the Styler's text.
+    """
+    return df.style.format({column: lambda value: format % value}, na_rep=placeholder)
+
+def _percent(part, whole):
+    """part / whole as a percentage, 0 where whole is 0"""
+    part = np.asarray(part, dtype='float64')
+    whole = np.asarray(whole, dtype='float64')
+    return np.divide(part * 100, whole, out=np.zeros_like(part), where=whole > 0)
+
+@recorded_frames
 def create_top_operators_table(operator_validators, operator_exited, ens_names):
     """Create table of top operators by validator count"""
     if not operator_validators:
         return pd.DataFrame()
 
-    data = []
-    for addr, total_count in operator_validators.items():
-        exited_count = operator_exited.get(addr, 0)
-        active_count = total_count - exited_count
-        exit_rate = (exited_count / total_count * 100) if total_count > 0 else 0
-
-        ens_name = ens_names.get(addr, "")
+    addresses = list(operator_validators)
+    total = np.array([operator_validators[addr] for addr in addresses], dtype='int64')
+    exited = np.array([operator_exited.get(addr, 0) for addr in addresses], dtype='int64')
+    active = total - exited
 
-        data.append({
-            'Rank': 0,
-            'Address': addr,
-            'ENS / Discord Name': ens_name,
-            'Active': active_count,
-            'Total': total_count,
-            'Exited': exited_count,
-            'Exit Rate': f"{exit_rate:.1f}%",
-            'Market Share': f"{(active_count / sum(v - operator_exited.get(k, 0) for k, v in operator_validators.items()) * 100):.2f}%"
-        })
-
-    df = pd.DataFrame(data)
+    df = pd.DataFrame({
+        'Rank': 0,
+        'Address': addresses,
+        'ENS / Discord Name': [ens_names.get(addr, "") for addr in addresses],
+        'Active': active,
+        'Total': total,
+        'Exited': exited,
+        'Exit Rate': _percent(exited, total),
+        'Market Share': _percent(active, np.full(len(active), active.sum())),
+    })
     df = df.sort_values('Active', ascending=False).reset_index(drop=True)
-    df['Rank'] = range(1, len(df) + 1)
+    df['Rank'] = np.arange(1, len(df) + 1)
 
     return df
 
+@recorded_frames
 def create_performance_table(operator_performance, operator_validators, operator_exited, ens_names):
     """Create table of operators by performance"""
     if not operator_performance:
@@ -51,8 +82,7 @@ def create_performance_table(operator_performance, operator_validators, operator
                 'Rank': 0,
                 'Address': addr,
                 'ENS / Discord Name': ens_name,
-                'Performance': f"{performance:.2f}%",
-                'Performance_Raw': performance,
+                'Performance': float(performance),
                 'Category': get_performance_category_display(performance),
                 'Active': active_count,
                 'Total': total_count,
@@ -63,11 +93,29 @@ def create_performance_table(operator_performance, operator_validators, operator
         return pd.DataFrame()
 
     df = pd.DataFrame(data)
-    df = df.sort_values(['Performance_Raw', 'Active'], ascending=[False, False]).reset_index(drop=True)
-    df['Rank'] = range(1, len(df) + 1)
+    df = df.sort_values(['Performance', 'Active'], ascending=[False, False]).reset_index(drop=True)
+    df['Rank'] = np.arange(1, len(df) + 1)
 
     return df
 
+@recorded_frames
+def create_attestation_performance_table(performance, ens_names):
+    """Create table of operators ranked by attestation-only performance"""
+    if performance is None or performance.operators.empty:
+        return pd.DataFrame()
+
+    operators = performance.operators
+    return pd.DataFrame({
+        'Rank': operators['rank'].to_numpy(),
+        'Address': operators['operator'].to_numpy(),
+        'ENS/Discord Name': [ens_names.get(addr, "") for addr in operators['operator']],
+        'Regular Performance (gwei)': operators['regular_performance'].round().to_numpy(dtype='int64'),
+        'Attestation Validators': operators['attestation_validators'].to_numpy(),
+        'Excluded (Proposals/Sync)': operators['excluded_validators'].to_numpy(),
+        'Total Validators': operators['total_validators'].to_numpy(),
+        'Relative Score': operators['relative_score'].to_numpy(),
+    })
+
 def format_relay_name(relay_tag):
     """Format relay tag for display"""
     if not relay_tag:
@@ -87,121 +135,88 @@ def format_relay_name(relay_tag):
     
     return relay_display_map.get(relay_tag, relay_tag.replace('-', ' ').title())
 
+def _proposal_rows(proposals, ens_names):
+    """Display frame for proposals from the proposal index"""
+    operators = proposals['operator']
+    ens = [ens_names.get(operator_address, "") for operator_address in operators]
+    short = (operators.str[:8] + '...' + operators.str[-6:]).tolist()
+    
+    return pd.DataFrame({
+        'Date': proposals['date'].to_numpy(),
+        'Operator': [f"{name} ({address})" if name else address for name, address in zip(ens, short)],
+        'Operator Address': operators.to_numpy(),
+        'Validator Pubkey': proposals['validator_pubkey'].to_numpy(),
+        'ETH Value': proposals['total_value_eth'].to_numpy(dtype='float64'),
+        'Execution Rewards': proposals['execution_fees_eth'].to_numpy(dtype='float64'),
+        'Consensus Rewards': proposals['consensus_reward_eth'].to_numpy(dtype='float64'),
+        'MEV Rewards': proposals['mev_breakdown_eth'].to_numpy(dtype='float64'),
+        'MEV Relay': proposals['relay_tag'].map(format_relay_name).to_numpy(),
+        'Slot': proposals['slot'].to_numpy(dtype='int64'),
+        'Gas Used': proposals['gas_used'].to_numpy(dtype='int64'),
+        'Gas Utilization': proposals['gas_utilization'].to_numpy(dtype='float64'),
+        'TX Count': proposals['tx_count'].to_numpy(dtype='int64'),
+    })
+
+# Column config shared by the largest and latest proposals tables
+PROPOSAL_COLUMNS = {
+    "Date": st.column_config.TextColumn("Date", width="medium"),
+    "Operator": st.column_config.TextColumn("Operator", width="medium"),
+    "Validator Pubkey": st.column_config.TextColumn("Validator Pubkey", width="large"),
+    "ETH Value": number_column("ETH Value", ETH),
+    "Execution Rewards": number_column("Execution", ETH),
+    "Consensus Rewards": number_column("Consensus", ETH),
+    "MEV Rewards": number_column("MEV", ETH),
+    "MEV Relay": st.column_config.TextColumn("MEV Relay", width="medium"),
+    "Slot": number_column("Slot"),
+    "Gas Used": number_column("Gas Used", THOUSANDS),
+    "Gas Utilization": number_column("Gas %", PERCENT_1),
+    "TX Count": number_column("TXs"),
+}
+
+@recorded_frames
 def create_largest_proposals_table(proposals_data, ens_names, limit=3):
     """Create a table showing the largest proposals by ETH value"""
     if not proposals_data:
         return pd.DataFrame()
     
-    proposals = proposals_data.get('proposals', [])
+    proposal_index = get_proposal_index(proposals_data)
     
-    if not proposals:
+    if not len(proposal_index):
         return pd.DataFrame()
     
-    # Sort proposals by ETH value (largest first) and take the top N
-    largest_proposals = sorted(proposals, key=lambda x: x['total_value_eth'], reverse=True)[:limit]
-    
-    # Format the data for display
-    table_data = []
-    for proposal in largest_proposals:
-        operator_address = proposal['operator']
-        ens_name = ens_names.get(operator_address, "")
-        
-        # Format operator display
-        if ens_name:
-            operator_display = f"{ens_name} ({operator_address[:8]}...{operator_address[-6:]})"
-        else:
-            operator_display = f"{operator_address[:8]}...{operator_address[-6:]}"
-        
-        # Get MEV relay information
-        relay_tag = proposal.get('relay_tag', '')
-        mev_relay = format_relay_name(relay_tag)
-        
-        table_data.append({
-            'Date': proposal['date'],
-            'Operator': operator_display,
-            'Operator Address': operator_address,
-            'Validator Pubkey': proposal['validator_pubkey'],
-            'ETH Value': f"{proposal['total_value_eth']:.4f}",
-            'Execution Rewards': f"{proposal.get('execution_fees_eth', 0):.4f}",
-            'Consensus Rewards': f"{proposal.get('consensus_reward_eth', 0):.4f}",
-            'MEV Rewards': f"{proposal.get('mev_breakdown_eth', 0):.4f}",
-            'MEV Relay': mev_relay,
-            'Slot': proposal['slot'],
-            'Gas Used': f"{proposal['gas_used']:,}",
-            'Gas Utilization': f"{proposal['gas_utilization']:.1f}%",
-            'TX Count': proposal['tx_count']
-        })
-    
-    return pd.DataFrame(table_data)
+    return _proposal_rows(proposal_index.largest(limit), ens_names)
 
+@recorded_frames
 def create_latest_proposals_table(proposals_data, ens_names, limit=5):
     """Create a table showing the latest proposals across all operators"""
     if not proposals_data:
         return pd.DataFrame()
     
-    proposals = proposals_data.get('proposals', [])
+    proposal_index = get_proposal_index(proposals_data)
     
-    if not proposals:
+    if not len(proposal_index):
         return pd.DataFrame()
     
-    # Sort proposals by date (latest first) and take the top N
-    latest_proposals = sorted(proposals, key=lambda x: x['date'], reverse=True)[:limit]
-    
-    # Format the data for display
-    table_data = []
-    for proposal in latest_proposals:
-        operator_address = proposal['operator']
-        ens_name = ens_names.get(operator_address, "")
-        
-        # Format operator display
-        if ens_name:
-            operator_display = f"{ens_name} ({operator_address[:8]}...{operator_address[-6:]})"
-        else:
-            operator_display = f"{operator_address[:8]}...{operator_address[-6:]}"
-        
-        # Get MEV relay information
-        relay_tag = proposal.get('relay_tag', '')
-        mev_relay = format_relay_name(relay_tag)
-        
-        table_data.append({
-            'Date': proposal['date'],
-            'Operator': operator_display,
-            'Operator Address': operator_address,
-            'Validator Pubkey': proposal['validator_pubkey'],
-            'ETH Value': f"{proposal['total_value_eth']:.4f}",
-            'Execution Rewards': f"{proposal.get('execution_fees_eth', 0):.4f}",
-            'Consensus Rewards': f"{proposal.get('consensus_reward_eth', 0):.4f}",
-            'MEV Rewards': f"{proposal.get('mev_breakdown_eth', 0):.4f}",
-            'MEV Relay': mev_relay,
-            'Slot': proposal['slot'],
-            'Gas Used': f"{proposal['gas_used']:,}",
-            'Gas Utilization': f"{proposal['gas_utilization']:.1f}%",
-            'TX Count': proposal['tx_count']
-        })
-    
-    return pd.DataFrame(table_data)
+    return _proposal_rows(proposal_index.latest(limit), ens_names)
 
+@recorded_frames
 def create_mev_relay_breakdown_table(proposals_data):
     """Create a table showing MEV relay usage breakdown"""
     if not proposals_data:
         return pd.DataFrame()
     
-    proposals = proposals_data.get('proposals', [])
+    proposal_index = get_proposal_index(proposals_data)
     
-    if not proposals:
+    if not len(proposal_index):
         return pd.DataFrame()
     
-    # Count relay usage
+    # Count relay usage (several tags can share a display name)
     relay_counts = Counter()
-    for proposal in proposals:
-        relay_tag = proposal.get('relay_tag', '')
-        if not relay_tag:
-            relay_counts['Locally Built'] += 1
-        else:
-            relay_counts[format_relay_name(relay_tag)] += 1
+    for relay_tag, count in proposal_index.relay_counts().items():
+        relay_counts[format_relay_name(relay_tag)] += int(count)
     
     # Convert to table data
-    total_proposals = len(proposals)
+    total_proposals = len(proposal_index)
     table_data = []
     
     for relay_name, count in relay_counts.most_common():
@@ -209,11 +224,12 @@ def create_mev_relay_breakdown_table(proposals_data):
         table_data.append({
             'MEV Relay': relay_name,
             'Proposals': count,
-            'Percentage': f"{percentage:.1f}%"
+            'Percentage': percentage
         })
     
     return pd.DataFrame(table_data)
 
+@recorded_frames
 def create_missed_proposals_table(missed_proposals_data, cache_data, proposals_data, ens_names):
     """Create a table showing missed proposals with operator statistics"""
     if not missed_proposals_data or not cache_data:
@@ -250,13 +266,10 @@ def create_missed_proposals_table(missed_proposals_data, cache_data, proposals_d
         if missed['date'] > operator_details[operator]['last_missed']:
             operator_details[operator]['last_missed'] = missed['date']
     
-    # Count successful proposals by operator from proposals_data
-    operator_successful_counts = Counter()
-    if proposals_data and 'proposals' in proposals_data:
-        for proposal in proposals_data['proposals']:
-            operator = proposal.get('operator')
-            if operator:
-                operator_successful_counts[operator] += 1
+    # Count successful proposals by operator from the proposal index
+    operator_successful_counts = {}
+    if proposals_data:
+        operator_successful_counts = get_proposal_index(proposals_data).operators['proposal_count'].to_dict()
     
     # Create table data
     table_data = []
@@ -277,10 +290,7 @@ def create_missed_proposals_table(missed_proposals_data, cache_data, proposals_d
         
         # Calculate missed percentage
         total_attempts = total_missed + total_successful
-        if total_attempts > 0:
-            missed_percentage = f"{(total_missed / total_attempts * 100):.1f}%"
-        else:
-            missed_percentage = "N/A"
+        missed_percentage = (total_missed / total_attempts * 100) if total_attempts > 0 else np.nan
         
         table_data.append({
             'Date & Time': missed['date'],
@@ -308,48 +318,53 @@ def create_missed_proposals_table(missed_proposals_data, cache_data, proposals_d
     return pd.DataFrame(table_data), summary_stats
 
 def create_proposals_operators_table(proposals_data, ens_names):
-    """Create summary table of proposals by operator"""
+    """Create summary table of proposals by operator (history from get_operator_proposal_history)"""
     if not proposals_data:
         return []
     
     operator_summary = proposals_data.get('operator_summary', {})
-    proposals = proposals_data.get('proposals', [])
+    operator_stats = get_proposal_index(proposals_data).operators.to_dict('index')
     
     table_data = []
     for addr, summary in operator_summary.items():
-        operator_proposals = [p for p in proposals if p['operator'] == addr]
+        stats = operator_stats.get(addr)
+        if stats is None:
+            continue
         
-        if operator_proposals:
-            dates = [p['date'] for p in operator_proposals]
-            gas_used = sum(p['gas_used'] for p in operator_proposals)
-            avg_gas_util = sum(p['gas_utilization'] for p in operator_proposals) / len(operator_proposals)
-            avg_txs = sum(p['tx_count'] for p in operator_proposals) / len(operator_proposals)
-            highest_value = max(p['total_value_eth'] for p in operator_proposals)
-            
-            # Update proposals to include formatted relay names
-            formatted_proposals = []
-            for p in operator_proposals:
-                formatted_p = p.copy()
-                formatted_p['mev_relay'] = format_relay_name(p.get('relay_tag', ''))
-                formatted_proposals.append(formatted_p)
-            
-            table_data.append({
-                'operator': addr,
-                'ens_name': ens_names.get(addr, ''),
-                'proposal_count': summary['proposal_count'],
-                'total_value_eth': summary['total_value_eth'],
-                'average_value_eth': summary['average_value_eth'],
-                'highest_value_eth': highest_value,
-                'total_gas_used': gas_used,
-                'avg_gas_utilization': avg_gas_util,
-                'avg_tx_count': avg_txs,
-                'first_proposal': min(dates),
-                'last_proposal': max(dates),
-                'proposals': formatted_proposals
-            })
+        table_data.append({
+            'operator': addr,
+            'ens_name': ens_names.get(addr, ''),
+            'proposal_count': summary['proposal_count'],
+            'total_value_eth': summary['total_value_eth'],
+            'average_value_eth': summary['average_value_eth'],
+            'highest_value_eth': float(stats['highest_value_eth']),
+            'total_gas_used': int(stats['total_gas_used']),
+            'avg_gas_utilization': float(stats['avg_gas_utilization']),
+            'avg_tx_count': float(stats['avg_tx_count']),
+            'first_proposal': stats['first_proposal'],
+            'last_proposal': stats['last_proposal'],
+            'proposals_found': int(stats['proposal_count'])
+        })
     
     return sorted(table_data, key=lambda x: x['proposal_count'], reverse=True)
 
+def get_operator_proposal_history(proposals_data, operator):
+    """One operator's proposals, latest first, with the formatted MEV relay"""
+    history = get_proposal_index(proposals_data).operator_proposals(operator).copy()
+    history['mev_relay'] = history['relay_tag'].map(format_relay_name)
+    return history
+
+def create_operator_proposals_export(proposals_data, operator):
+    """Every field of one operator's proposals, with the formatted MEV relay, for downloads"""
+    proposals = proposals_data.get('proposals', [])
+    records = []
+    for position in get_proposal_index(proposals_data).source_positions(operator):
+        record = proposals[position].copy()
+        record['mev_relay'] = format_relay_name(record.get('relay_tag', ''))
+        records.append(record)
+    return pd.DataFrame(records)
+
+@recorded_frames
 def create_sync_committee_operators_table(sync_data, ens_names):
     """Create table of operators ranked by sync committee participation"""
     if not sync_data:
@@ -365,12 +380,11 @@ def create_sync_committee_operators_table(sync_data, ens_names):
             'Rank': 0,
             'Address': addr,
             'ENS / Discord Name': ens_name,
-            'Participation Rate': f"{stats['participation_rate']:.2f}%",
-            'Participation_Raw': stats['participation_rate'],
+            'Participation Rate': float(stats['participation_rate']),
             'Total Periods': stats['total_periods'],
-            'Total Slots': f"{stats['total_slots']:,}",
-            'Successful': f"{stats['total_successful']:,}",
-            'Missed': f"{stats['total_missed']:,}",
+            'Total Slots': stats['total_slots'],
+            'Successful': stats['total_successful'],
+            'Missed': stats['total_missed'],
         })
     
     if not data:
@@ -378,11 +392,12 @@ def create_sync_committee_operators_table(sync_data, ens_names):
     
     df = pd.DataFrame(data)
     # Sort by Total Periods (highest first), then by Participation Rate for ties
-    df = df.sort_values(['Total Periods', 'Participation_Raw'], ascending=[False, False]).reset_index(drop=True)
-    df['Rank'] = range(1, len(df) + 1)
+    df = df.sort_values(['Total Periods', 'Participation Rate'], ascending=[False, False]).reset_index(drop=True)
+    df['Rank'] = np.arange(1, len(df) + 1)
     
     return df
 
+@recorded_frames
 def create_sync_committee_periods_table(sync_data):
     """Create table showing participation by period"""
     if not sync_data:
@@ -395,11 +410,10 @@ def create_sync_committee_periods_table(sync_data):
         data.append({
             'Period': period,
             'Validators': stats['our_validators_count'],
-            'Total Slots': f"{stats['total_slots']:,}",
-            'Successful': f"{stats['total_successful']:,}",
-            'Missed': f"{stats['total_missed']:,}",
-            'Participation Rate': f"{stats['participation_rate']:.2f}%",
-            'Participation_Raw': stats['participation_rate']
+            'Total Slots': stats['total_slots'],
+            'Successful': stats['total_successful'],
+            'Missed': stats['total_missed'],
+            'Participation Rate': float(stats['participation_rate'])
         })
     
     if not data:
@@ -410,6 +424,7 @@ def create_sync_committee_periods_table(sync_data):
     
     return df
 
+@recorded_frames
 def create_sync_committee_detailed_table(sync_data, ens_names):
     """Create detailed table of individual validator sync committee performance"""
     if not sync_data:
@@ -437,12 +452,12 @@ def create_sync_committee_detailed_table(sync_data, ens_names):
             'Operator Address': entry['operator'],
             'Validator Index': entry['validator_index'],
             'Validator Pubkey': entry['validator_pubkey'],
-            'Participation Rate': f"{entry['participation_rate']:.2f}%",
-            'Total Slots': f"{entry['total_slots']:,}",
-            'Successful': f"{entry['successful_attestations']:,}",
-            'Missed': f"{entry['missed_attestations']:,}",
-            'Successful %': f"{successful_percentage:.2f}%",
-            'Missed %': f"{missed_percentage:.2f}%",
+            'Participation Rate': float(entry['participation_rate']),
+            'Total Slots': entry['total_slots'],
+            'Successful': entry['successful_attestations'],
+            'Missed': entry['missed_attestations'],
+            'Successful %': successful_percentage,
+            'Missed %': missed_percentage,
             'Start Epoch': entry['start_epoch'],
             'End Epoch': entry['end_epoch'],
             'Partial Period': "Yes" if entry.get('is_partial_period', False) else "No"
@@ -455,3 +470,73 @@ def create_sync_committee_detailed_table(sync_data, ens_names):
     df = df.sort_values(['Period', 'Participation Rate'], ascending=[False, False])
     
     return df
+
+@recorded_frames
+def create_exits_table(operators_with_exits, ens_names):
+    """Create table of operators with exits from the exit data, highest exit rate first"""
+    if not operators_with_exits:
+        return pd.DataFrame()
+    
+    now = datetime.now().timestamp()
+    data = []
+    for operator_data in operators_with_exits:
+        addr = operator_data.get('operator', '')
+        latest_timestamp = operator_data.get('latest_exit_timestamp', 0)
+        
+        data.append({
+            'Operator': format_operator_display_plain(addr, ens_names, show_full_address=True),
+            'Full Address': addr,
+            'Exits': operator_data.get('exits', 0),
+            'Still Active': operator_data.get('still_active', 0),
+            'Total Ever': operator_data.get('total_ever', 0),
+            'Exit Rate': float(operator_data.get('exit_rate', 0)),
+            'Latest Exit Date': operator_data.get('latest_exit_date', 'N/A'),
+            # Whole days since the latest exit, empty when it is unknown
+            'Days Since Exit': int((now - latest_timestamp) / (24 * 3600)) if latest_timestamp else None
+        })
+    
+    df = pd.DataFrame(data)
+    df['Days Since Exit'] = df['Days Since Exit'].astype('Int64')
+    return df.sort_values('Exit Rate', ascending=False)
+
+@recorded_frames
+def create_basic_exits_table(operator_validators, operator_exited, ens_names):
+    """Create table of operators with exits from the validator cache counts, highest exit rate first"""
+    addresses = [addr for addr, exit_count in operator_exited.items() if exit_count > 0]
+    if not addresses:
+        return pd.DataFrame()
+    
+    exited = np.array([operator_exited[addr] for addr in addresses], dtype='int64')
+    total = np.array([operator_validators.get(addr, 0) for addr in addresses], dtype='int64')
+    
+    df = pd.DataFrame({
+        'Operator': [format_operator_display_plain(addr, ens_names, show_full_address=True) for addr in addresses],
+        'Exits': exited,
+        'Still Active': total - exited,
+        'Total Ever': total,
+        'Exit Rate': _percent(exited, total),
+    })
+    return df.sort_values('Exit Rate', ascending=False)
+
+# Column config shared by both exit tables
+EXIT_COLUMNS = {
+    "Operator": st.column_config.TextColumn("Operator", width="large"),
+    "Exits": number_column("Exits"),
+    "Still Active": number_column("Still Active"),
+    "Total Ever": number_column("Total Ever"),
+    "Exit Rate": number_column("Exit Rate", PERCENT_1),
+    "Latest Exit Date": st.column_config.TextColumn("Latest Exit Date", width="medium"),
+    "Days Since Exit": number_column("Days Since Exit", "%d days ago", width="medium"),
+}
+
+def create_operator_transactions_table(operator_txs):
+    """One operator's transactions, latest first, with validator counts for successful ones only"""
+    tx_df = pd.DataFrame(operator_txs)
+    tx_df['datetime'] = pd.to_datetime(tx_df['date'] + ' ' + tx_df['time'])
+    tx_df = tx_df.sort_values('datetime', ascending=False)
+    
+    validator_count = tx_df['validator_count'] if 'validator_count' in tx_df else pd.Series(0, index=tx_df.index)
+    validator_count = pd.to_numeric(validator_count, errors='coerce').fillna(0).astype('int64')
+    tx_df['validator_count'] = validator_count.where(tx_df['status'] == 'Successful', 0)
+    
+    return tx_df
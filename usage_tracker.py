@@ -1,19 +1,179 @@
+import heapq
 import json
 import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional
 import streamlit as st
 from collections import defaultdict
+from config import (USAGE_STATS_FILE, USAGE_COMPACT_INTERVAL, USAGE_COMPACT_MAX_EVENTS, USAGE_ACTIVE_WINDOW,
+                    USAGE_SESSION_RETENTION_DAYS, USAGE_MAX_SESSIONS, USAGE_HLL_PRECISION,
+                    USAGE_SKETCH_DAILY_DAYS, USAGE_TOP_USER_AGENTS)
+from memory_report import register_cache
+from sketches import HyperLogLog, SpaceSaving
+
+try:
+    import fcntl
+except ImportError:  # Windows - only in-process locking is available
+    fcntl = None
+
+def _empty_stats() -> Dict[str, Any]:
+    """Simplified statistics structure"""
+    return {
+        'total_visits': 0,
+        'daily_visits': {},
+        'session_data': {},
+        'first_visit': None,
+        'last_visit': None,
+        'hourly_distribution': {str(i): 0 for i in range(24)},
+        'daily_distribution': {str(i): 0 for i in range(7)},  # 0=Monday, 6=Sunday
+        'monthly_visits': {}
+    }
+
+def _epoch(value) -> float:
+    """Session timestamps are epoch seconds; older snapshots stored ISO strings"""
+    return datetime.fromisoformat(value).timestamp() if isinstance(value, str) else value
+
+def _empty_sketches() -> Dict[str, Any]:
+    return {
+        'sessions_total': HyperLogLog(USAGE_HLL_PRECISION),
+        'sessions_daily': {},
+        'sessions_monthly': {},
+        'user_agents': SpaceSaving(USAGE_TOP_USER_AGENTS)
+    }
+
+def load_sketches(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Sketches from their JSON form (the 'sketches' key of a stats snapshot)"""
+    return {
+        'sessions_total': HyperLogLog.from_dict(data['sessions_total']),
+        'sessions_daily': {day: HyperLogLog.from_dict(hll) for day, hll in data['sessions_daily'].items()},
+        'sessions_monthly': {month: HyperLogLog.from_dict(hll) for month, hll in data['sessions_monthly'].items()},
+        'user_agents': SpaceSaving.from_dict(data['user_agents'])
+    }
+
+def dump_sketches(sketches: Dict[str, Any]) -> Dict[str, Any]:
+    """JSON form of the sketches"""
+    return {
+        'sessions_total': sketches['sessions_total'].to_dict(),
+        'sessions_daily': {day: hll.to_dict() for day, hll in sketches['sessions_daily'].items()},
+        'sessions_monthly': {month: hll.to_dict() for month, hll in sketches['sessions_monthly'].items()},
+        'user_agents': sketches['user_agents'].to_dict()
+    }
+
+def _sketches_from_stats(stats: Dict[str, Any]) -> Dict[str, Any]:
+    """Seed sketches from a snapshot written before sketches existed"""
+    sketches = _empty_sketches()
+    for session_id, session_data in stats['session_data'].items():
+        first_visit = datetime.fromtimestamp(session_data['first_visit'])
+        sketches['sessions_total'].add(session_id)
+        sketches['sessions_daily'].setdefault(first_visit.strftime('%Y-%m-%d'), HyperLogLog(USAGE_HLL_PRECISION)).add(session_id)
+        sketches['sessions_monthly'].setdefault(first_visit.strftime('%Y-%m'), HyperLogLog(USAGE_HLL_PRECISION)).add(session_id)
+    for user_agent, count in stats.get('user_agents', {}).items():
+        sketches['user_agents'].add(user_agent, count)
+    return sketches
+
+class SessionIndex:
+    """Sessions ordered by last activity for cheap active counts and incremental expiry.
+    
+    Wraps the session_data dict (session id -> first_visit / last_activity epoch
+    seconds). Heap entries go stale when a session is touched again or removed
+    and are skipped when they reach the top.
+    """
+    
+    def __init__(self, sessions: Dict[str, Dict[str, float]]):
+        self.sessions = sessions
+        self._rebuild()
+    
+    def _rebuild(self):
+        self._expiry = [(data['last_activity'], session_id) for session_id, data in self.sessions.items()]
+        heapq.heapify(self._expiry)
+        self._recent = list(self._expiry)
+        self._active = set(self.sessions)
+    
+    def __len__(self):
+        return len(self.sessions)
+    
+    def __contains__(self, session_id):
+        return session_id in self.sessions
+    
+    def _is_current(self, entry) -> bool:
+        session = self.sessions.get(entry[1])
+        return session is not None and session['last_activity'] == entry[0]
+    
+    def touch(self, session_id: str, timestamp: float):
+        """Record activity for a session, creating it if needed"""
+        session = self.sessions.get(session_id)
+        if session is None:
+            self.sessions[session_id] = {'first_visit': timestamp, 'last_activity': timestamp}
+        else:
+            session['last_activity'] = timestamp
+        heapq.heappush(self._expiry, (timestamp, session_id))
+        heapq.heappush(self._recent, (timestamp, session_id))
+        self._active.add(session_id)
+        
+        # Stale entries only leave the heaps when they reach the top; rebuild if they pile up
+        if len(self._expiry) > 2 * len(self.sessions) + 64:
+            self._rebuild()
+    
+    def count_active(self, since: float) -> int:
+        """Number of sessions with activity at or after since"""
+        while self._recent and self._recent[0][0] < since:
+            entry = heapq.heappop(self._recent)
+            if self._is_current(entry):
+                self._active.discard(entry[1])
+        return len(self._active)
+    
+    def evict(self, before: Optional[float] = None, max_sessions: Optional[int] = None):
+        """Remove sessions last active before a timestamp and the oldest beyond max_sessions"""
+        removed = []
+        while self._expiry:
+            entry = self._expiry[0]
+            if not self._is_current(entry):
+                heapq.heappop(self._expiry)
+                continue
+            expired = before is not None and entry[0] < before
+            over_limit = max_sessions is not None and len(self.sessions) > max_sessions
+            if not (expired or over_limit):
+                break
+            heapq.heappop(self._expiry)
+            del self.sessions[entry[1]]
+            self._active.discard(entry[1])
+            removed.append(entry[1])
+        return removed
 
 class UsageTracker:
-    """Tracks usage statistics for the dashboard and stores them in a JSON file"""
+    """Tracks usage statistics for the dashboard.
+    
+    Each change is appended as one compact event to a JSONL log shared by every
+    thread and process; each tracker applies the log to its in-memory stats in
+    order, so increments from all replicas are merged without lost updates. The
+    log is folded into the JSON snapshot (stats_file) on an interval or once it
+    holds enough events. Appends hold a shared advisory lock, compaction an
+    exclusive one.
+    """
     
-    def __init__(self, stats_file='usage_stats.json'):
+    def __init__(self, stats_file=USAGE_STATS_FILE, events_file=None,
+                 compact_interval=USAGE_COMPACT_INTERVAL, compact_max_events=USAGE_COMPACT_MAX_EVENTS):
         self.stats_file = stats_file
-        self.stats = self._load_stats()
+        self.events_file = events_file or os.path.splitext(stats_file)[0] + '_events.jsonl'
+        self.lock_file = f"{self.stats_file}.lock"
+        self._lock_file_failed = False
+        self.compact_interval = compact_interval
+        self.compact_max_events = compact_max_events
+        self._set_stats(self._load_stats())
+        self._lock = threading.RLock()
+        self._log_id = None
+        self._log_offset = 0
+        self._logged_events = 0
+        self._last_compaction = time.monotonic()
+        with self._lock, self._file_lock(exclusive=False):
+            self._sync()
         
     def _load_stats(self) -> Dict[str, Any]:
-        """Load existing statistics from JSON file"""
+        """Load the last compacted statistics snapshot"""
         try:
             if os.path.exists(self.stats_file):
                 with open(self.stats_file, 'r') as f:
@@ -21,38 +181,202 @@ class UsageTracker:
         except (json.JSONDecodeError, IOError):
             pass
         
-        # Return simplified structure
-        return {
-            'total_visits': 0,
-            'daily_visits': {},
-            'session_data': {},
-            'user_agents': {},
-            'first_visit': None,
-            'last_visit': None,
-            'hourly_distribution': {str(i): 0 for i in range(24)},
-            'daily_distribution': {str(i): 0 for i in range(7)},  # 0=Monday, 6=Sunday
-            'monthly_visits': {}
-        }
+        return _empty_stats()
+    
+    def _set_stats(self, stats: Dict[str, Any]):
+        """Install a stats dict and index its sessions"""
+        for session_data in stats['session_data'].values():
+            session_data['first_visit'] = _epoch(session_data['first_visit'])
+            session_data['last_activity'] = _epoch(session_data['last_activity'])
+        sketches = stats.pop('sketches', None)
+        self.sketches = load_sketches(sketches) if sketches else _sketches_from_stats(stats)
+        # Exact per-agent counts are replaced by the top-k summary
+        stats.pop('user_agents', None)
+        self.stats = stats
+        self.sessions = SessionIndex(stats['session_data'])
+    
+    @contextmanager
+    def _file_lock(self, exclusive: bool):
+        """Cross-process advisory lock: shared for appends, exclusive for compaction.
+
+        Falls back to in-process locking (self._lock) when the lock file cannot be opened.
+        """
+        if fcntl is None:
+            yield
+            return
+        try:
+            f = open(self.lock_file, 'a')
+        except OSError as e:
+            if not self._lock_file_failed:
+                print(f"Usage statistics lock {self.lock_file} unavailable, locking in-process only: {e}")
+                self._lock_file_failed = True
+            yield
+            return
+        with f:
+            fcntl.flock(f, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+    
+    def _sync(self):
+        """Apply events appended to the log since the last sync (locks held)"""
+        try:
+            f = open(self.events_file, 'rb')
+        except IOError:
+            return
+        
+        with f:
+            header = f.readline()
+            try:
+                log_id = json.loads(header).get('log_id')
+            except (ValueError, AttributeError):
+                log_id = None
+            
+            if log_id != self._log_id:
+                # A new log means a new snapshot that holds everything before it
+                self._set_stats(self._load_stats())
+                self._log_id = log_id
+                self._log_offset = len(header) if log_id is not None else 0
+                self._logged_events = 0
+                if log_id is not None and log_id == self.stats.get('compacted_log_id'):
+                    # Interrupted compaction: this log is already in the snapshot
+                    f.seek(0, os.SEEK_END)
+                    self._log_offset = f.tell()
+                    return
+            
+            f.seek(self._log_offset)
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break  # another process is mid-append; pick it up next time
+                self._log_offset += len(line)
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    continue
+                self._apply_event(event)
+                self._logged_events += 1
     
     def _save_stats(self):
-        """Save current statistics to JSON file"""
+        """Write the statistics snapshot atomically"""
+        temp_file = f"{self.stats_file}.{os.getpid()}.tmp"
+        try:
+            with open(temp_file, 'w') as f:
+                json.dump(dict(self.stats, sketches=dump_sketches(self.sketches)), f, indent=2, default=str)
+            os.replace(temp_file, self.stats_file)
+        except IOError as e:
+            st.error(f"Failed to save usage statistics: {e}")
+    
+    def _start_event_log(self):
+        """Replace the event log with an empty one under a new id"""
+        log_id = uuid.uuid4().hex
+        header = (json.dumps({'log_id': log_id}) + '\n').encode('utf-8')
+        temp_file = f"{self.events_file}.{os.getpid()}.tmp"
+        with open(temp_file, 'wb') as f:
+            f.write(header)
+        os.replace(temp_file, self.events_file)
+        self._log_id = log_id
+        self._log_offset = len(header)
+        self._logged_events = 0
+    
+    def _refresh(self):
+        """Pick up events other threads and processes have logged"""
+        try:
+            with self._file_lock(exclusive=False):
+                self._sync()
+        except IOError:
+            pass
+    
+    def compact(self):
+        """Fold the event log into the snapshot and start a new log"""
+        with self._lock, self._file_lock(exclusive=True):
+            self._sync()
+            self._compact_locked()
+    
+    def _compact_locked(self):
+        # Recording the log id makes a crash between the two writes safe: on the
+        # next load the old log is recognised as compacted and not replayed
+        self.stats['compacted_log_id'] = self._log_id
+        self._save_stats()
         try:
-            with open(self.stats_file, 'w') as f:
-                json.dump(self.stats, f, indent=2, default=str)
+            self._start_event_log()
         except IOError as e:
             st.error(f"Failed to save usage statistics: {e}")
+        self._last_compaction = time.monotonic()
+    
+    def _record(self, event: Dict[str, Any]):
+        """Append an event to the shared log and apply everything logged since the last sync"""
+        line = (json.dumps(event, separators=(',', ':'), default=str) + '\n').encode('utf-8')
+        with self._lock:
+            if self._log_id is None:
+                self.compact()
+            try:
+                with self._file_lock(exclusive=False):
+                    # One O_APPEND write per event, so concurrent appends never interleave
+                    with open(self.events_file, 'ab') as f:
+                        f.write(line)
+                    self._sync()
+            except IOError as e:
+                st.error(f"Failed to save usage statistics: {e}")
+                # Still counted by this process, as before the shared log existed
+                self._apply_event(json.loads(line))
+            
+            if (self._logged_events >= self.compact_max_events
+                    or time.monotonic() - self._last_compaction >= self.compact_interval):
+                self.compact()
+    
+    def _apply_event(self, event: Dict[str, Any]):
+        """Update the in-memory statistics for one event"""
+        if event['type'] == 'visit':
+            self._apply_visit(event)
+        elif event['type'] == 'data_operation':
+            self._apply_data_operation(event)
     
     def track_visit(self, user_agent: Optional[str] = None):
         """Track a user visit (session start only)"""
-        now = datetime.now()
+        self._record({
+            'type': 'visit',
+            'session': self._get_session_id(),
+            'at': datetime.now().isoformat(),
+            'user_agent': user_agent
+        })
+    
+    def track_data_operation(self, operation_name: str, success: bool = True, error_msg: Optional[str] = None,
+                             timestamp: Optional[str] = None):
+        """Track the outcome of a data loading operation"""
+        self._record({
+            'type': 'data_operation',
+            'name': operation_name,
+            'success': success,
+            'error': error_msg,
+            'at': timestamp
+        })
+    
+    def _apply_data_operation(self, event: Dict[str, Any]):
+        operations = self.stats.setdefault('data_operations', {})
+        operation = operations.setdefault(event['name'], {
+            'success_count': 0,
+            'error_count': 0,
+            'last_success': None,
+            'last_error': None
+        })
+        if event['success']:
+            operation['success_count'] += 1
+            operation['last_success'] = event.get('at') or 'unknown'
+        else:
+            operation['error_count'] += 1
+            operation['last_error'] = event.get('error') or 'Unknown error'
+    
+    def _apply_visit(self, event: Dict[str, Any]):
+        now = datetime.fromisoformat(event['at'])
         today = now.strftime('%Y-%m-%d')
         hour = str(now.hour)
         day_of_week = str(now.weekday())
         month = now.strftime('%Y-%m')
+        user_agent = event.get('user_agent')
         
-        # Get or create session
-        session_id = self._get_session_id()
-        is_new_session = session_id not in self.stats['session_data']
+        session_id = event['session']
+        is_new_session = session_id not in self.sessions
         
         # Only count as visit if it's a NEW session
         if is_new_session:
@@ -77,26 +401,31 @@ class UsageTracker:
             
             # Track user agent
             if user_agent:
-                if user_agent not in self.stats['user_agents']:
-                    self.stats['user_agents'][user_agent] = 0
-                self.stats['user_agents'][user_agent] += 1
+                self.sketches['user_agents'].add(user_agent)
             
             # Update first/last visit timestamps
             if self.stats['first_visit'] is None:
                 self.stats['first_visit'] = now.isoformat()
             self.stats['last_visit'] = now.isoformat()
-            
-            # Create simplified session data
-            self.stats['session_data'][session_id] = {
-                'first_visit': now.isoformat(),
-                'last_activity': now.isoformat()
-            }
-        else:
-            # Existing session - just update activity
-            self.stats['session_data'][session_id]['last_activity'] = now.isoformat()
         
-        self._save_stats()
+        self._count_unique_session(session_id, today, month)
+        self.sessions.touch(session_id, int(now.timestamp()))
+        # Expiry follows event time, so every replica replaying the log drops the same sessions
+        self.sessions.evict(before=now.timestamp() - USAGE_SESSION_RETENTION_DAYS * 86400,
+                            max_sessions=USAGE_MAX_SESSIONS)
     
+    def _count_unique_session(self, session_id: str, today: str, month: str):
+        sketches = self.sketches
+        sketches['sessions_total'].add(session_id)
+        sketches['sessions_monthly'].setdefault(month, HyperLogLog(USAGE_HLL_PRECISION)).add(session_id)
+        
+        daily = sketches['sessions_daily']
+        if today not in daily:
+            daily[today] = HyperLogLog(USAGE_HLL_PRECISION)
+            # ISO dates sort chronologically; drop days past retention
+            for day in sorted(daily)[:-USAGE_SKETCH_DAILY_DAYS]:
+                del daily[day]
+        daily[today].add(session_id)
     
     def _get_session_id(self) -> str:
         """Generate or retrieve session ID"""
@@ -110,114 +439,111 @@ class UsageTracker:
         now = datetime.now()
         today = now.strftime('%Y-%m-%d')
         yesterday = (now - timedelta(days=1)).strftime('%Y-%m-%d')
+        month = now.strftime('%Y-%m')
         
-        # Calculate active sessions (last activity within 30 minutes)
-        active_sessions = 0
-        for session_data in self.stats['session_data'].values():
-            last_activity = datetime.fromisoformat(session_data['last_activity'])
-            if (now - last_activity).total_seconds() < 1800:  # 30 minutes
-                active_sessions += 1
-        
-        return {
-            'total_visits': self.stats['total_visits'],
-            'visits_today': self.stats['daily_visits'].get(today, 0),
-            'visits_yesterday': self.stats['daily_visits'].get(yesterday, 0),
-            'total_sessions': len(self.stats['session_data']),
-            'active_sessions': active_sessions,
-            'peak_hour': max(self.stats['hourly_distribution'].items(), key=lambda x: x[1])[0] if any(self.stats['hourly_distribution'].values()) else 'none',
-            'first_visit': self.stats['first_visit'],
-            'last_visit': self.stats['last_visit']
-        }
+        with self._lock:
+            self._refresh()
+            # Active sessions: last activity within the active window (30 minutes)
+            active_sessions = self.sessions.count_active(time.time() - USAGE_ACTIVE_WINDOW)
+            
+            return {
+                'total_visits': self.stats['total_visits'],
+                'visits_today': self.stats['daily_visits'].get(today, 0),
+                'visits_yesterday': self.stats['daily_visits'].get(yesterday, 0),
+                'total_sessions': len(self.sessions),
+                'active_sessions': active_sessions,
+                # HyperLogLog estimates, independent of session retention
+                'unique_sessions_today': self._unique_sessions('sessions_daily', today),
+                'unique_sessions_month': self._unique_sessions('sessions_monthly', month),
+                'unique_sessions_total': self.sketches['sessions_total'].count(),
+                'peak_hour': max(self.stats['hourly_distribution'].items(), key=lambda x: x[1])[0] if any(self.stats['hourly_distribution'].values()) else 'none',
+                'first_visit': self.stats['first_visit'],
+                'last_visit': self.stats['last_visit']
+            }
+    
+    def _unique_sessions(self, period: str, key: str) -> int:
+        hll = self.sketches[period].get(key)
+        return hll.count() if hll is not None else 0
     
     def get_detailed_stats(self) -> Dict[str, Any]:
         """Get simplified detailed statistics for the admin page"""
-        return {
-            'summary': self.get_stats_summary(),
-            'daily_visits': self.stats['daily_visits'],
-            'hourly_distribution': self.stats['hourly_distribution'],
-            'daily_distribution': self.stats['daily_distribution'],
-            'monthly_visits': self.stats['monthly_visits'],
-            'user_agents': self.stats['user_agents'],
-            'session_count': len(self.stats['session_data'])
-        }
+        with self._lock:
+            # Copies, so callers never see another session's update half-applied
+            return {
+                'summary': self.get_stats_summary(),
+                'daily_visits': dict(self.stats['daily_visits']),
+                'hourly_distribution': dict(self.stats['hourly_distribution']),
+                'daily_distribution': dict(self.stats['daily_distribution']),
+                'monthly_visits': dict(self.stats['monthly_visits']),
+                'user_agents': dict(self.sketches['user_agents'].top()),
+                'session_count': len(self.stats['session_data'])
+            }
     
     def cleanup_old_sessions(self, days_old: int = 30):
         """Remove session data older than specified days"""
-        cutoff_date = datetime.now() - timedelta(days=days_old)
-        
-        sessions_to_remove = []
-        for session_id, session_data in self.stats['session_data'].items():
-            last_activity = datetime.fromisoformat(session_data['last_activity'])
-            if last_activity < cutoff_date:
-                sessions_to_remove.append(session_id)
-        
-        for session_id in sessions_to_remove:
-            del self.stats['session_data'][session_id]
-        
-        if sessions_to_remove:
-            self._save_stats()
+        with self._lock, self._file_lock(exclusive=True):
+            self._sync()
+            sessions_to_remove = self.sessions.evict(before=time.time() - days_old * 86400)
+            
+            if sessions_to_remove:
+                self._compact_locked()
         
         return len(sessions_to_remove)
     
     def reset_visit_counts(self):
         """Reset visit counts to match actual sessions (for fixing inflated counts)"""
-        # Reset visit counters to match actual unique sessions
-        total_sessions = len(self.stats['session_data'])
-        
-        # Reset total visits to session count
-        self.stats['total_visits'] = total_sessions
-        
-        # Recalculate daily visits based on sessions
-        daily_sessions = {}
-        monthly_sessions = {}
-        hourly_sessions = {}
-        daily_dist_sessions = {}
-        
-        for session_data in self.stats['session_data'].values():
-            first_visit = datetime.fromisoformat(session_data['first_visit'])
-            date_str = first_visit.strftime('%Y-%m-%d')
-            month_str = first_visit.strftime('%Y-%m')
-            hour_str = str(first_visit.hour)
-            day_of_week_str = str(first_visit.weekday())
-            
-            daily_sessions[date_str] = daily_sessions.get(date_str, 0) + 1
-            monthly_sessions[month_str] = monthly_sessions.get(month_str, 0) + 1
-            hourly_sessions[hour_str] = hourly_sessions.get(hour_str, 0) + 1
-            daily_dist_sessions[day_of_week_str] = daily_dist_sessions.get(day_of_week_str, 0) + 1
-        
-        # Update stats with corrected values
-        self.stats['daily_visits'] = daily_sessions
-        self.stats['monthly_visits'] = monthly_sessions
-        
-        # Reset hourly distribution
-        for hour in range(24):
-            hour_str = str(hour)
-            self.stats['hourly_distribution'][hour_str] = hourly_sessions.get(hour_str, 0)
-        
-        # Reset daily distribution
-        for day in range(7):
-            day_str = str(day)
-            self.stats['daily_distribution'][day_str] = daily_dist_sessions.get(day_str, 0)
-        
-        self._save_stats()
+        with self._lock, self._file_lock(exclusive=True):
+            self._sync()
+            # Reset visit counters to match actual unique sessions
+            total_sessions = len(self.stats['session_data'])
+            
+            # Reset total visits to session count
+            self.stats['total_visits'] = total_sessions
+            
+            # Recalculate daily visits based on sessions
+            daily_sessions = {}
+            monthly_sessions = {}
+            hourly_sessions = {}
+            daily_dist_sessions = {}
+            
+            for session_data in self.stats['session_data'].values():
+                first_visit = datetime.fromtimestamp(session_data['first_visit'])
+                date_str = first_visit.strftime('%Y-%m-%d')
+                month_str = first_visit.strftime('%Y-%m')
+                hour_str = str(first_visit.hour)
+                day_of_week_str = str(first_visit.weekday())
+            
+                daily_sessions[date_str] = daily_sessions.get(date_str, 0) + 1
+                monthly_sessions[month_str] = monthly_sessions.get(month_str, 0) + 1
+                hourly_sessions[hour_str] = hourly_sessions.get(hour_str, 0) + 1
+                daily_dist_sessions[day_of_week_str] = daily_dist_sessions.get(day_of_week_str, 0) + 1
+            
+            # Update stats with corrected values
+            self.stats['daily_visits'] = daily_sessions
+            self.stats['monthly_visits'] = monthly_sessions
+            
+            # Reset hourly distribution
+            for hour in range(24):
+                hour_str = str(hour)
+                self.stats['hourly_distribution'][hour_str] = hourly_sessions.get(hour_str, 0)
+            
+            # Reset daily distribution
+            for day in range(7):
+                day_str = str(day)
+                self.stats['daily_distribution'][day_str] = daily_dist_sessions.get(day_str, 0)
+            
+            self._compact_locked()
+
         return total_sessions
     
     def reset_all_data(self):
         """Completely reset all usage tracking data"""
-        # Reset to simplified structure
-        self.stats = {
-            'total_visits': 0,
-            'daily_visits': {},
-            'session_data': {},
-            'user_agents': {},
-            'first_visit': None,
-            'last_visit': None,
-            'hourly_distribution': {str(i): 0 for i in range(24)},
-            'daily_distribution': {str(i): 0 for i in range(7)},
-            'monthly_visits': {}
-        }
-        self._save_stats()
+        with self._lock, self._file_lock(exclusive=True):
+            # Reset to simplified structure
+            self._set_stats(_empty_stats())
+            self._compact_locked()
         return True
 
 # Global instance
-usage_tracker = UsageTracker()
\ No newline at end of file
+usage_tracker = UsageTracker()
+register_cache('usage_stats', lambda: (usage_tracker.stats, usage_tracker.sketches))
\ No newline at end of file
@@ -254,43 +254,13 @@ def inject_usage_tracking_js():
 def track_data_loading_operation(operation_name: str, success: bool = True, error_msg: str = None):
     """Track data loading operations throughout the dashboard"""
     try:
-        from usage_tracker import usage_tracker
+        from metrics import DATA_OPERATIONS
+        DATA_OPERATIONS.inc(operation=operation_name, result='success' if success else 'error')
         
-        if success:
-            # Track successful data operations
-            if 'data_operations' not in usage_tracker.stats:
-                usage_tracker.stats['data_operations'] = {}
-            
-            if operation_name not in usage_tracker.stats['data_operations']:
-                usage_tracker.stats['data_operations'][operation_name] = {
-                    'success_count': 0,
-                    'error_count': 0,
-                    'last_success': None,
-                    'last_error': None
-                }
-            
-            usage_tracker.stats['data_operations'][operation_name]['success_count'] += 1
-            usage_tracker.stats['data_operations'][operation_name]['last_success'] = st.session_state.get('current_time', 'unknown')
-            
-        else:
-            # Track errors
-            usage_tracker.track_error(f"data_loading_{operation_name}")
-            
-            if 'data_operations' not in usage_tracker.stats:
-                usage_tracker.stats['data_operations'] = {}
-            
-            if operation_name not in usage_tracker.stats['data_operations']:
-                usage_tracker.stats['data_operations'][operation_name] = {
-                    'success_count': 0,
-                    'error_count': 0,
-                    'last_success': None,
-                    'last_error': None
-                }
-            
-            usage_tracker.stats['data_operations'][operation_name]['error_count'] += 1
-            usage_tracker.stats['data_operations'][operation_name]['last_error'] = error_msg or 'Unknown error'
+        from usage_tracker import usage_tracker
         
-        usage_tracker._save_stats()
+        usage_tracker.track_data_operation(operation_name, success=success, error_msg=error_msg,
+                                           timestamp=st.session_state.get('current_time', 'unknown'))
         
     except Exception as e:
         # Don't let tracking errors break the dashboard
@@ -1,4 +1,11 @@
+import re
 import psutil
+import streamlit as st
+
+def streamlit_version_at_least(major, minor):
+    """Whether the installed Streamlit is at least major.minor (pre-release suffixes are ignored)"""
+    parts = [int(re.match(r'\d*', part).group() or 0) for part in st.__version__.split('.')[:2]]
+    return tuple(parts) >= (major, minor)
 
 def get_memory_usage():
     """Get current memory usage statistics"""
@@ -15,9 +22,10 @@ def get_memory_usage():
     
     return memory_mb, memory_percentage
 
-def is_memory_high():
-    """Check if memory usage is approaching limits"""
+def is_memory_high(freed_mb=0):
+    """Check if memory usage is approaching limits, discounting freed_mb the allocator has not returned yet"""
     memory_mb, memory_percentage = get_memory_usage()
+    memory_percentage -= freed_mb / 1024 * 100
     return memory_percentage > 75  # Alert at 75% of 1GB limit
 
 def should_clear_cache():